@@ -0,0 +1,402 @@
+from datetime import timedelta
+
+import numpy as np
+
+from .Calendar import bin_edges
+from .Period import TimePeriod, InvalidPeriodException, INFINITY_BEGIN, INFINITY_END, to_epoch, to_microseconds
+from .PeriodSet import TimePeriodSet, _tzinfo_of_periods
+
+
+DATETIME_DTYPE = 'datetime64[us]'
+
+
+def _bounds_to_datetime64(periods):
+    """ Convert the bounds of an iterable of TimePeriod into two datetime64 arrays, without building any datetime """
+    periods = list(periods)
+    begins = np.array([period._begin_epoch for period in periods], dtype=np.int64)
+    ends = np.array([period._end_epoch for period in periods], dtype=np.int64)
+    return begins.view(DATETIME_DTYPE), ends.view(DATETIME_DTYPE)
+
+
+def _tzinfo_of_operand(other):
+    """ The time zone of the periods of a TimePeriod, TimePeriodSet, TimePeriodSetView or ArrayTimePeriodSet """
+    if isinstance(other, (TimePeriod, ArrayTimePeriodSet)):
+        return other._tzinfo
+    return _tzinfo_of_periods(other)
+
+
+def _coalesce(begins, ends):
+    """ Merge overlapping or adjacent periods given by two datetime64 arrays sorted by beginning
+
+    :return: Two datetime64 arrays, beginnings and ends of sorted and disjoint periods
+    """
+    if not len(begins):
+        return begins, ends
+    # A period starts a new group if it begins after every previous period has ended
+    running_ends = np.maximum.accumulate(ends)
+    group_starts = np.empty(len(begins), dtype=bool)
+    group_starts[0] = True
+    group_starts[1:] = begins[1:] > running_ends[:-1]
+    group_lasts = np.empty(len(begins), dtype=bool)
+    group_lasts[:-1] = group_starts[1:]
+    group_lasts[-1] = True
+    return begins[group_starts], running_ends[group_lasts]
+
+
+def _sweep(begins, ends, other_begins, other_ends, keep):
+    """ Combine two sets of sorted and disjoint periods in a single vectorized sweep over their boundaries
+
+    :param keep: A vectorized function telling, from boolean arrays marking whether each date is inside the first and
+                 inside the second set, if it should be part of the result. It must be False when the date is inside
+                 neither of them.
+    :return: Two datetime64 arrays, beginnings and ends of the resulting sorted and disjoint periods
+    """
+    count, other_count = len(begins), len(other_begins)
+    dates = np.concatenate((begins, ends, other_begins, other_ends))
+    deltas = np.zeros(len(dates), dtype=np.int8)
+    other_deltas = np.zeros(len(dates), dtype=np.int8)
+    deltas[:count], deltas[count:2 * count] = 1, -1
+    other_deltas[2 * count:2 * count + other_count], other_deltas[2 * count + other_count:] = 1, -1
+
+    order = np.argsort(dates, kind='stable')
+    dates = dates[order]
+    inside = np.cumsum(deltas[order]) > 0
+    other_inside = np.cumsum(other_deltas[order]) > 0
+
+    # Only the state after the last boundary of each date matters
+    lasts = np.empty(len(dates), dtype=bool)
+    lasts[:-1] = dates[1:] != dates[:-1]
+    lasts[-1:] = True
+    dates = dates[lasts]
+    kept = keep(inside[lasts], other_inside[lasts])
+
+    previously_kept = np.empty(len(kept), dtype=bool)
+    previously_kept[:1] = False
+    previously_kept[1:] = kept[:-1]
+    return dates[kept & ~previously_kept], dates[~kept & previously_kept]
+
+
+def _in_first_only(inside, other_inside):
+    return inside & ~other_inside
+
+
+def _in_exactly_one(inside, other_inside):
+    return inside ^ other_inside
+
+
+class ArrayTimePeriodSet(object):
+    """ A set of TimePeriod stored as two contiguous datetime64 arrays, with vectorized set operations
+
+    It behaves as a TimePeriodSet, and can be used in its place when handling a large number of periods. Like a
+    TimePeriodSet, the periods it exposes are aware, in the time zone of its first period, if it was built from aware
+    periods.
+
+    :param periods: One or more TimePeriod, or iterables of TimePeriod
+    """
+
+    def __init__(self, *periods):
+        flat_periods = []
+        for period_or_iter in periods:
+            if hasattr(period_or_iter, '__iter__'):
+                flat_periods.extend(period_or_iter)
+            else:
+                flat_periods.append(period_or_iter)
+        # The time zone in which the periods are exposed, or None for naive periods
+        self._tzinfo = _tzinfo_of_periods(flat_periods)
+        self._load(*_bounds_to_datetime64(flat_periods))
+
+    @classmethod
+    def from_arrays(cls, begins, ends, assume_sorted=False):
+        """ Build an ArrayTimePeriodSet from the beginnings and ends of possibly overlapping periods
+
+        :param begins: An array-like of datetime64 or datetime.datetime
+        :param ends: An array-like of the same length as begins, each end taking place AFTER its beginning
+        :param assume_sorted: If True, periods are expected to be already sorted by beginning
+        :rtype: ArrayTimePeriodSet
+        """
+        begins = np.asarray(begins, dtype=DATETIME_DTYPE)
+        ends = np.asarray(ends, dtype=DATETIME_DTYPE)
+        invalid = np.flatnonzero(begins >= ends)
+        if len(invalid):
+            raise InvalidPeriodException(begins[invalid[0]].item(), ends[invalid[0]].item())
+        new = cls()
+        new._load(begins, ends, assume_sorted=assume_sorted)
+        return new
+
+    @classmethod
+    def from_periods(cls, periods, assume_sorted=False):
+        """ Build an ArrayTimePeriodSet from an iterable of TimePeriod
+
+        :param periods: An iterable of TimePeriod, possibly overlapping
+        :param assume_sorted: If True, periods are expected to be already sorted by beginning
+        :rtype: ArrayTimePeriodSet
+        """
+        periods = list(periods)
+        new = cls()
+        new._tzinfo = _tzinfo_of_periods(periods)
+        new._load(*_bounds_to_datetime64(periods), assume_sorted=assume_sorted)
+        return new
+
+    @classmethod
+    def from_period_set(cls, period_set):
+        """ Convert a TimePeriodSet into an ArrayTimePeriodSet
+
+        :rtype: ArrayTimePeriodSet
+        """
+        new = cls()
+        new._tzinfo = _tzinfo_of_periods(period_set)
+        new._set_arrays(*_bounds_to_datetime64(period_set))
+        return new
+
+    def to_period_set(self):
+        """ Convert this set into a TimePeriodSet
+
+        :rtype: TimePeriodSet
+        """
+        return TimePeriodSet._from_bounds(
+            self._begins.view(np.int64).tolist(), self._ends.view(np.int64).tolist(), self._tzinfo)
+
+    def _load(self, begins, ends, assume_sorted=False):
+        """ Replace the content of this set by the given periods, sorting them once and merging them """
+        if not assume_sorted:
+            order = np.argsort(begins, kind='stable')
+            begins, ends = begins[order], ends[order]
+        self._set_arrays(*_coalesce(begins, ends))
+
+    def _set_arrays(self, begins, ends):
+        """ Replace the content of this set by the beginnings and ends of sorted and disjoint periods """
+        self._begins = begins
+        self._ends = ends
+
+    @property
+    def begins(self):
+        """ The beginnings of all contained periods, as a read-only datetime64 array """
+        begins = self._begins.view()
+        begins.flags.writeable = False
+        return begins
+
+    @property
+    def ends(self):
+        """ The ends of all contained periods, as a read-only datetime64 array """
+        ends = self._ends.view()
+        ends.flags.writeable = False
+        return ends
+
+    @property
+    def periods(self):
+        """ All TimePeriod contained in this ArrayTimePeriodSet """
+        return list(self)
+
+    @property
+    def total_duration(self):
+        """ The cumulated duration of all contained periods, as a datetime.timedelta """
+        return (self._ends - self._begins).sum().item()
+
+    def __copy__(self):
+        new = self.__class__()
+        new._tzinfo = self._tzinfo
+        new._set_arrays(self._begins.copy(), self._ends.copy())
+        return new
+
+    copy = __copy__
+
+    def _other_arrays(self, other):
+        """ Beginnings and ends of the sorted and disjoint periods of other
+
+        :param other: A TimePeriod, TimePeriodSet or ArrayTimePeriodSet
+        """
+        if isinstance(other, ArrayTimePeriodSet):
+            return other._begins, other._ends
+        if isinstance(other, TimePeriodSet):
+            return _bounds_to_datetime64(other)
+        return _bounds_to_datetime64([other])
+
+    def _tzinfo_with(self, other):
+        """ The time zone of the result of an operation with other: the one of this set, or else the one of other """
+        return self._tzinfo if self._tzinfo is not None else _tzinfo_of_operand(other)
+
+    def __ior__(self, other):
+        """ Union of self and other
+
+        :param other: A TimePeriod, TimePeriodSet or ArrayTimePeriodSet
+        :rtype: ArrayTimePeriodSet
+        """
+        other_begins, other_ends = self._other_arrays(other)
+        self._tzinfo = self._tzinfo_with(other)
+        self._load(np.concatenate((self._begins, other_begins)), np.concatenate((self._ends, other_ends)))
+        return self
+
+    __iadd__ = __ior__
+
+    def __iand__(self, other):
+        """ Intersection of self and other
+
+        :param other: A TimePeriod, TimePeriodSet or ArrayTimePeriodSet
+        :rtype: ArrayTimePeriodSet
+        """
+        self._tzinfo = self._tzinfo_with(other)
+        self._set_arrays(*_sweep(self._begins, self._ends, *self._other_arrays(other), keep=np.logical_and))
+        return self
+
+    def __isub__(self, other):
+        """ Difference of self and other
+
+        :param other: A TimePeriod, TimePeriodSet or ArrayTimePeriodSet
+        :rtype: ArrayTimePeriodSet
+        """
+        self._tzinfo = self._tzinfo_with(other)
+        self._set_arrays(*_sweep(self._begins, self._ends, *self._other_arrays(other), keep=_in_first_only))
+        return self
+
+    def __ixor__(self, other):
+        """ Symmetric difference of self and other
+
+        :param other: A TimePeriod, TimePeriodSet or ArrayTimePeriodSet
+        :rtype: ArrayTimePeriodSet
+        """
+        self._tzinfo = self._tzinfo_with(other)
+        self._set_arrays(*_sweep(self._begins, self._ends, *self._other_arrays(other), keep=_in_exactly_one))
+        return self
+
+    def __or__(self, other):
+        new = self.copy()
+        new |= other
+        return new
+
+    __add__ = __or__
+
+    def __and__(self, other):
+        new = self.__class__()
+        new._tzinfo = self._tzinfo_with(other)
+        new._set_arrays(*_sweep(self._begins, self._ends, *self._other_arrays(other), keep=np.logical_and))
+        return new
+
+    def __sub__(self, other):
+        new = self.__class__()
+        new._tzinfo = self._tzinfo_with(other)
+        new._set_arrays(*_sweep(self._begins, self._ends, *self._other_arrays(other), keep=_in_first_only))
+        return new
+
+    def __xor__(self, other):
+        new = self.__class__()
+        new._tzinfo = self._tzinfo_with(other)
+        new._set_arrays(*_sweep(self._begins, self._ends, *self._other_arrays(other), keep=_in_exactly_one))
+        return new
+
+    # TimePeriodSet only handles its own operands, so that operations with an ArrayTimePeriodSet on their right side
+    # fall back to the following reflected operators, computed with numpy
+
+    def __ror__(self, other):
+        return self | other
+
+    __radd__ = __ror__
+
+    def __rand__(self, other):
+        return self & other
+
+    def __rsub__(self, other):
+        new = self.__class__()
+        tzinfo = _tzinfo_of_operand(other)
+        new._tzinfo = tzinfo if tzinfo is not None else self._tzinfo
+        new._set_arrays(*_sweep(*self._other_arrays(other) + (self._begins, self._ends), keep=_in_first_only))
+        return new
+
+    def __rxor__(self, other):
+        return self ^ other
+
+    def complement(self, within=None):
+        """ All the time not covered by this set
+
+        :param within: The TimePeriod to which the complement is restricted. If None, the complement ranges from
+                       INFINITY_BEGIN to INFINITY_END
+        :rtype: ArrayTimePeriodSet
+        """
+        if within is None:
+            within = TimePeriod(INFINITY_BEGIN, INFINITY_END)
+        new = self.__class__()
+        new._tzinfo = self._tzinfo
+        within_begins, within_ends = self._other_arrays(within)
+        new._set_arrays(*_sweep(within_begins, within_ends, self._begins, self._ends, keep=_in_first_only))
+        return new
+
+    def coverage_histogram(self, begin, end, step, ratio=False):
+        """ How much of each bin between two dates is covered by this set, see `TimePeriodSet.coverage_histogram`
+
+        The coverage of all bins is computed at once, from the cumulated duration of the periods preceding each edge.
+
+        :return: A timedelta64 array, or a float array of values between 0 and 1 if ratio is True
+        """
+        within = TimePeriod(begin, end)
+        if isinstance(step, timedelta):
+            edges = np.arange(within._begin_epoch, within._end_epoch, to_microseconds(step), dtype=np.int64)
+            edges = np.append(edges, within._end_epoch)
+        else:
+            edges = np.array(bin_edges(within.begin, within.end, step), dtype=np.int64)
+        begins, ends = self._begins.view(np.int64), self._ends.view(np.int64)
+        cumulated = np.zeros(len(begins) + 1, dtype=np.int64)
+        np.cumsum(ends - begins, out=cumulated[1:])
+        # The time covered before each edge: the periods ending before it, and the part of the one containing it
+        idx = np.searchsorted(ends, edges, side='right')
+        covered = cumulated[idx]
+        partial = idx < len(begins)
+        covered[partial] += np.maximum(edges[partial] - begins[idx[partial]], 0)
+        covered = np.diff(covered)
+        if ratio:
+            return covered / np.diff(edges).astype(float)
+        return covered.astype('timedelta64[us]')
+
+    def contains_many(self, dates):
+        """ Test for each of many dates if it is contained in this set
+
+        :param dates: An array-like of datetime64 or datetime.datetime, sorted or not
+        :return: A boolean array, in the same order as dates
+        """
+        dates = np.asarray(dates, dtype=DATETIME_DTYPE)
+        idx = np.searchsorted(self._ends, dates, side='left')
+        mask = idx < len(self._ends)
+        mask[mask] = self._begins[idx[mask]] <= dates[mask]
+        return mask
+
+    def __contains__(self, item):
+        """ Test if a TimePeriod or datetime.datetime is contained in this set """
+        if isinstance(item, TimePeriod):
+            begin, end = item._begin_epoch, item._end_epoch
+        else:
+            begin = end = to_epoch(item)
+        ends = self._ends.view(np.int64)
+        idx = np.searchsorted(ends, begin, side='left')
+        return bool(idx < len(ends) and self._begins.view(np.int64)[idx] <= end)
+
+    def __len__(self):
+        """ Return how many distinct TimePeriod are contained in this set """
+        return len(self._begins)
+
+    def __getitem__(self, item):
+        """ Return the period at index `item`, or an ArrayTimePeriodSet if `item` is a slice """
+        if isinstance(item, slice):
+            new = self.__class__()
+            new._tzinfo = self._tzinfo
+            new._set_arrays(self._begins[item], self._ends[item])
+            return new
+        return TimePeriod._from_epoch(
+            int(self._begins.view(np.int64)[item]), int(self._ends.view(np.int64)[item]), self._tzinfo)
+
+    def __iter__(self):
+        for begin, end in zip(self._begins.view(np.int64).tolist(), self._ends.view(np.int64).tolist()):
+            yield TimePeriod._from_epoch(begin, end, self._tzinfo)
+
+    def __eq__(self, other):
+        """ Checks if each of two sets' TimePeriods are identical """
+        other_begins, other_ends = self._other_arrays(other)
+        return np.array_equal(self._begins, other_begins) and np.array_equal(self._ends, other_ends)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __nonzero__(self):
+        return bool(len(self._begins))
+
+    __bool__ = __nonzero__
+
+    def __repr__(self):
+        return u"<ArrayTimePeriodSet(%s)>" % u", ".join(u"[%s, %s]" % (p.begin, p.end) for p in self)
@@ -0,0 +1,92 @@
+import multiprocessing
+from collections import deque
+from itertools import islice
+
+from .Period import TimePeriod
+from .PeriodSet import TimePeriodSet
+
+
+# How many chunks are queued per worker process, so that workers never wait for the next one
+CHUNKS_PER_WORKER = 2
+
+
+def _as_period_set(first):
+    """ The first operand of a pair, as a TimePeriodSet if it is a single TimePeriod """
+    return TimePeriodSet(first) if isinstance(first, TimePeriod) else first
+
+
+def _intersect(pair):
+    first, second = pair
+    return _as_period_set(first) & second
+
+
+def _union(pair):
+    first, second = pair
+    return _as_period_set(first) | second
+
+
+def _apply_to_chunk(operation, chunk):
+    return [operation(pair) for pair in chunk]
+
+
+def _map_pairs(operation, pairs, workers, chunksize):
+    """ Lazily apply an operation to each pair, in a pool of processes, yielding the results in input order
+
+    Pairs are read from their iterable only when a chunk is sent to a worker, and at most CHUNKS_PER_WORKER chunks per
+    worker are in flight, so that neither the pairs nor the results waiting to be consumed pile up in memory.
+    """
+    if workers is not None and workers <= 1:
+        for pair in pairs:
+            yield operation(pair)
+        return
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    pairs = iter(pairs)
+    # TimePeriodSet are pickled as packed bounds, so that sending them to the workers is cheap
+    pool = multiprocessing.Pool(workers)
+    try:
+        pending = deque()
+        while True:
+            while len(pending) < workers * CHUNKS_PER_WORKER:
+                chunk = list(islice(pairs, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.apply_async(_apply_to_chunk, (operation, chunk)))
+            if not pending:
+                break
+            for result in pending.popleft().get():
+                yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def intersect_pairs(pairs, workers=None, chunksize=64):
+    """ Compute the intersection of each pair of TimePeriodSet, in parallel
+
+    Results are yielded as soon as they are available, in the same order as pairs, so that they do not need to be all
+    held in memory.
+
+    :param pairs: An iterable of (TimePeriodSet or TimePeriod, TimePeriodSet or TimePeriod) pairs
+    :param workers: The number of worker processes. If None, as many as CPUs. If 0 or 1, pairs are computed in the
+                    current process.
+    :param chunksize: How many pairs are sent to a worker at once
+    :return: An iterator of TimePeriodSet
+    """
+    return _map_pairs(_intersect, pairs, workers, chunksize)
+
+
+def union_pairs(pairs, workers=None, chunksize=64):
+    """ Compute the union of each pair of TimePeriodSet, in parallel
+
+    Results are yielded as soon as they are available, in the same order as pairs, so that they do not need to be all
+    held in memory.
+
+    :param pairs: An iterable of (TimePeriodSet or TimePeriod, TimePeriodSet or TimePeriod) pairs
+    :param workers: The number of worker processes. If None, as many as CPUs. If 0 or 1, pairs are computed in the
+                    current process.
+    :param chunksize: How many pairs are sent to a worker at once
+    :return: An iterator of TimePeriodSet
+    """
+    return _map_pairs(_union, pairs, workers, chunksize)
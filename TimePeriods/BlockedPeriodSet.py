@@ -0,0 +1,211 @@
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+from .PeriodSet import TimePeriodSet
+
+
+class BlockedList(object):
+    """ A list split into blocks of bounded size, so that inserting or removing items anywhere only shifts one block
+
+    It supports the operations TimePeriodSet needs from its storage: len, iteration, indexing, slicing, slice
+    assignment, and binary search when its items are sorted. The lengths of the blocks are indexed in a Fenwick tree,
+    so that locating an item costs O(log n), and modifying a few of them O(load + log n), amortized since blocks are
+    seldom split or merged.
+
+    :param iterable: The initial items
+    """
+
+    # The usual size of a block. Blocks are split when twice longer, and merged with a neighbour when twice shorter.
+    load = 1024
+
+    def __init__(self, iterable=()):
+        items = list(iterable)
+        self._blocks = [items[idx:idx + self.load] for idx in range(0, len(items), self.load)]
+        self._len = len(items)
+        self._reindex()
+
+    def _reindex(self):
+        """ Rebuild the index of the blocks, after some of them were split, merged or removed """
+        self._lasts = [block[-1] for block in self._blocks]
+        tree = [0] + [len(block) for block in self._blocks]
+        for node in range(1, len(tree)):
+            parent = node + (node & -node)
+            if parent < len(tree):
+                tree[parent] += tree[node]
+        self._tree = tree
+        # The highest power of two not greater than the number of blocks, from which to descend the tree
+        self._tree_step = 1
+        while self._tree_step * 2 < len(tree):
+            self._tree_step *= 2
+
+    def _resized(self, block_idx, change):
+        """ Update the index of the blocks, after the given one gained change items """
+        tree, node = self._tree, block_idx + 1
+        while node < len(tree):
+            tree[node] += change
+            node += node & -node
+        self._lasts[block_idx] = self._blocks[block_idx][-1]
+
+    def _offset(self, block_idx):
+        """ The position of the first item of a block """
+        offset, node = 0, block_idx
+        while node:
+            offset += self._tree[node]
+            node -= node & -node
+        return offset
+
+    def _locate(self, idx):
+        """ The index of the block holding the item at position idx, and its position in this block
+
+        A position equal to the length of the list is located at the end of the last block.
+        """
+        tree, block_idx, step = self._tree, 0, self._tree_step
+        count = len(tree) - 1
+        while step:
+            node = block_idx + step
+            if node <= count and tree[node] <= idx:
+                block_idx = node
+                idx -= tree[node]
+            step >>= 1
+        if block_idx == count:
+            block_idx -= 1
+            idx = len(self._blocks[block_idx])
+        return block_idx, idx
+
+    def _normalized_index(self, idx):
+        if idx < 0:
+            idx += self._len
+        if not 0 <= idx < self._len:
+            raise IndexError(u"BlockedList index out of range")
+        return idx
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self._len)
+            if step != 1:
+                return list(self)[item]
+            return self._slice(start, stop)
+        block_idx, position = self._locate(self._normalized_index(item))
+        return self._blocks[block_idx][position]
+
+    def _slice(self, start, stop):
+        if start >= stop:
+            return []
+        block_idx, position = self._locate(start)
+        items = []
+        count = stop - start
+        while len(items) < count:
+            block = self._blocks[block_idx]
+            items.extend(block[position:position + count - len(items)])
+            block_idx, position = block_idx + 1, 0
+        return items
+
+    def __setitem__(self, item, values):
+        if not isinstance(item, slice):
+            block_idx, position = self._locate(self._normalized_index(item))
+            self._blocks[block_idx][position] = values
+            self._lasts[block_idx] = self._blocks[block_idx][-1]
+            return
+        start, stop, step = item.indices(self._len)
+        if step != 1:
+            raise ValueError(u"BlockedList does not support extended slice assignment")
+        stop = max(start, stop)
+        values = list(values)
+        if not self._blocks:
+            if values:
+                self._blocks.append(values)
+                self._len = len(values)
+                self._reindex()
+            return
+        change = len(values) - (stop - start)
+        self._len += change
+        block_idx, position = self._locate(start)
+        block = self._blocks[block_idx]
+        if position + stop - start <= len(block):
+            stop_block_idx, stop_position = block_idx, position + stop - start
+        else:
+            stop_block_idx, stop_position = self._locate(stop)
+        if stop_block_idx == block_idx:
+            block[position:stop_position] = values
+            if block and len(block) <= 2 * self.load and (len(block) >= self.load // 2 or len(self._blocks) == 1):
+                # The usual case, where no block needs to be split nor merged
+                self._resized(block_idx, change)
+                return
+        else:
+            # Join the head of the first block, the new values and the tail of the last block into the first one
+            block[position:] = values
+            block.extend(self._blocks[stop_block_idx][stop_position:])
+            del self._blocks[block_idx + 1:stop_block_idx + 1]
+        self._rebalance(block_idx)
+        self._reindex()
+
+    def __delitem__(self, item):
+        if not isinstance(item, slice):
+            idx = self._normalized_index(item)
+            item = slice(idx, idx + 1)
+        self[item] = []
+
+    def _rebalance(self, block_idx):
+        """ Split the given block if it is too long, or merge it with a neighbour if it is too short """
+        block = self._blocks[block_idx]
+        if len(block) > 2 * self.load:
+            self._blocks[block_idx:block_idx + 1] = [
+                block[idx:idx + self.load] for idx in range(0, len(block), self.load)
+            ]
+        elif len(block) < self.load // 2:
+            if not block:
+                del self._blocks[block_idx]
+            elif block_idx + 1 < len(self._blocks):
+                block.extend(self._blocks.pop(block_idx + 1))
+                self._rebalance(block_idx)
+            elif block_idx:
+                self._blocks[block_idx - 1].extend(self._blocks.pop(block_idx))
+                self._rebalance(block_idx - 1)
+
+    def bisect_left(self, value, lo=0, hi=None):
+        """ Like bisect.bisect_left, for a BlockedList whose items are sorted """
+        hi = self._len if hi is None else hi
+        block_idx = bisect_left(self._lasts, value)
+        if block_idx == len(self._blocks):
+            idx = self._len
+        else:
+            idx = self._offset(block_idx) + bisect_left(self._blocks[block_idx], value)
+        return min(max(idx, lo), max(lo, hi))
+
+    def bisect_right(self, value, lo=0, hi=None):
+        """ Like bisect.bisect_right, for a BlockedList whose items are sorted """
+        hi = self._len if hi is None else hi
+        block_idx = bisect_right(self._lasts, value)
+        if block_idx == len(self._blocks):
+            idx = self._len
+        else:
+            idx = self._offset(block_idx) + bisect_right(self._blocks[block_idx], value)
+        return min(max(idx, lo), max(lo, hi))
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(item == other_item for item, other_item in zip(self, other))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return u"BlockedList(%r)" % list(self)
+
+
+class BlockedTimePeriodSet(TimePeriodSet):
+    """ A TimePeriodSet stored in blocked lists rather than plain lists
+
+    Adding or removing a period only shifts the periods of one block, instead of all the following ones, so that the
+    cost of `add`, `discard` or `update` does not grow with the size of the set. Shifting a plain list is done in C
+    though, so that a TimePeriodSet remains faster until sets of about ten million periods. Iteration, indexing and
+    operators are the same as for a TimePeriodSet.
+
+    :param periods: One or more TimePeriod
+    """
+    _storage = BlockedList
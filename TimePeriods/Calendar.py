@@ -0,0 +1,93 @@
+from calendar import monthrange
+from datetime import timedelta
+
+from .Period import EPOCH, to_epoch, to_microseconds
+
+
+DAILY = 'daily'
+WEEKLY = 'weekly'
+MONTHLY = 'monthly'
+
+
+def add_months(date, months):
+    """ Shift a datetime.datetime by a number of months, clamping its day to the length of the resulting month """
+    month_idx = date.month - 1 + months
+    year, month = date.year + month_idx // 12, month_idx % 12 + 1
+    return date.replace(year=year, month=month, day=min(date.day, monthrange(year, month)[1]))
+
+
+def floor_date(date, unit):
+    """ The latest calendar boundary not later than a datetime.datetime
+
+    :param unit: DAILY for its midnight, WEEKLY for the midnight of the Monday of its week, or MONTHLY for the midnight
+                 of the first day of its month
+    """
+    midnight = date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if unit == DAILY:
+        return midnight
+    if unit == WEEKLY:
+        return midnight - timedelta(days=midnight.weekday())
+    if unit == MONTHLY:
+        return midnight.replace(day=1)
+    raise ValueError(u"Unknown calendar unit %s" % unit)
+
+
+def iter_boundaries(begin, end, every, origin=EPOCH):
+    """ Yield the boundaries splitting the time between two dates into steps, both dates excluded
+
+    Boundaries are generated lazily, so that long steps sequences are never materialized.
+
+    :param begin: A datetime.datetime
+    :param end: A datetime.datetime
+    :param every: Either a positive datetime.timedelta, for boundaries every such step from origin, or DAILY, WEEKLY or
+                  MONTHLY, for boundaries at the beginning of each calendar day, week (on Monday) or month
+    :param origin: The datetime.datetime from which fixed steps are counted. With the default EPOCH, steps dividing
+                   a day fall on midnight.
+    :return: An iterator of counts of microseconds since EPOCH, sorted
+    """
+    if isinstance(every, timedelta):
+        step = to_microseconds(every)
+        if step <= 0:
+            raise ValueError(u"The step between two boundaries must be positive")
+        origin_epoch = to_epoch(origin)
+        first_boundary = origin_epoch + ((to_epoch(begin) - origin_epoch) // step + 1) * step
+        return _fixed_boundaries(first_boundary, to_epoch(end), step)
+    return _calendar_boundaries(floor_date(begin, every), to_epoch(end), every)
+
+
+def _fixed_boundaries(boundary, end_epoch, step):
+    """ Yield the boundaries every step from a first one, until end_epoch (excluded) """
+    while boundary < end_epoch:
+        yield boundary
+        boundary += step
+
+
+def _calendar_boundaries(boundary, end_epoch, every):
+    """ Yield the calendar boundaries following a first one, until end_epoch (excluded) """
+    try:
+        while True:
+            if every == MONTHLY:
+                boundary = add_months(boundary, 1)
+            else:
+                boundary += timedelta(days=1 if every == DAILY else 7)
+            boundary_epoch = to_epoch(boundary)
+            if boundary_epoch >= end_epoch:
+                return
+            yield boundary_epoch
+    except (OverflowError, ValueError):
+        # No boundary can exist after the latest representable date
+        return
+
+
+def bin_edges(begin, end, every):
+    """ The edges of consecutive bins covering the time between two dates, see `iter_boundaries`
+
+    Fixed steps are counted from begin, so that only the last bin may be shorter. Calendar bins are aligned on the
+    calendar, so that the first and last ones may be partial.
+
+    :return: A list of counts of microseconds since EPOCH, beginning with begin and ending with end
+    """
+    edges = [to_epoch(begin)]
+    edges.extend(iter_boundaries(begin, end, every, origin=begin))
+    edges.append(to_epoch(end))
+    return edges
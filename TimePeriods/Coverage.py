@@ -0,0 +1,89 @@
+from bisect import bisect_right
+
+from .Period import TimePeriod, to_epoch
+from .PeriodSet import TimePeriodSet
+
+
+class CoverageProfile(object):
+    """ The coverage depth of many possibly overlapping TimePeriod, ie how many of them cover each date
+
+    Unlike a TimePeriodSet, it keeps track of how many periods overlap. The depth is computed in a single sweep over
+    the sorted boundaries of all periods, as a step function: each period covers the dates from its beginning
+    (included) to its end (excluded).
+
+    :param periods: One or more TimePeriod, TimePeriodSet or iterables of TimePeriod
+    """
+
+    def __init__(self, *periods):
+        begins, ends = [], []
+        # The time zone of the first period, in which the steps are exposed
+        self._tzinfo = None
+        for period_or_iter in periods:
+            if hasattr(period_or_iter, '__iter__'):
+                for period in period_or_iter:
+                    begins.append(period._begin_epoch)
+                    ends.append(period._end_epoch)
+                    if self._tzinfo is None:
+                        self._tzinfo = period._tzinfo
+            else:
+                begins.append(period_or_iter._begin_epoch)
+                ends.append(period_or_iter._end_epoch)
+                if self._tzinfo is None:
+                    self._tzinfo = period_or_iter._tzinfo
+        begins.sort()
+        ends.sort()
+
+        # The depth is self._depths[idx] from self._dates[idx] (included) to self._dates[idx + 1] (excluded)
+        self._dates, self._depths = [], []
+        depth = 0
+        begin_idx, end_idx = 0, 0
+        count = len(begins)
+        while end_idx < count:
+            date = begins[begin_idx] if begin_idx < count and begins[begin_idx] < ends[end_idx] else ends[end_idx]
+            previous_depth = depth
+            while begin_idx < count and begins[begin_idx] == date:
+                depth += 1
+                begin_idx += 1
+            while end_idx < count and ends[end_idx] == date:
+                depth -= 1
+                end_idx += 1
+            if depth != previous_depth:
+                self._dates.append(date)
+                self._depths.append(depth)
+        self._max_depth = max(self._depths) if self._depths else 0
+
+    def depth_at(self, date):
+        """ How many periods cover a datetime.datetime """
+        idx = bisect_right(self._dates, to_epoch(date)) - 1
+        return self._depths[idx] if idx >= 0 else 0
+
+    def max_depth(self):
+        """ The maximum number of periods covering a same date, ie the peak concurrency """
+        return self._max_depth
+
+    def steps(self):
+        """ Yield each step of the coverage depth, as (TimePeriod, depth) pairs, skipping uncovered steps """
+        for idx, depth in enumerate(self._depths):
+            if depth:
+                yield TimePeriod._from_epoch(self._dates[idx], self._dates[idx + 1], self._tzinfo), depth
+
+    def at_least(self, depth):
+        """ All the dates covered by at least `depth` periods
+
+        :param depth: A strictly positive number of periods
+        :rtype: TimePeriodSet
+        """
+        if depth < 1:
+            raise ValueError(u"The coverage depth must be at least 1, not %s" % depth)
+        periods = []
+        begin = None
+        for date, step_depth in zip(self._dates, self._depths):
+            if step_depth >= depth and begin is None:
+                begin = date
+            elif step_depth < depth and begin is not None:
+                periods.append(TimePeriod._from_epoch(begin, date, self._tzinfo))
+                begin = None
+        return TimePeriodSet.from_periods(periods, assume_sorted=True)
+
+    def __repr__(self):
+        return u"<CoverageProfile(%s)>" % u", ".join(u"[%s, %s]: %s" % (p.begin, p.end, d) for p, d in self.steps())
@@ -0,0 +1,181 @@
+import hashlib
+from collections import OrderedDict, namedtuple
+
+from .Period import TimePeriod
+from .PeriodSet import TimePeriodSet, TimePeriodSetView
+
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'evictions', 'maxsize', 'currsize'))
+
+
+class OperationCache(object):
+    """ A bounded cache of the results of operations between FrozenTimePeriodSet, evicting the least recently used
+
+    :param maxsize: The maximum number of results kept
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError(u"The size of an operation cache must be at least 1, not %s" % maxsize)
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, compute):
+        """ The result cached for key, or the result of compute() which is cached if it is not NotImplemented """
+        try:
+            result = self._results.pop(key)
+        except KeyError:
+            self.misses += 1
+            result = compute()
+            if result is NotImplemented:
+                return result
+            if len(self._results) >= self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+        # The most recently used results are the last ones
+        self._results[key] = result
+        return result
+
+    def cache_info(self):
+        """ The hits, misses and evictions of this cache since it was created or cleared, and its sizes
+
+        :rtype: CacheInfo
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._results))
+
+    def clear(self):
+        """ Forget all cached results, and reset the statistics """
+        self._results.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return u"<OperationCache(hits=%s, misses=%s, evictions=%s, maxsize=%s, currsize=%s)>" % self.cache_info()
+
+
+class FrozenTimePeriodSet(TimePeriodSet):
+    """ An immutable and hashable TimePeriodSet, which can key a dict or be part of a set
+
+    Like a frozenset, operators always return a new set, and in-place operators rebind the variable to it. The results
+    of `|`, `&` and `-` between two FrozenTimePeriodSet can be memoized, see `enable_cache`.
+
+    :param periods: One or more TimePeriod
+    """
+
+    # The OperationCache memoizing operations between frozen sets, or None if they are not memoized
+    cache = None
+
+    @classmethod
+    def enable_cache(cls, maxsize=1024):
+        """ Memoize the results of `|`, `&` and `-` between frozen sets, keeping the maxsize most recently used ones
+
+        :rtype: OperationCache
+        """
+        cls.cache = OperationCache(maxsize)
+        return cls.cache
+
+    @classmethod
+    def disable_cache(cls):
+        """ Stop memoizing operations between frozen sets, forgetting the cached results """
+        cls.cache = None
+
+    def _invalidate_metrics(self):
+        super(FrozenTimePeriodSet, self)._invalidate_metrics()
+        self._fingerprint = None
+        self._hash = None
+
+    @property
+    def periods(self):
+        """ All TimePeriod contained in this set, as a tuple, since frozen sets and cached results are shared """
+        return tuple(self._periods)
+
+    @property
+    def fingerprint(self):
+        """ A digest of the bounds of all periods, identifying this set across processes, computed once """
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha1(self._packed_bounds()).hexdigest()
+        return self._fingerprint
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self.fingerprint)
+        return self._hash
+
+    def __eq__(self, other):
+        """ Checks if each of two TimePeriodSets' TimePeriods are identical """
+        if isinstance(other, FrozenTimePeriodSet):
+            if self._hash is not None and other._hash is not None and self._hash != other._hash:
+                return False
+            return self._begins == other._begins and self._ends == other._ends
+        return super(FrozenTimePeriodSet, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __copy__(self):
+        """ A frozen set being immutable, it is its own copy """
+        return self
+
+    copy = __copy__
+
+    def _memoized(self, operator, other, compute):
+        """ The result of compute(), memoized if other is a frozen set and the cache is enabled """
+        cache = self.cache
+        if cache is None or not isinstance(other, FrozenTimePeriodSet):
+            return compute()
+        return cache.get((operator, self.__class__, self.fingerprint, other.fingerprint), compute)
+
+    def __or__(self, other):
+        """ Union between one or many TimePeriods
+
+        :param other: a TimePeriodSet, TimePeriodSetView or TimePeriod
+        :rtype: FrozenTimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        return self._memoized('|', other, lambda: self.union_all(self, other))
+
+    __add__ = __or__
+
+    def __and__(self, other):
+        """ Intersection between one or many TimePeriods
+
+        :param other: a TimePeriodSet, TimePeriodSetView or TimePeriod
+        :rtype: FrozenTimePeriodSet
+        """
+        return self._memoized('&', other, lambda: super(FrozenTimePeriodSet, self).__and__(other))
+
+    def __sub__(self, other):
+        """ Difference between one or many TimePeriods
+
+        :param other: a TimePeriodSet, TimePeriodSetView or TimePeriod
+        :rtype: FrozenTimePeriodSet
+        """
+        return self._memoized('-', other, lambda: super(FrozenTimePeriodSet, self).__sub__(other))
+
+    def __ior__(self, other):
+        return self | other
+
+    __iadd__ = __ior__
+
+    def __iand__(self, other):
+        return self & other
+
+    def __isub__(self, other):
+        return self - other
+
+    def __ixor__(self, other):
+        return self ^ other
+
+    def _read_only(self, *args):
+        raise TypeError(u"A FrozenTimePeriodSet cannot be modified")
+
+    add = update = discard = _read_only
+
+    def __repr__(self):
+        return u"<FrozenTimePeriodSet(%s)>" % u", ".join(u"[%s, %s]" % (p.begin, p.end) for p in self)
@@ -0,0 +1,83 @@
+from bisect import bisect_right
+from itertools import accumulate, chain, islice
+
+
+class GapIndex(object):
+    """ An index of the lengths of the gaps between sorted and disjoint periods, updated in place when they change
+
+    The lengths are split into blocks of bounded size, each one with its longest gap. Finding the first gap long enough
+    for a given duration only scans the longest gaps of the blocks, then one block, and replacing a few gaps only
+    rewrites the blocks holding them, so that the index never needs to be built again once the periods change.
+
+    :param begins: The beginnings of the periods, in microseconds since EPOCH
+    :param ends: The ends of the periods, in microseconds since EPOCH
+    """
+
+    # The usual number of gaps in a block. Blocks are split when twice longer, and merged with the next one when twice
+    # shorter.
+    load = 512
+
+    def __init__(self, begins, ends):
+        # The gap idx is the time between the periods idx and idx + 1
+        self._set_lengths([begin - end for begin, end in zip(begins[1:], ends[:-1])])
+
+    def _set_lengths(self, lengths):
+        """ Replace all the gaps of this index """
+        self._blocks = [lengths[idx:idx + self.load] for idx in range(0, len(lengths), self.load)]
+        self._maxima = [max(block) for block in self._blocks]
+        # The index of the first gap of each block, followed by the number of gaps
+        self._offsets = list(accumulate(chain((0,), map(len, self._blocks))))
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def copy(self):
+        """ A copy of this index, which can be updated independently """
+        new = self.__class__.__new__(self.__class__)
+        new._blocks = [list(block) for block in self._blocks]
+        new._maxima = list(self._maxima)
+        new._offsets = list(self._offsets)
+        return new
+
+    def _block_at(self, idx):
+        """ The index of the block holding the gap idx, the last block if idx is the number of gaps """
+        return min(bisect_right(self._offsets, idx), len(self._blocks)) - 1
+
+    def splice(self, start, stop, lengths):
+        """ Replace the gaps between start (included) and stop (excluded) by gaps of the given lengths """
+        if not self._blocks:
+            self._set_lengths(list(lengths))
+            return
+        first_block, last_block = self._block_at(start), self._block_at(stop)
+        merged = self._blocks[first_block][:start - self._offsets[first_block]]
+        merged.extend(lengths)
+        merged.extend(self._blocks[last_block][stop - self._offsets[last_block]:])
+        if len(merged) < self.load // 2 and last_block + 1 < len(self._blocks):
+            last_block += 1
+            merged.extend(self._blocks[last_block])
+        if len(merged) > 2 * self.load:
+            blocks = [merged[idx:idx + self.load] for idx in range(0, len(merged), self.load)]
+        else:
+            blocks = [merged] if merged else []
+        self._blocks[first_block:last_block + 1] = blocks
+        self._maxima[first_block:last_block + 1] = [max(block) for block in blocks]
+        self._offsets[first_block:] = accumulate(
+            chain((self._offsets[first_block],), map(len, self._blocks[first_block:])))
+
+    def first_at_least(self, length, first_idx=0):
+        """ The index of the first gap from first_idx lasting at least length, or None if there is none """
+        if first_idx >= len(self):
+            return None
+        long_enough = length.__le__
+        block_idx = self._block_at(first_idx)
+        block, position = self._blocks[block_idx], first_idx - self._offsets[block_idx]
+        found = next(filter(long_enough, islice(block, position, None)), None)
+        if found is not None:
+            return self._offsets[block_idx] + block.index(found, position)
+        # The first block after it holding a gap long enough, and its first such gap
+        found = next(filter(long_enough, islice(self._maxima, block_idx + 1, None)), None)
+        if found is None:
+            return None
+        block_idx = self._maxima.index(found, block_idx + 1)
+        block = self._blocks[block_idx]
+        return self._offsets[block_idx] + block.index(next(filter(long_enough, block)))
@@ -0,0 +1,224 @@
+from operator import attrgetter
+
+from .Period import TimePeriod, to_epoch
+
+
+_ANY_PAYLOAD = object()
+_node_key = attrgetter('key')
+
+
+class _Node(object):
+    """ A node of the interval tree, holding one (period, payload) pair
+
+    Nodes are ordered by (beginning, end, insertion order) of their period, and each one knows the latest end among
+    the periods of its subtree, which allows to skip whole subtrees ending before a queried date.
+    """
+    __slots__ = ('key', 'period', 'payload', 'left', 'right', 'height', 'max_end')
+
+    def __init__(self, key, period, payload):
+        self.key = key
+        self.period = period
+        self.payload = payload
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.max_end = period._end_epoch
+
+    def update(self):
+        """ Recompute the height and latest end of this node, from its children """
+        self.height = 1 + max(_height(self.left), _height(self.right))
+        self.max_end = self.period._end_epoch
+        if self.left is not None and self.left.max_end > self.max_end:
+            self.max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > self.max_end:
+            self.max_end = self.right.max_end
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    node.update()
+    pivot.update()
+    return pivot
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    node.update()
+    pivot.update()
+    return pivot
+
+
+def _rebalance(node):
+    """ Update a node whose subtrees changed, rotating it if they differ in height by more than one """
+    node.update()
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _insert(node, new):
+    if node is None:
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    return _rebalance(node)
+
+
+def _pop_min(node):
+    """ Detach the leftmost node of a subtree
+
+    :return: The leftmost node and the new root of the subtree
+    """
+    if node.left is None:
+        return node, node.right
+    leftmost, node.left = _pop_min(node.left)
+    return leftmost, _rebalance(node)
+
+
+def _delete(node, key):
+    if key < node.key:
+        node.left = _delete(node.left, key)
+    elif key > node.key:
+        node.right = _delete(node.right, key)
+    else:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        successor, right = _pop_min(node.right)
+        successor.left, successor.right = node.left, right
+        node = successor
+    return _rebalance(node)
+
+
+def _find(node, bounds, payload):
+    """ Find the key of a node holding a period with the given bounds, and payload unless it is _ANY_PAYLOAD """
+    if node is None:
+        return None
+    node_bounds = node.key[:2]
+    if bounds < node_bounds:
+        return _find(node.left, bounds, payload)
+    if bounds > node_bounds:
+        return _find(node.right, bounds, payload)
+    if payload is _ANY_PAYLOAD or node.payload == payload:
+        return node.key
+    found = _find(node.left, bounds, payload)
+    return found if found is not None else _find(node.right, bounds, payload)
+
+
+def _build(nodes, begin_idx, end_idx):
+    """ Build a balanced tree from a list of nodes sorted by key """
+    if begin_idx >= end_idx:
+        return None
+    middle = (begin_idx + end_idx) // 2
+    node = nodes[middle]
+    node.left = _build(nodes, begin_idx, middle)
+    node.right = _build(nodes, middle + 1, end_idx)
+    node.update()
+    return node
+
+
+def _overlapping(node, begin, end, result):
+    """ Append to result the pairs of the subtree whose period overlaps [begin, end], sorted by beginning """
+    while node is not None and node.max_end >= begin:
+        _overlapping(node.left, begin, end, result)
+        if node.key[0] > end:
+            # This node and its whole right subtree begin after the queried dates
+            return
+        if node.period._end_epoch >= begin:
+            result.append((node.period, node.payload))
+        node = node.right
+
+
+class IntervalIndex(object):
+    """ An index of possibly overlapping TimePeriod, each one carrying a payload
+
+    Unlike a TimePeriodSet, periods are never merged, so that it can tell which payloads overlap a given date or
+    period. It is stored as a balanced interval tree, allowing to insert or remove a period in O(log n), and to find
+    the k periods overlapping a date in O(log n + k).
+
+    :param items: An iterable of (TimePeriod, payload) pairs
+    """
+
+    def __init__(self, items=()):
+        nodes = [_Node((period._begin_epoch, period._end_epoch, seq), period, payload)
+                 for seq, (period, payload) in enumerate(items)]
+        nodes.sort(key=_node_key)
+        self._root = _build(nodes, 0, len(nodes))
+        self._count = len(nodes)
+        self._next_seq = len(nodes)
+
+    def insert(self, period, payload=None):
+        """ Add a period to the index
+
+        :param period: A TimePeriod
+        :param payload: Any object associated to the period
+        """
+        key = (period._begin_epoch, period._end_epoch, self._next_seq)
+        self._next_seq += 1
+        self._root = _insert(self._root, _Node(key, period, payload))
+        self._count += 1
+
+    def remove(self, period, payload=_ANY_PAYLOAD):
+        """ Remove a period from the index
+
+        Raise a KeyError if no such period is found
+
+        :param period: A TimePeriod equal to the one to remove
+        :param payload: If given, only a period carrying an equal payload is removed
+        """
+        key = _find(self._root, (period._begin_epoch, period._end_epoch), payload)
+        if key is None:
+            raise KeyError(period)
+        self._root = _delete(self._root, key)
+        self._count -= 1
+
+    def overlapping(self, item):
+        """ All the periods overlapping a TimePeriod or a datetime.datetime
+
+        :return: A list of (TimePeriod, payload) pairs, sorted by beginning of period
+        """
+        if isinstance(item, TimePeriod):
+            begin, end = item._begin_epoch, item._end_epoch
+        else:
+            begin = end = to_epoch(item)
+        result = []
+        _overlapping(self._root, begin, end, result)
+        return result
+
+    def __len__(self):
+        """ Return how many periods are contained in this index """
+        return self._count
+
+    def __iter__(self):
+        """ Iterate over all (TimePeriod, payload) pairs, sorted by beginning of period """
+        stack, node = [], self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.period, node.payload
+                node = node.right
+
+    def __repr__(self):
+        return u"<IntervalIndex(%s)>" % u", ".join(u"[%s, %s]: %r" % (p.begin, p.end, payload) for p, payload in self)
+
@@ -1,10 +1,46 @@
 # coding=utf-8
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 INFINITY_BEGIN = datetime.min
 INFINITY_END = datetime.max
 
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_microseconds(delta):
+    """ Convert a datetime.timedelta into an integer count of microseconds """
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def to_epoch(date):
+    """ Convert a datetime.datetime into an integer count of microseconds since EPOCH, in UTC if it is aware """
+    offset = date.utcoffset()
+    if offset is None:
+        return to_microseconds(date - EPOCH)
+    return to_microseconds(date.replace(tzinfo=None) - EPOCH) - to_microseconds(offset)
+
+
+_INFINITY_BEGIN_EPOCH = to_epoch(INFINITY_BEGIN)
+_INFINITY_END_EPOCH = to_epoch(INFINITY_END)
+
+
+def from_epoch(microseconds, tzinfo=None):
+    """ Convert an integer count of microseconds since EPOCH into a datetime.datetime
+
+    :param tzinfo: If given, the time zone of the returned aware datetime, the count being in UTC. Else, the returned
+                   datetime is naive.
+    """
+    date = EPOCH + timedelta(microseconds=microseconds)
+    if tzinfo is None:
+        return date
+    return tzinfo.fromutc(date.replace(tzinfo=tzinfo))
+
+
+def _tzinfo_of(date):
+    """ The time zone of an aware datetime.datetime, or None if it is naive """
+    return date.tzinfo if date.utcoffset() is not None else None
+
 
 class InvalidPeriodException(Exception):
     """ Raised when a period is incoherent, ie with its beginning later than its end """
@@ -26,12 +62,27 @@ class SeparatePeriodsExceptions(Exception):
         return u"The following period do not have a common intersection : %s" % u", ".join(self.periods)
 
 
+class UnsortedPeriodsException(Exception):
+    """ Raised when periods expected to be sorted by beginning are not """
+    def __init__(self, previous, period):
+        super(UnsortedPeriodsException, self).__init__()
+        self.previous, self.period = previous, period
+
+    def __str__(self):
+        return u"The period %s begins before the period %s preceding it" % (self.period, self.previous)
+
+
 class TimePeriod(object):
     """ An immutable object describing a time period, with a beginning and an end
 
+    Internally, both bounds are only stored as integer counts of microseconds since EPOCH (in UTC for aware datetimes),
+    which makes periods compact and fast to compare. They are exposed as datetime.datetime, computed each time they are
+    needed, and aware in the time zone of begin if the period was built from aware datetimes.
+
     :param begin: datetime marking the beginning of the period or None if infinite
     :param end: datetime marking the beginning of the period, taking place AFTER begin or None if infinite
     """
+    __slots__ = ('_begin_epoch', '_end_epoch', '_tzinfo')
 
     def __init__(self, begin, end):
         if begin is None:
@@ -40,27 +91,76 @@ class TimePeriod(object):
             end = INFINITY_END
         if begin >= end:
             raise InvalidPeriodException(begin, end)
-        self._begin = begin
-        self._end = end
+        self._begin_epoch = to_epoch(begin)
+        self._end_epoch = to_epoch(end)
+        self._tzinfo = _tzinfo_of(begin)
+
+    @classmethod
+    def _from_epoch(cls, begin_epoch, end_epoch, tzinfo=None):
+        """ Build a period from bounds given in microseconds since EPOCH, trusting them to be coherent
+
+        :param tzinfo: The time zone in which the bounds are exposed, or None for naive bounds
+        """
+        period = cls.__new__(cls)
+        period._begin_epoch = begin_epoch
+        period._end_epoch = end_epoch
+        period._tzinfo = tzinfo
+        return period
 
     @property
     def begin(self):
-        return self._begin
+        return from_epoch(self._begin_epoch, self._tzinfo)
 
     @property
     def end(self):
-        return self._end
+        return from_epoch(self._end_epoch, self._tzinfo)
 
     @property
     def duration(self):
-        return self.end - self.begin
+        return timedelta(microseconds=self._end_epoch - self._begin_epoch)
 
     def __copy__(self):
-        return self.__class__(self.begin, self.end)
+        return self._from_epoch(self._begin_epoch, self._end_epoch, self._tzinfo)
+
+    def __reduce__(self):
+        """ Pickle a period as its two integer bounds, and its time zone if it has one """
+        if self._tzinfo is None:
+            return _restore_period, (self.__class__, self._begin_epoch, self._end_epoch)
+        return _restore_period, (self.__class__, self._begin_epoch, self._end_epoch, self._tzinfo)
 
     def copy(self):
         return self.__copy__()
 
+    def split(self, every, within=None):
+        """ Split this period at each boundary of a calendar or of fixed steps, generating the chunks lazily
+
+        :param every: Either a positive datetime.timedelta, for boundaries every such step from EPOCH (so that steps
+                      dividing a day fall on midnight), or DAILY, WEEKLY or MONTHLY, for boundaries at the beginning of
+                      each calendar day, week (on Monday) or month
+        :param within: If given, a TimePeriod to which this period is clipped before being split. It is required to
+                       split an infinite period.
+        :return: An iterator of TimePeriod, sorted
+        """
+        # Calendar depends on this module
+        from .Calendar import iter_boundaries
+        begin_epoch, end_epoch = self._begin_epoch, self._end_epoch
+        if within is not None:
+            begin_epoch = max(begin_epoch, within._begin_epoch)
+            end_epoch = min(end_epoch, within._end_epoch)
+            if begin_epoch >= end_epoch:
+                return iter(())
+        if begin_epoch == _INFINITY_BEGIN_EPOCH or end_epoch == _INFINITY_END_EPOCH:
+            raise ValueError(u"An infinite period can only be split within a finite window")
+        boundaries = iter_boundaries(from_epoch(begin_epoch, self._tzinfo), from_epoch(end_epoch, self._tzinfo), every)
+        return self._chunks(begin_epoch, end_epoch, boundaries)
+
+    def _chunks(self, begin_epoch, end_epoch, boundaries):
+        """ Yield the periods between begin_epoch, each of the boundaries and end_epoch """
+        for boundary in boundaries:
+            yield self._from_epoch(begin_epoch, boundary, self._tzinfo)
+            begin_epoch = boundary
+        yield self._from_epoch(begin_epoch, end_epoch, self._tzinfo)
+
     def __str__(self):
         return u"%s - %s" % (self.begin, self.end)
 
@@ -69,15 +169,20 @@ class TimePeriod(object):
 
     def __gt__(self, other):
         """ Compare if this period starts after another """
-        return self.begin > other.begin
+        return self._begin_epoch > other._begin_epoch
 
     def __lt__(self, other):
         """ Compare if this period starts before another """
-        return self.begin < other.begin
+        return self._begin_epoch < other._begin_epoch
 
     def __eq__(self, other):
         """ Compare if this period starts and ends on the same dates as another """
-        return self.begin == other.begin and self.end == other.end
+        if not isinstance(other, TimePeriod):
+            return NotImplemented
+        return self._begin_epoch == other._begin_epoch and self._end_epoch == other._end_epoch
+
+    def __hash__(self):
+        return hash((self._begin_epoch, self._end_epoch))
 
     def __ge__(self, other):
         """ Compare if this period is equal or starts later than another """
@@ -89,9 +194,9 @@ class TimePeriod(object):
 
     def __contains__(self, item):
         """ Test if the item and this period overlap """
-        if isinstance(item, self.__class__):
-            return self.begin <= item.end and self.end >= item.begin
-        return self.begin <= item <= self.end
+        if isinstance(item, TimePeriod):
+            return self._begin_epoch <= item._end_epoch and self._end_epoch >= item._begin_epoch
+        return self._begin_epoch <= to_epoch(item) <= self._end_epoch
 
     def __or__(self, other):
         """ Merge two periods into one
@@ -99,11 +204,11 @@ class TimePeriod(object):
         If the two are disjointed, raise a SeparatePeriodsExceptions
         """
         first, second = sorted((self, other))
-        if first.end < second.begin:
+        if first._end_epoch < second._begin_epoch:
             raise SeparatePeriodsExceptions((first, second))
-        if first.end >= second.end:
+        if first._end_epoch >= second._end_epoch:
             return first
-        return self.__class__(first.begin, second.end)
+        return self._from_epoch(first._begin_epoch, second._end_epoch, first._tzinfo)
 
     def __and__(self, other):
         """ Makes the intersection between two periods
@@ -111,10 +216,18 @@ class TimePeriod(object):
         If the two are disjointed, raise a SeparatePeriodsExceptions
         """
         first, second = sorted((self, other))
-        if first.end < second.begin:
+        if first._end_epoch < second._begin_epoch:
             raise SeparatePeriodsExceptions((first, second))
-        if second.end <= first.end:
+        if second._end_epoch <= first._end_epoch:
             return second
-        return self.__class__(second.begin, first.end)
+        if second._begin_epoch == first._end_epoch:
+            # Periods only touching each other share a single instant, which is not a period
+            raise InvalidPeriodException(second.begin, first.end)
+        return self._from_epoch(second._begin_epoch, first._end_epoch, second._tzinfo)
 
     __add__ = __or__
+
+
+def _restore_period(cls, begin_epoch, end_epoch, tzinfo=None):
+    """ Rebuild a pickled period """
+    return cls._from_epoch(begin_epoch, end_epoch, tzinfo)
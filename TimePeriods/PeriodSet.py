@@ -1,4 +1,256 @@
-from .Period import TimePeriod
+import heapq
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from itertools import islice
+from operator import attrgetter
+
+from .Calendar import bin_edges
+from .GapIndex import GapIndex
+from .Period import TimePeriod, INFINITY_BEGIN, INFINITY_END, to_epoch, to_microseconds, _tzinfo_of
+
+
+_period_begin = attrgetter('_begin_epoch')
+
+
+def _bisect_left(column, value, lo=0, hi=None):
+    """ Like bisect.bisect_left, for a sorted column of a TimePeriodSet, whatever its storage """
+    if hi is None:
+        hi = len(column)
+    if column.__class__ is list:
+        return bisect_left(column, value, lo, hi)
+    return column.bisect_left(value, lo, hi)
+
+
+def _bisect_right(column, value, lo=0, hi=None):
+    """ Like bisect.bisect_right, for a sorted column of a TimePeriodSet, whatever its storage """
+    if hi is None:
+        hi = len(column)
+    if column.__class__ is list:
+        return bisect_right(column, value, lo, hi)
+    return column.bisect_right(value, lo, hi)
+
+
+def _period_length(period):
+    return period._end_epoch - period._begin_epoch
+
+
+def _tzinfo_of_periods(*periods_lists):
+    """ The time zone of the first period of the given lists, in which new periods computed from them are exposed """
+    for periods in periods_lists:
+        if periods:
+            return periods[0]._tzinfo
+    return None
+
+
+def _merge(periods, other_periods):
+    """ Yield the periods of two lists sorted by beginning, in order, in a single two-pointer pass """
+    idx, other_idx = 0, 0
+    count, other_count = len(periods), len(other_periods)
+    while idx < count and other_idx < other_count:
+        if other_periods[other_idx]._begin_epoch < periods[idx]._begin_epoch:
+            yield other_periods[other_idx]
+            other_idx += 1
+        else:
+            yield periods[idx]
+            idx += 1
+    for period in periods[idx:]:
+        yield period
+    for period in other_periods[other_idx:]:
+        yield period
+
+
+def _coalesce(periods):
+    """ Merge overlapping or adjacent periods of a sequence sorted by beginning, in a single sweep
+
+    Periods which do not need to be merged are kept as is, since TimePeriod are immutable.
+
+    :param periods: An iterable of TimePeriod sorted by beginning
+    :return: A list of disjoint TimePeriod, sorted
+    """
+    merged = []
+    current, current_end = None, None
+    for period in periods:
+        if current is None:
+            current, current_end = period, period._end_epoch
+        elif period._begin_epoch <= current_end:
+            if period._end_epoch > current_end:
+                current_end = period._end_epoch
+        else:
+            merged.append(_extended(current, current_end))
+            current, current_end = period, period._end_epoch
+    if current is not None:
+        merged.append(_extended(current, current_end))
+    return merged
+
+
+def _extended(period, end_epoch):
+    """ The given period, or a copy of it ending at end_epoch if it is not already the case """
+    if period._end_epoch == end_epoch:
+        return period
+    return period._from_epoch(period._begin_epoch, end_epoch, period._tzinfo)
+
+
+def _sweep(periods, other_periods, keep):
+    """ Combine two lists of sorted and disjoint periods, in a single sweep over their boundaries
+
+    Since the periods of each list are disjoint, their boundaries form a strictly increasing sequence, in which a date
+    is inside a period if an odd number of boundaries precede it.
+
+    :param periods: A list of sorted and disjoint TimePeriod
+    :param other_periods: Another list of sorted and disjoint TimePeriod
+    :param keep: A function telling, from whether a date is inside periods and inside other_periods, if it should be
+                 part of the result. It must return False when the date is inside neither of them.
+    :return: A list of sorted and disjoint TimePeriod. Unchanged periods are kept as is.
+    """
+    bounds = [date for period in periods for date in (period._begin_epoch, period._end_epoch)]
+    other_bounds = [date for period in other_periods for date in (period._begin_epoch, period._end_epoch)]
+    count, other_count = len(bounds), len(other_bounds)
+    idx, other_idx = 0, 0
+    tzinfo = _tzinfo_of_periods(periods, other_periods)
+    result = []
+    begin = None
+
+    while idx < count or other_idx < other_count:
+        if other_idx >= other_count or (idx < count and bounds[idx] <= other_bounds[other_idx]):
+            date = bounds[idx]
+        else:
+            date = other_bounds[other_idx]
+        if idx < count and bounds[idx] == date:
+            idx += 1
+        if other_idx < other_count and other_bounds[other_idx] == date:
+            other_idx += 1
+
+        inside = keep(idx % 2 == 1, other_idx % 2 == 1)
+        if inside and begin is None:
+            begin = date
+        elif not inside and begin is not None:
+            # Reuse the original period if the result period is exactly one of them
+            if idx and idx % 2 == 0 and bounds[idx - 2:idx] == [begin, date]:
+                result.append(periods[idx // 2 - 1])
+            elif other_idx and other_idx % 2 == 0 and other_bounds[other_idx - 2:other_idx] == [begin, date]:
+                result.append(other_periods[other_idx // 2 - 1])
+            else:
+                result.append(TimePeriod._from_epoch(begin, date, tzinfo))
+            begin = None
+
+    return result
+
+
+def _covered_bins(begins, ends, edges):
+    """ The time covered by sorted and disjoint periods within each bin, in a single pass over both
+
+    :param begins: The sorted beginnings of the periods, in microseconds since EPOCH
+    :param ends: The sorted ends of the periods, in microseconds since EPOCH
+    :param edges: The sorted edges of the bins, in microseconds since EPOCH
+    :return: A list of the covered microseconds of each bin
+    """
+    covered = [0] * (len(edges) - 1)
+    first_edge, last_edge = edges[0], edges[-1]
+    idx, count = _bisect_right(ends, first_edge), len(begins)
+    bin_idx = 0
+    while idx < count and begins[idx] < last_edge:
+        begin, end = max(begins[idx], first_edge), min(ends[idx], last_edge)
+        while begin < end:
+            while edges[bin_idx + 1] <= begin:
+                bin_idx += 1
+            chunk_end = min(end, edges[bin_idx + 1])
+            covered[bin_idx] += chunk_end - begin
+            begin = chunk_end
+        idx += 1
+    return covered
+
+
+def _boundaries(periods):
+    """ Yield the boundaries of sorted and disjoint periods, as (date, depth change) pairs """
+    for period in periods:
+        yield period._begin_epoch, 1
+        yield period._end_epoch, -1
+
+
+def _common_periods(periods_lists):
+    """ Intersect many lists of sorted and disjoint periods, in a single k-way heap merge of their boundaries
+
+    :return: A list of sorted and disjoint TimePeriod, covered by all the given lists
+    """
+    required_depth = len(periods_lists)
+    tzinfo = _tzinfo_of_periods(*periods_lists)
+    result = []
+    depth, begin, previous_date = 0, None, None
+    for date, change in heapq.merge(*[_boundaries(periods) for periods in periods_lists]):
+        if date != previous_date:
+            # All the boundaries at previous_date have been processed
+            if depth == required_depth and begin is None:
+                begin = previous_date
+            elif depth < required_depth and begin is not None:
+                result.append(TimePeriod._from_epoch(begin, previous_date, tzinfo))
+                begin = None
+            previous_date = date
+        depth += change
+    # The last boundary is always an end, which closes any pending period
+    if begin is not None:
+        result.append(TimePeriod._from_epoch(begin, previous_date, tzinfo))
+    return result
+
+
+def _periods_of(other):
+    """ Sorted and disjoint periods of other, which can be a TimePeriod, a TimePeriodSet or a TimePeriodSetView """
+    if isinstance(other, TimePeriodSet):
+        return other._periods
+    if isinstance(other, TimePeriodSetView):
+        return other.periods
+    return [other]
+
+
+def _columns_of(other):
+    """ Sorted and disjoint periods of other, with their beginnings and ends, see `_periods_of` """
+    if isinstance(other, TimePeriodSet):
+        return other._periods, other._begins, other._ends
+    periods = _periods_of(other)
+    return periods, [period._begin_epoch for period in periods], [period._end_epoch for period in periods]
+
+
+def _any_overlapping(periods, begins, ends):
+    """ Test if any of the given sorted periods shares some time with sorted and disjoint periods given by their bounds
+
+    Each period is located by binary search after the previous one, stopping at the first overlap.
+    """
+    idx, count = 0, len(begins)
+    for period in periods:
+        # The only candidate is the first period ending after period begins
+        idx = _bisect_right(ends, period._begin_epoch, idx)
+        if idx == count:
+            return False
+        if begins[idx] < period._end_epoch:
+            return True
+    return False
+
+
+def _all_covered(periods, begins, ends):
+    """ Test if all the given sorted periods are covered by sorted and disjoint periods given by their bounds
+
+    Each period is located by binary search after the previous one, stopping at the first one not covered.
+    """
+    idx, count = 0, len(begins)
+    for period in periods:
+        # The only candidate is the first period ending with or after period
+        idx = _bisect_left(ends, period._end_epoch, idx)
+        if idx == count or begins[idx] > period._begin_epoch:
+            return False
+    return True
+
+
+def _in_both(inside, other_inside):
+    return inside and other_inside
+
+
+def _in_first_only(inside, other_inside):
+    return inside and not other_inside
+
+
+def _in_exactly_one(inside, other_inside):
+    return inside != other_inside
 
 
 class TimePeriodSet(object):
@@ -7,147 +259,577 @@ class TimePeriodSet(object):
     :param periods: One or more TimePeriod
     """
 
+    # The type of sequence storing the periods and their bounds. It must support len, iteration, indexing, slicing and
+    # slice assignment, as well as bisect_left and bisect_right methods unless it is a list.
+    _storage = list
+
     def __init__(self, *periods):
-        self._periods = []
+        self._set_periods([])
+        flat_periods = []
         for period_or_iter in periods:
             if hasattr(period_or_iter, '__iter__'):
-                for period in period_or_iter:
-                    self += period
+                flat_periods.extend(period_or_iter)
             else:
-                self += period_or_iter
+                flat_periods.append(period_or_iter)
+        self._load(flat_periods)
+
+    @classmethod
+    def from_periods(cls, periods, assume_sorted=False):
+        """ Build a TimePeriodSet from an iterable of TimePeriod in O(n log n)
+
+        :param periods: An iterable of TimePeriod, possibly overlapping
+        :param assume_sorted: If True, periods are expected to be already sorted by beginning, and are coalesced in
+                              O(n) without sorting them again
+        :rtype: TimePeriodSet
+        """
+        new = cls()
+        new._load(periods, assume_sorted=assume_sorted)
+        return new
+
+    @classmethod
+    def union_all(cls, *sets):
+        """ Union of many TimePeriodSet at once, in a single k-way heap merge of their periods
+
+        :param sets: TimePeriodSet or TimePeriod
+        :rtype: TimePeriodSet
+        """
+        return cls.from_periods(
+            heapq.merge(*[_periods_of(period_set) for period_set in sets], key=_period_begin),
+            assume_sorted=True,
+        )
+
+    @classmethod
+    def intersection_all(cls, *sets):
+        """ Intersection of many TimePeriodSet at once, in a single k-way heap merge of their periods
+
+        :param sets: TimePeriodSet or TimePeriod
+        :return: All the TimePeriod contained in every given set, or an empty TimePeriodSet if no set is given
+        :rtype: TimePeriodSet
+        """
+        periods_lists = [_periods_of(period_set) for period_set in sets]
+        new = cls()
+        if periods_lists and all(periods_lists):
+            new._set_periods(_common_periods(periods_lists))
+        return new
+
+    @classmethod
+    def _from_bounds(cls, begins, ends, tzinfo=None):
+        """ Build a TimePeriodSet from the bounds of sorted and disjoint periods, trusting them without any check
+
+        :param begins: A list of the beginnings of the periods, in microseconds since EPOCH
+        :param ends: A list of the ends of the periods, in microseconds since EPOCH
+        :param tzinfo: The time zone in which the periods are exposed, or None for naive periods
+        """
+        new = cls()
+        new._periods = new._column([TimePeriod._from_epoch(begin, end, tzinfo) for begin, end in zip(begins, ends)])
+        new._begins, new._ends = new._column(begins), new._column(ends)
+        new._invalidate_metrics()
+        return new
+
+    def _load(self, periods, assume_sorted=False):
+        """ Replace the content of this set by the given periods, sorting them once and merging them in one sweep """
+        if not assume_sorted:
+            periods = sorted(periods, key=_period_begin)
+        self._set_periods(_coalesce(periods))
+
+    def _set_periods(self, periods):
+        """ Replace the content of this set by a list of sorted and disjoint periods, and rebuild the boundaries index
+
+        Since the periods are disjoint, both their beginnings and their ends are sorted, which allows to locate any
+        date among them by binary search.
+        """
+        self._periods = self._column(periods)
+        self._begins = self._column([period._begin_epoch for period in periods])
+        self._ends = self._column([period._end_epoch for period in periods])
+        self._shared = False
+        self._invalidate_metrics()
+
+    def _column(self, values):
+        """ Store a list of values in the storage of this set """
+        return values if self._storage is list else self._storage(values)
+
+    def _invalidate_metrics(self):
+        """ Forget the cached metrics of this set, which will be computed again when needed """
+        # The cumulated duration of all periods in microseconds, maintained incrementally once computed
+        self._total_duration = None
+        # The gaps between periods, and the largest of them
+        self._gap_metrics = None
+        # The index of the gaps lengths, maintained incrementally once built
+        self._gap_index = None
+
+    def _unshare(self):
+        """ Give this set its own storage, if it still shares it with a copy, before modifying it in place """
+        if self._shared:
+            self._periods = self._storage(self._periods)
+            self._begins = self._storage(self._begins)
+            self._ends = self._storage(self._ends)
+            self._shared = False
+
+    def _splice(self, begin_idx, end_idx, periods):
+        """ Replace in place the periods between begin_idx (included) and end_idx (excluded) by the given ones """
+        if self._gap_index is not None:
+            if self._shared:
+                # The index may be shared with a copy as well
+                self._gap_index = self._gap_index.copy()
+            self._splice_gaps(begin_idx, end_idx, periods)
+        self._unshare()
+        if self._total_duration is not None:
+            self._total_duration += sum(period._end_epoch - period._begin_epoch for period in periods) - \
+                sum(end - begin for begin, end in zip(self._begins[begin_idx:end_idx], self._ends[begin_idx:end_idx]))
+        self._gap_metrics = None
+        self._periods[begin_idx:end_idx] = periods
+        self._begins[begin_idx:end_idx] = [period._begin_epoch for period in periods]
+        self._ends[begin_idx:end_idx] = [period._end_epoch for period in periods]
+
+    def _splice_gaps(self, begin_idx, end_idx, periods):
+        """ Update the gap index, before the periods between begin_idx and end_idx are replaced by the given ones
+
+        Only the gaps around the replaced periods change: the ones between them and their neighbours.
+        """
+        count = len(self._begins)
+        chain = [(self._begins[begin_idx - 1], self._ends[begin_idx - 1])] if begin_idx else []
+        chain.extend((period._begin_epoch, period._end_epoch) for period in periods)
+        if end_idx < count:
+            chain.append((self._begins[end_idx], self._ends[end_idx]))
+        first_gap = max(begin_idx - 1, 0)
+        self._gap_index.splice(first_gap, max(min(end_idx, count - 1), first_gap), [
+            following[0] - preceding[1] for preceding, following in zip(chain, chain[1:])
+        ])
 
     @property
     def periods(self):
-        """ All TimePeriod contained in this TimePeriodSet """
-        return self._periods
+        """ All TimePeriod contained in this TimePeriodSet, as a new list
+
+        The periods themselves are immutable, and the list can be modified without altering this set, nor the copies
+        sharing its storage.
+        """
+        return list(self._periods)
+
+    @property
+    def total_duration(self):
+        """ The cumulated duration of all contained periods, as a datetime.timedelta """
+        if self._total_duration is None:
+            self._total_duration = sum(end - begin for begin, end in zip(self._begins, self._ends))
+        return timedelta(microseconds=self._total_duration)
+
+    @property
+    def span(self):
+        """ The TimePeriod from the beginning of the first period to the end of the last one, or None if empty """
+        if not self._periods:
+            return None
+        return TimePeriod._from_epoch(self._begins[0], self._ends[-1], self._periods[0]._tzinfo)
+
+    def _get_gap_metrics(self):
+        if self._gap_metrics is None:
+            gaps = TimePeriodSet._from_bounds(self._ends[:-1], self._begins[1:], _tzinfo_of_periods(self._periods))
+            largest_gap = max(gaps, key=_period_length) if gaps else None
+            self._gap_metrics = gaps, largest_gap
+        return self._gap_metrics
+
+    def gaps(self):
+        """ The time between the periods of this set, ie its complement within its span
+
+        :rtype: TimePeriodSet
+        """
+        return self._get_gap_metrics()[0].copy()
+
+    @property
+    def largest_gap(self):
+        """ The longest TimePeriod between two periods of this set (the earliest one if many), or None if none """
+        return self._get_gap_metrics()[1]
 
     def __copy__(self):
-        """ Makes a deep copy of a TimePeriodSet, copying all TimePeriod contained """
+        """ Makes a copy of a TimePeriodSet
+
+        Since TimePeriod are immutable, the copy shares them with the original, as well as their storage, until one of
+        the two sets is modified in place.
+        """
         new = self.__class__()
-        new._periods = [period.copy() for period in self._periods]
+        new._periods, new._begins, new._ends = self._periods, self._begins, self._ends
+        new._shared = self._shared = True
+        new._total_duration, new._gap_metrics = self._total_duration, self._gap_metrics
+        new._gap_index = self._gap_index
         return new
 
     copy = __copy__
 
+    def _packed_bounds(self):
+        """ The beginnings then the ends of all periods, packed as little-endian int64 """
+        bounds = array('q', self._begins)
+        bounds.extend(self._ends)
+        if sys.byteorder == 'big':
+            bounds.byteswap()
+        return bounds.tobytes()
+
+    def __reduce__(self):
+        """ Pickle a set as a single bytes payload, packing the bounds of all its periods as little-endian int64, and
+        the time zone of its periods if they have one
+        """
+        tzinfo = _tzinfo_of_periods(self._periods)
+        if tzinfo is None:
+            return _restore_period_set, (self.__class__, self._packed_bounds())
+        return _restore_period_set, (self.__class__, self._packed_bounds(), tzinfo)
+
     def __ior__(self, other):
         """ Union of self and other
 
         :param other: If it is a TimePeriod, it will be added to the current set
-                      If it is a TimePeriodSet, all of its TimePeriod will be added to the current set
+                      If it is a TimePeriodSet or a TimePeriodSetView, all of its TimePeriod will be added to the
+                      current set
         :rtype: TimePeriodSet
         """
-        if isinstance(other, self.__class__):
-            for period in other:
-                self += period
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        if not isinstance(other, TimePeriod):
+            other_periods = _periods_of(other)
+            if other_periods:
+                self._set_periods(_coalesce(_merge(self._periods, other_periods)))
             return self
 
         # Here we should have other as a Period
-        intersection_periods = []
-        begin_idx, end_idx = None, None
-
-        for idx, period in enumerate(self):
-            if begin_idx is None and period.end >= other.begin:
-                begin_idx = idx
-
-            if begin_idx is not None:
-                if period.begin <= other.end:
-                    # Here, period is at least partially included in other
-                    intersection_periods.append(period)
-                else:
-                    # Here, period starts after other
-                    end_idx = idx
-                    break
+        # The periods to merge with other are the ones ending after other begins, and beginning before other ends
+        begin_idx = _bisect_left(self._ends, other._begin_epoch)
+        end_idx = _bisect_right(self._begins, other._end_epoch, begin_idx)
 
         # If no common TimePeriod, new_period is exactly other.
         # Else, it starts with the earliest start, and ends with the latest end
-        new_period = TimePeriod(
-            min(intersection_periods[0].begin, other.begin),
-            max(intersection_periods[-1].end, other.end)
-        ) \
-            if intersection_periods \
-            else other
-
-        self._periods = self._periods[:begin_idx] + \
-            [new_period] + \
-            (self._periods[end_idx:] if end_idx is not None else [])
+        new_period = other
+        if begin_idx < end_idx:
+            begin = min(self._begins[begin_idx], other._begin_epoch)
+            end = max(self._ends[end_idx - 1], other._end_epoch)
+            if end_idx - begin_idx == 1 and (begin, end) == (self._begins[begin_idx], self._ends[begin_idx]):
+                # other is already fully contained in one of our periods
+                return self
+            if (begin, end) != (other._begin_epoch, other._end_epoch):
+                new_period = TimePeriod._from_epoch(begin, end, other._tzinfo)
+
+        self._splice(begin_idx, end_idx, [new_period])
         return self
 
     __iadd__ = __ior__
 
-    def __iand__(self, other):
-        """ Intersection of self and other
+    def add(self, period):
+        """ Add a TimePeriod to this set, in place, merging it with the periods it overlaps or touches
 
-        :param other: A TimePeriod or TimePeriodSet; the current set will be equal to all the TimePeriod contained both
-                      in itself and in other
-        :rtype: TimePeriodSet
+        Only these periods are located by binary search and replaced, so that the rest of the set is left untouched.
         """
-        def _get_next_period(idx):
-            idx += 1
-            if idx >= len(self):
-                return None, idx
-            return self[idx], idx
+        self |= period
 
-        if not isinstance(other, self.__class__):
-            other = (other,)
+    def update(self, *others):
+        """ Add to this set, in place, all the periods of many TimePeriod or TimePeriodSet """
+        for other in others:
+            self |= other
 
-        idx = 0
-        common_periods = []
-        for other_period in other:
-            if idx >= len(self):
-                break
-
-            period = self[idx]
+    def discard(self, period):
+        """ Carve a TimePeriod out of this set, in place, like `-=` with a single period
 
-            while period.end < other_period.begin:
-                period, idx = _get_next_period(idx)
-                if period is None:
-                    break
+        Only the periods overlapping it are located by binary search and replaced, so that the rest of the set is left
+        untouched.
+        """
+        # The periods to carve are the ones ending after period begins, and beginning before period ends
+        begin_idx = _bisect_right(self._ends, period._begin_epoch)
+        end_idx = _bisect_left(self._begins, period._end_epoch, begin_idx)
+        if begin_idx == end_idx:
+            return
+        remaining = []
+        if self._begins[begin_idx] < period._begin_epoch:
+            remaining.append(TimePeriod._from_epoch(
+                self._begins[begin_idx], period._begin_epoch, self._periods[begin_idx]._tzinfo))
+        if self._ends[end_idx - 1] > period._end_epoch:
+            remaining.append(TimePeriod._from_epoch(
+                period._end_epoch, self._ends[end_idx - 1], self._periods[end_idx - 1]._tzinfo))
+        self._splice(begin_idx, end_idx, remaining)
 
-            if period is None:
-                break
+    def __iand__(self, other):
+        """ Intersection of self and other
 
-            # Here we should have period.end >= other_period.begin
-            while period.begin <= other_period.end:
-                # Here, we have period.begin <= other_period.end and period.end >= other_period.begin
-                common_periods.append(other_period & period)
-                period, idx = _get_next_period(idx)
-                if period is None:
-                    break
-
-            # Here, we have period.begin > other_period.end
-            # We'll switch to the next period, but first, we need to "rewind" one period, because it may intersect
-            # both the current other_period and the next
-            if idx:
-                idx -= 1
-
-        self._periods = common_periods
+        :param other: A TimePeriod or TimePeriodSet; the current set will be equal to all the TimePeriod contained both
+                      in itself and in other
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        self._set_periods(_sweep(self._periods, _periods_of(other), _in_both))
         return self
 
     def __and__(self, other):
         """ Intersection between one or many TimePeriods
 
-        :param other: a TimePeriodSet or TimePeriod
+        :param other: a TimePeriodSet, TimePeriodSetView or TimePeriod
         :return: All TimePeriod contained both in self's `period` and in other
         """
-        new = self.copy()
-        new &= other
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        new = self.__class__()
+        new._set_periods(_sweep(self._periods, _periods_of(other), _in_both))
         return new
 
     def __or__(self, other):
         """ Union between one or manyTimePeriods
 
-        :param other: a TimePeriodSet or TimePeriod
+        :param other: a TimePeriodSet, TimePeriodSetView or TimePeriod
         :return: All TimePeriod contained either in self's `period` or in other
         """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
         new = self.copy()
         new |= other
         return new
 
     __add__ = __or__
 
+    def __isub__(self, other):
+        """ Difference of self and other
+
+        :param other: A TimePeriod or TimePeriodSet; the current set will be equal to all the TimePeriod contained in
+                      itself but not in other
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        self._set_periods(_sweep(self._periods, _periods_of(other), _in_first_only))
+        return self
+
+    def __sub__(self, other):
+        """ Difference between one or many TimePeriods
+
+        :param other: a TimePeriodSet, TimePeriodSetView or TimePeriod
+        :return: All TimePeriod contained in self's `period` but not in other
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        new = self.__class__()
+        new._set_periods(_sweep(self._periods, _periods_of(other), _in_first_only))
+        return new
+
+    def __ixor__(self, other):
+        """ Symmetric difference of self and other
+
+        :param other: A TimePeriod or TimePeriodSet; the current set will be equal to all the TimePeriod contained
+                      either in itself or in other, but not in both
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        self._set_periods(_sweep(self._periods, _periods_of(other), _in_exactly_one))
+        return self
+
+    def __xor__(self, other):
+        """ Symmetric difference between one or many TimePeriods
+
+        :param other: a TimePeriodSet, TimePeriodSetView or TimePeriod
+        :return: All TimePeriod contained either in self's `period` or in other, but not in both
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        new = self.__class__()
+        new._set_periods(_sweep(self._periods, _periods_of(other), _in_exactly_one))
+        return new
+
+    def complement(self, within=None):
+        """ All the time not covered by this set
+
+        :param within: The TimePeriod to which the complement is restricted. If None, the complement ranges from
+                       INFINITY_BEGIN to INFINITY_END
+        :rtype: TimePeriodSet
+        """
+        if within is None:
+            within = TimePeriod(INFINITY_BEGIN, INFINITY_END)
+        new = self.__class__()
+        new._set_periods(_sweep([within], self._periods, _in_first_only))
+        return new
+
+    def window(self, begin, end, clip=True):
+        """ A read-only view of the periods of this set overlapping a window, such as a week of a calendar
+
+        The view is found by binary search and shares the storage of this set, so that it is built in O(log n)
+        however large this set is.
+
+        :param begin: The datetime.datetime at which the window begins
+        :param end: The datetime.datetime at which the window ends
+        :param clip: If True, the periods overlapping the edges of the window are clipped to it
+        :rtype: TimePeriodSetView
+        """
+        return TimePeriodSetView(self, begin, end, clip=clip)
+
+    def coverage_histogram(self, begin, end, step, ratio=False):
+        """ How much of each bin between two dates is covered by this set, computed in a single pass
+
+        :param begin: The datetime.datetime at which the first bin begins
+        :param end: The datetime.datetime at which the last bin ends
+        :param step: Either a positive datetime.timedelta, for bins of this length from begin (the last one may be
+                     shorter), or DAILY, WEEKLY or MONTHLY, for calendar bins (the first and last ones may be partial)
+        :param ratio: If True, return the covered fraction of each bin rather than its covered duration
+        :return: A list of datetime.timedelta, or of floats between 0 and 1 if ratio is True
+        """
+        within = TimePeriod(begin, end)
+        edges = bin_edges(within.begin, within.end, step)
+        covered = _covered_bins(self._begins, self._ends, edges)
+        if ratio:
+            return [float(duration) / (edges[idx + 1] - edges[idx]) for idx, duration in enumerate(covered)]
+        return [timedelta(microseconds=duration) for duration in covered]
+
+    def split(self, every, within=None):
+        """ Split each period of this set at each boundary of a calendar or of fixed steps, see `TimePeriod.split`
+
+        Chunks are generated lazily, period after period, so that splitting a large set needs no extra memory.
+
+        :param within: If given, a TimePeriod to which this set is restricted before being split. It is required to
+                       split infinite periods.
+        :return: An iterator of TimePeriod, sorted
+        """
+        periods = self if within is None else self.window(within.begin, within.end)
+        for period in periods:
+            for chunk in period.split(every):
+                yield chunk
+
+    def _free_slots(self, after, duration, before, tzinfo):
+        """ Yield back-to-back free slots lasting duration, from after to before, all three in microseconds
+
+        :param tzinfo: The time zone in which the slots are exposed, or None for naive slots
+        """
+        if duration <= 0:
+            raise ValueError(u"The duration of a free slot must be positive")
+        if self._gap_index is None:
+            self._gap_index = GapIndex(self._begins, self._ends)
+        begins, ends = self._begins, self._ends
+        count = len(begins)
+        while True:
+            idx = _bisect_right(begins, after)
+            if idx and ends[idx - 1] > after:
+                # after takes place during a period
+                after = ends[idx - 1]
+            # Here, after is free until the beginning of the period idx
+            if idx == count or after + duration <= begins[idx]:
+                begin = after
+            else:
+                gap_idx = self._gap_index.first_at_least(duration, idx)
+                begin = ends[gap_idx] if gap_idx is not None else ends[-1]
+            if begin + duration > before:
+                return
+            yield TimePeriod._from_epoch(begin, begin + duration, tzinfo)
+            after = begin + duration
+
+    def find_free_slot(self, after, duration, before=None):
+        """ Find the earliest free slot lasting at least duration, ie not overlapping any period of this set
+
+        Gaps between periods are indexed in blocks, each one with its longest gap, so that the search only scans the
+        longest gaps of the blocks then a single block. The index is kept up to date when periods are added or removed.
+
+        :param after: The datetime.datetime from which to search
+        :param duration: A positive datetime.timedelta
+        :param before: If given, the datetime.datetime before which the slot must end
+        :return: A TimePeriod lasting duration, or None if there is no such slot
+        """
+        return next(self._free_slots(
+            to_epoch(after),
+            to_microseconds(duration),
+            to_epoch(before if before is not None else INFINITY_END),
+            _tzinfo_of(after),
+        ), None)
+
+    def find_free_slots(self, after, duration, before=None, limit=None):
+        """ Find the earliest free slots lasting duration, back-to-back when a gap can hold many of them
+
+        :param after: The datetime.datetime from which to search
+        :param duration: A positive datetime.timedelta
+        :param before: If given, the datetime.datetime before which the slots must end
+        :param limit: If given, the maximum number of slots to find. Either before or limit must be given.
+        :return: A list of TimePeriod lasting duration, sorted
+        """
+        if before is None and limit is None:
+            raise ValueError(u"Either before or limit must be given")
+        return list(islice(self._free_slots(
+            to_epoch(after),
+            to_microseconds(duration),
+            to_epoch(before if before is not None else INFINITY_END),
+            _tzinfo_of(after),
+        ), limit))
+
     def __contains__(self, item):
         """ Test if a TimePeriod or datetime.datetime is contained in this TimePeriodSet """
-        return any(item in period for period in self._periods)
+        if isinstance(item, TimePeriod):
+            begin, end = item._begin_epoch, item._end_epoch
+        else:
+            begin = end = to_epoch(item)
+        # The only candidate is the first period ending after item begins
+        idx = _bisect_left(self._ends, begin)
+        return idx < len(self._periods) and self._begins[idx] <= end
+
+    def contains_many(self, dates):
+        """ Test for each of many datetime.datetime if it is contained in this TimePeriodSet
+
+        The dates are sorted once (in linear time if they already are), then matched against the periods in a single
+        merge pass.
+
+        :param dates: An iterable of datetime.datetime, sorted or not
+        :return: A list of booleans, in the same order as dates
+        """
+        dates = [to_epoch(date) for date in dates]
+        mask = [False] * len(dates)
+        idx, count = 0, len(self._periods)
+        for position in sorted(range(len(dates)), key=dates.__getitem__):
+            date = dates[position]
+            while idx < count and self._ends[idx] < date:
+                idx += 1
+            if idx == count:
+                break
+            mask[position] = self._begins[idx] <= date
+        return mask
+
+    def period_at(self, date):
+        """ The period containing a datetime.datetime, found by binary search, or None if no period does """
+        epoch = to_epoch(date)
+        idx = _bisect_left(self._ends, epoch)
+        if idx < len(self._periods) and self._begins[idx] <= epoch:
+            return self._periods[idx]
+        return None
+
+    def next_period(self, date):
+        """ The period containing a datetime.datetime or else the first one following it, or None if there is none """
+        idx = _bisect_left(self._ends, to_epoch(date))
+        return self._periods[idx] if idx < len(self._periods) else None
+
+    def previous_period(self, date):
+        """ The last period ending before a datetime.datetime, or None if there is none """
+        idx = _bisect_left(self._ends, to_epoch(date))
+        return self._periods[idx - 1] if idx else None
+
+    def cursor(self, date):
+        """ A cursor stepping through the periods of this set in both directions, from a datetime.datetime
+
+        :param date: The cursor starts at the period containing this date or else the first one following it, see
+                     `next_period`
+        :rtype: TimePeriodSetCursor
+        """
+        return TimePeriodSetCursor(self, date)
+
+    def overlaps(self, other):
+        """ Test if this set shares some time with a TimePeriod or TimePeriodSet, ie if their intersection is not empty
+
+        Periods only touching each other do not overlap. The periods of the smallest of the two are located by binary
+        search in the other one, stopping at the first overlap.
+        """
+        periods, begins, ends = _columns_of(other)
+        if len(periods) > len(self._periods):
+            return _any_overlapping(self._periods, begins, ends)
+        return _any_overlapping(periods, self._begins, self._ends)
+
+    def isdisjoint(self, other):
+        """ Test if this set shares no time with a TimePeriod or TimePeriodSet, see `overlaps` """
+        return not self.overlaps(other)
+
+    def covers(self, period):
+        """ Test by binary search if a TimePeriod is entirely contained in this set """
+        return _all_covered((period,), self._begins, self._ends)
+
+    def issubset(self, other):
+        """ Test if this set is contained in a TimePeriod or TimePeriodSet, stopping at the first period outside """
+        return _all_covered(self._periods, *_columns_of(other)[1:])
+
+    def issuperset(self, other):
+        """ Test if a TimePeriod or TimePeriodSet is contained in this set, stopping at the first period outside """
+        return _all_covered(_periods_of(other), self._begins, self._ends)
 
     def __len__(self):
         """ Return how many distinct TimePeriod are contained in this set """
@@ -170,3 +852,191 @@ class TimePeriodSet(object):
 
     def __repr__(self):
         return u"<TimePeriodSet(%s)>" % u", ".join(u"[%s, %s]" % (p.begin, p.end) for p in self)
+
+
+class TimePeriodSetView(object):
+    """ A read-only view of the periods of a TimePeriodSet overlapping a window, see `TimePeriodSet.window`
+
+    The view shares the storage of its set, which is copied before the set is next modified in place, so that the
+    view keeps the periods it was created with. Periods only touching the window are not part of the view.
+
+    :param period_set: The viewed TimePeriodSet
+    :param begin: The datetime.datetime at which the window begins
+    :param end: The datetime.datetime at which the window ends
+    :param clip: If True, the periods overlapping the edges of the window are clipped to it
+    """
+
+    def __init__(self, period_set, begin, end, clip=True):
+        self.within = TimePeriod(begin, end)
+        self.clip = clip
+        self._periods, self._begins, self._ends = period_set._periods, period_set._begins, period_set._ends
+        period_set._shared = True
+        self._begin_idx = _bisect_right(self._ends, self.within._begin_epoch)
+        self._end_idx = _bisect_left(self._begins, self.within._end_epoch, self._begin_idx)
+
+    def _clipped(self, period):
+        """ The given period, clipped to the window if needed """
+        if not self.clip:
+            return period
+        begin = max(period._begin_epoch, self.within._begin_epoch)
+        end = min(period._end_epoch, self.within._end_epoch)
+        if (begin, end) == (period._begin_epoch, period._end_epoch):
+            return period
+        return TimePeriod._from_epoch(begin, end, period._tzinfo)
+
+    @property
+    def periods(self):
+        """ All TimePeriod contained in this view, as a new list """
+        return list(self)
+
+    def to_period_set(self):
+        """ Copy the periods of this view into a TimePeriodSet
+
+        :rtype: TimePeriodSet
+        """
+        period_set = TimePeriodSet()
+        period_set._set_periods(self.periods)
+        return period_set
+
+    def __contains__(self, item):
+        """ Test if a TimePeriod or datetime.datetime is contained in this view """
+        if isinstance(item, TimePeriod):
+            begin, end = item._begin_epoch, item._end_epoch
+        else:
+            begin = end = to_epoch(item)
+        if self.clip and (begin < self.within._begin_epoch or end > self.within._end_epoch):
+            return False
+        idx = _bisect_left(self._ends, begin, self._begin_idx, self._end_idx)
+        return idx < self._end_idx and self._begins[idx] <= end
+
+    def __len__(self):
+        """ Return how many distinct TimePeriod are contained in this view """
+        return self._end_idx - self._begin_idx
+
+    def __getitem__(self, item):
+        """ Return the period at index `item` of this view, or a list of periods if `item` is a slice """
+        if isinstance(item, slice):
+            return [self[idx] for idx in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError(u"TimePeriodSetView index out of range")
+        period = self._periods[self._begin_idx + item]
+        if item == 0 or item == len(self) - 1:
+            # Only the periods at the edges of the window may need to be clipped
+            period = self._clipped(period)
+        return period
+
+    def __iter__(self):
+        last_idx = self._end_idx - 1
+        for idx in range(self._begin_idx, self._end_idx):
+            period = self._periods[idx]
+            if idx == self._begin_idx or idx == last_idx:
+                period = self._clipped(period)
+            yield period
+
+    def __and__(self, other):
+        """ Intersection with a TimePeriodSet, TimePeriodSetView or TimePeriod
+
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        return self.to_period_set() & other
+
+    def __or__(self, other):
+        """ Union with a TimePeriodSet, TimePeriodSetView or TimePeriod
+
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        return self.to_period_set() | other
+
+    def __sub__(self, other):
+        """ Difference with a TimePeriodSet, TimePeriodSetView or TimePeriod
+
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        return self.to_period_set() - other
+
+    def __xor__(self, other):
+        """ Symmetric difference with a TimePeriodSet, TimePeriodSetView or TimePeriod
+
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet, TimePeriodSetView)):
+            return NotImplemented
+        return self.to_period_set() ^ other
+
+    def __eq__(self, other):
+        """ Checks if each of two sets of periods' TimePeriods are identical """
+        return len(self) == len(other) and all(period == other_period for period, other_period in zip(self, other))
+
+    def __repr__(self):
+        return u"<TimePeriodSetView(%s)>" % u", ".join(u"[%s, %s]" % (p.begin, p.end) for p in self)
+
+
+class TimePeriodSetCursor(object):
+    """ A bidirectional cursor over the periods of a TimePeriodSet, see `TimePeriodSet.cursor`
+
+    Seeking a date is done by binary search in O(log n), and stepping to the next or previous period in O(1). Like a
+    TimePeriodSetView, the cursor shares the storage of its set, and keeps stepping through the periods it was created
+    with even if the set is modified afterwards.
+
+    :param period_set: A TimePeriodSet
+    :param date: The cursor starts at the period containing this date or else the first one following it
+    """
+
+    def __init__(self, period_set, date):
+        self._periods, self._ends = period_set._periods, period_set._ends
+        period_set._shared = True
+        self.seek(date)
+
+    def seek(self, date):
+        """ Move to the period containing a datetime.datetime or else the first one following it
+
+        :return: The period reached, or None if there is none
+        """
+        self._idx = _bisect_left(self._ends, to_epoch(date))
+        return self.period
+
+    @property
+    def period(self):
+        """ The current period, or None if the cursor moved past the first or last period """
+        if 0 <= self._idx < len(self._periods):
+            return self._periods[self._idx]
+        return None
+
+    def forward(self):
+        """ Move to the next period
+
+        :return: The period reached, or None if the cursor moved past the last period
+        """
+        if self._idx < len(self._periods):
+            self._idx += 1
+        return self.period
+
+    def backward(self):
+        """ Move to the previous period
+
+        :return: The period reached, or None if the cursor moved past the first period
+        """
+        if self._idx >= 0:
+            self._idx -= 1
+        return self.period
+
+    def __repr__(self):
+        return u"<TimePeriodSetCursor(%s)>" % self.period
+
+
+def _restore_period_set(cls, payload, tzinfo=None):
+    """ Rebuild a pickled set, trusting its periods to be already sorted and disjoint """
+    bounds = array('q')
+    bounds.frombytes(payload)
+    if sys.byteorder == 'big':
+        bounds.byteswap()
+    count = len(bounds) // 2
+    return cls._from_bounds(bounds[:count].tolist(), bounds[count:].tolist(), tzinfo)
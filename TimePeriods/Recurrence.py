@@ -0,0 +1,164 @@
+from datetime import timedelta
+
+from .Calendar import DAILY, WEEKLY, MONTHLY, add_months
+from .Period import TimePeriod, _INFINITY_BEGIN_EPOCH, _INFINITY_END_EPOCH, to_epoch, to_microseconds
+from .PeriodSet import TimePeriodSet, _bisect_left
+from .Streaming import iter_difference
+
+
+class RecurringPeriod(object):
+    """ A period repeating itself periodically, such as opening hours or shifts, generated lazily
+
+    Occurrences are never all materialized: they are only generated within the windows actually needed.
+
+    :param first: The TimePeriod of the first occurrence
+    :param frequency: How often the period repeats: DAILY, WEEKLY or MONTHLY. When repeating monthly, the day of the
+                      first occurrence is clamped to the length of shorter months.
+    :param interval: The number of days, weeks or months between two occurrences
+    :param weekdays: If given, only occurrences beginning on these days of the week (0 for Monday to 6 for Sunday)
+                     are kept
+    :param until: If given, no occurrence begins after this datetime, which may be naive or aware like the bounds of
+                  first
+    :param exceptions: If given, a TimePeriod or TimePeriodSet removed from the occurrences, such as holidays
+    """
+
+    def __init__(self, first, frequency=DAILY, interval=1, weekdays=None, until=None, exceptions=None):
+        if frequency not in (DAILY, WEEKLY, MONTHLY):
+            raise ValueError(u"Unknown frequency %s" % frequency)
+        if interval < 1:
+            raise ValueError(u"The interval between two occurrences must be at least 1, not %s" % interval)
+        self.first = first
+        self.frequency = frequency
+        self.interval = interval
+        self.weekdays = frozenset(weekdays) if weekdays is not None else None
+        self.until = until
+        self._until_epoch = to_epoch(until) if until is not None else _INFINITY_END_EPOCH
+        if isinstance(exceptions, TimePeriod):
+            exceptions = TimePeriodSet(exceptions)
+        self.exceptions = exceptions if exceptions is not None else TimePeriodSet()
+
+    def _occurrence_begin(self, idx):
+        """ The beginning of the idx-th occurrence, or None if it would be later than INFINITY_END """
+        try:
+            if self.frequency == MONTHLY:
+                return add_months(self.first.begin, idx * self.interval)
+            step = timedelta(days=self.interval if self.frequency == DAILY else 7 * self.interval)
+            return self.first.begin + idx * step
+        except (OverflowError, ValueError):
+            return None
+
+    def _first_index(self, begin_epoch):
+        """ The index of an occurrence ending before begin_epoch, and as close to it as possible """
+        if begin_epoch <= self.first._end_epoch:
+            return 0
+        if self.frequency == MONTHLY:
+            # Months are counted in the time zone of the first occurrence
+            begin = self.first.begin + timedelta(microseconds=begin_epoch - self.first._begin_epoch)
+            months = (begin.year - self.first.begin.year) * 12 + begin.month - self.first.begin.month
+            # An occurrence may last several months
+            months -= self.first.duration.days // 28 + 1
+            return max(0, months // self.interval)
+        step = to_microseconds(timedelta(days=self.interval if self.frequency == DAILY else 7 * self.interval))
+        return max(0, (begin_epoch - self.first._end_epoch) // step)
+
+    def occurrences(self, within):
+        """ Yield the occurrences overlapping a window, sorted, regardless of exceptions and without clipping them
+
+        :param within: A TimePeriod
+        """
+        duration = self.first._end_epoch - self.first._begin_epoch
+        idx = self._first_index(within._begin_epoch)
+        while True:
+            begin = self._occurrence_begin(idx)
+            if begin is None:
+                return
+            begin_epoch = to_epoch(begin)
+            if begin_epoch > self._until_epoch or begin_epoch >= within._end_epoch:
+                return
+            idx += 1
+            end_epoch = min(begin_epoch + duration, _INFINITY_END_EPOCH)
+            if end_epoch <= within._begin_epoch or (self.weekdays is not None and begin.weekday() not in self.weekdays):
+                continue
+            yield TimePeriod._from_epoch(begin_epoch, end_epoch, self.first._tzinfo)
+
+    def _exceptions_within(self, within):
+        """ Yield the exceptions overlapping a window, found by binary search """
+        exceptions = self.exceptions
+        idx = _bisect_left(exceptions._ends, within._begin_epoch)
+        while idx < len(exceptions) and exceptions._begins[idx] <= within._end_epoch:
+            yield exceptions[idx]
+            idx += 1
+
+    def iter_periods(self, within=None):
+        """ Yield the periods covered within a window, ie the occurrences minus the exceptions, clipped to the window
+
+        Overlapping occurrences are merged, so that the yielded periods are sorted and disjoint.
+
+        :param within: A TimePeriod. If None, periods are generated from the first occurrence, endlessly unless an
+                       `until` date was given.
+        """
+        if within is None:
+            within = TimePeriod._from_epoch(_INFINITY_BEGIN_EPOCH, _INFINITY_END_EPOCH, self.first._tzinfo)
+        clipped = (
+            TimePeriod._from_epoch(
+                max(period._begin_epoch, within._begin_epoch),
+                min(period._end_epoch, within._end_epoch),
+                period._tzinfo,
+            )
+            for period in self.occurrences(within)
+        )
+        return iter_difference(clipped, self._exceptions_within(within))
+
+    def _within_periods_of(self, other):
+        """ The periods covered within each period of other, which can be a TimePeriod or a TimePeriodSet """
+        if isinstance(other, TimePeriod):
+            other = (other,)
+        for period in other:
+            for covered in self.iter_periods(period):
+                yield covered
+
+    def __and__(self, other):
+        """ Intersection with a TimePeriod or TimePeriodSet, only generating occurrences within the periods of other
+
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet)):
+            return NotImplemented
+        return TimePeriodSet.from_periods(self._within_periods_of(other), assume_sorted=True)
+
+    __rand__ = __and__
+
+    def __or__(self, other):
+        """ Union with a TimePeriod or TimePeriodSet, restricted to the span of other
+
+        Since a recurring period may be endless, only the occurrences between the beginning of the first period of
+        other and the end of its last one are generated.
+
+        :rtype: TimePeriodSet
+        """
+        if isinstance(other, TimePeriod):
+            other = TimePeriodSet(other)
+        if not isinstance(other, TimePeriodSet):
+            return NotImplemented
+        if not other:
+            return TimePeriodSet()
+        return other | TimePeriodSet.from_periods(
+            self.iter_periods(other.span),
+            assume_sorted=True,
+        )
+
+    __ror__ = __or__
+
+    def __rsub__(self, other):
+        """ Difference between a TimePeriod or TimePeriodSet and this recurring period
+
+        :rtype: TimePeriodSet
+        """
+        if not isinstance(other, (TimePeriod, TimePeriodSet)):
+            return NotImplemented
+        if isinstance(other, TimePeriod):
+            other = TimePeriodSet(other)
+        return other - (self & other)
+
+    def __repr__(self):
+        return u"<RecurringPeriod(%s, %s every %s)>" % (self.first, self.frequency, self.interval)
@@ -0,0 +1,198 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .Period import TimePeriod, INFINITY_BEGIN, INFINITY_END, to_epoch
+from .PeriodSet import TimePeriodSet
+
+
+MAGIC = b'TPS\x00'
+VERSION = 1
+# Magic, format version, reserved flags and number of periods
+HEADER = struct.Struct('<4sHHQ')
+
+# Infinite bounds are stored as the extreme int64 values
+INFINITY_BEGIN_SENTINEL = -2 ** 63
+INFINITY_END_SENTINEL = 2 ** 63 - 1
+_INFINITY_BEGIN_EPOCH = to_epoch(INFINITY_BEGIN)
+_INFINITY_END_EPOCH = to_epoch(INFINITY_END)
+
+
+def _packed(epochs, infinity_epoch, sentinel):
+    """ Pack epochs into a little-endian int64 array, replacing the given infinite bound by its sentinel """
+    packed = array('q', (sentinel if epoch == infinity_epoch else epoch for epoch in epochs))
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed
+
+
+def _unpacked(packed, sentinel, infinity_epoch):
+    """ Unpack a little-endian int64 array into a list of epochs, replacing the given sentinel by its infinite bound """
+    if sys.byteorder == 'big':
+        packed = array('q', packed)
+        packed.byteswap()
+    return [infinity_epoch if epoch == sentinel else epoch for epoch in packed]
+
+
+def _read_header(data):
+    """ Read the header of serialized periods
+
+    :return: The number of periods
+    """
+    if len(data) < HEADER.size:
+        raise ValueError(u"Serialized periods are truncated")
+    magic, version, _, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(u"Serialized periods must begin with %r, not %r" % (MAGIC, magic))
+    if version != VERSION:
+        raise ValueError(u"Unsupported serialization format version %s" % version)
+    if len(data) < HEADER.size + 16 * count:
+        raise ValueError(u"Serialized periods are truncated")
+    return count
+
+
+def dumps(period_set):
+    """ Serialize a TimePeriodSet into a compact binary format
+
+    The format is a 16 bytes header, followed by the beginnings then the ends of all periods, as little-endian int64
+    counts of microseconds since EPOCH. Storing each bound in its own contiguous column allows to binary search them
+    directly in the serialized data.
+
+    :param period_set: A TimePeriodSet
+    :rtype: bytes
+    """
+    begins = [period._begin_epoch for period in period_set]
+    ends = [period._end_epoch for period in period_set]
+    return HEADER.pack(MAGIC, VERSION, 0, len(begins)) + \
+        _packed(begins, _INFINITY_BEGIN_EPOCH, INFINITY_BEGIN_SENTINEL).tobytes() + \
+        _packed(ends, _INFINITY_END_EPOCH, INFINITY_END_SENTINEL).tobytes()
+
+
+def dump(period_set, fp):
+    """ Serialize a TimePeriodSet into a binary file object, see `dumps` """
+    fp.write(dumps(period_set))
+
+
+def loads(data):
+    """ Deserialize a TimePeriodSet from data produced by `dumps`
+
+    :param data: A bytes-like object
+    :rtype: TimePeriodSet
+    """
+    count = _read_header(data)
+    data = memoryview(data)
+    begins = _unpacked(data[HEADER.size:HEADER.size + 8 * count].cast('q'),
+                       INFINITY_BEGIN_SENTINEL, _INFINITY_BEGIN_EPOCH)
+    ends = _unpacked(data[HEADER.size + 8 * count:HEADER.size + 16 * count].cast('q'),
+                     INFINITY_END_SENTINEL, _INFINITY_END_EPOCH)
+    return TimePeriodSet._from_bounds(begins, ends)
+
+
+def load(fp):
+    """ Deserialize a TimePeriodSet from a binary file object, see `loads` """
+    return loads(fp.read())
+
+
+class MappedTimePeriodSet(object):
+    """ A read-only set of periods, serialized by `dump`, and memory-mapped from a file
+
+    Queries are answered by binary search directly in the mapped file, without loading it nor building any TimePeriod,
+    so that a large file can be shared by many processes.
+
+    :param path: The path of a file written by `dump`
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        count = _read_header(self._mmap)
+        data = memoryview(self._mmap)
+        self._begins = data[HEADER.size:HEADER.size + 8 * count].cast('q')
+        self._ends = data[HEADER.size + 8 * count:HEADER.size + 16 * count].cast('q')
+        if sys.byteorder == 'big':
+            # Bounds cannot be read in place
+            self._begins, self._ends = _byteswapped(self._begins), _byteswapped(self._ends)
+
+    def close(self):
+        """ Unmap the file. The set cannot be used anymore afterwards """
+        for bounds in (self._begins, self._ends):
+            if isinstance(bounds, memoryview):
+                bounds.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _first_index_overlapping(self, begin, end):
+        """ The index of the only period which can overlap [begin, end], or None if no period does """
+        idx = bisect_left(self._ends, begin)
+        if idx < len(self._ends) and self._begins[idx] <= end:
+            return idx
+        return None
+
+    def __contains__(self, item):
+        """ Test if a TimePeriod or datetime.datetime is contained in this set """
+        if isinstance(item, TimePeriod):
+            return self._first_index_overlapping(item._begin_epoch, item._end_epoch) is not None
+        epoch = to_epoch(item)
+        return self._first_index_overlapping(epoch, epoch) is not None
+
+    def count_overlapping(self, period):
+        """ How many periods of this set overlap a TimePeriod """
+        begin_idx = self._first_index_overlapping(period._begin_epoch, period._end_epoch)
+        if begin_idx is None:
+            return 0
+        end_idx = bisect_right(self._begins, period._end_epoch, begin_idx)
+        return end_idx - begin_idx
+
+    def overlapping(self, period):
+        """ All the periods of this set overlapping a TimePeriod
+
+        :rtype: TimePeriodSet
+        """
+        begin_idx = self._first_index_overlapping(period._begin_epoch, period._end_epoch)
+        if begin_idx is None:
+            return TimePeriodSet()
+        end_idx = bisect_right(self._begins, period._end_epoch, begin_idx)
+        period_set = TimePeriodSet()
+        period_set._set_periods([self[idx] for idx in range(begin_idx, end_idx)])
+        return period_set
+
+    def __len__(self):
+        """ Return how many distinct TimePeriod are contained in this set """
+        return len(self._begins)
+
+    def __getitem__(self, item):
+        """ Return the period at index `item` """
+        begin, end = self._begins[item], self._ends[item]
+        return TimePeriod._from_epoch(
+            _INFINITY_BEGIN_EPOCH if begin == INFINITY_BEGIN_SENTINEL else begin,
+            _INFINITY_END_EPOCH if end == INFINITY_END_SENTINEL else end,
+        )
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def to_period_set(self):
+        """ Load all the periods of this set into a TimePeriodSet
+
+        :rtype: TimePeriodSet
+        """
+        period_set = TimePeriodSet()
+        period_set._set_periods(list(self))
+        return period_set
+
+    def __repr__(self):
+        return u"<MappedTimePeriodSet(%s periods)>" % len(self)
+
+
+def _byteswapped(bounds):
+    swapped = array('q', bounds.tobytes())
+    swapped.byteswap()
+    return swapped
@@ -0,0 +1,100 @@
+import heapq
+from operator import attrgetter
+
+from .Period import TimePeriod, UnsortedPeriodsException
+from .PeriodSet import _extended
+
+
+_period_begin = attrgetter('_begin_epoch')
+
+
+def _checked(items):
+    """ Yield the TimePeriod of a stream, raising an UnsortedPeriodsException if they are not sorted by beginning
+
+    :param items: An iterable of TimePeriod or (begin, end) tuples
+    """
+    previous = None
+    for item in items:
+        period = item if isinstance(item, TimePeriod) else TimePeriod(*item)
+        if previous is not None and period._begin_epoch < previous._begin_epoch:
+            raise UnsortedPeriodsException(previous, period)
+        yield period
+        previous = period
+
+
+def _coalesced(periods):
+    """ Yield disjoint periods from a stream sorted by beginning, merging overlapping or adjacent ones on the fly """
+    current, current_end = None, None
+    for period in periods:
+        if current is None:
+            current, current_end = period, period._end_epoch
+        elif period._begin_epoch <= current_end:
+            if period._end_epoch > current_end:
+                current_end = period._end_epoch
+        else:
+            yield _extended(current, current_end)
+            current, current_end = period, period._end_epoch
+    if current is not None:
+        yield _extended(current, current_end)
+
+
+def iter_union(*sorted_iters):
+    """ Union of many sorted streams of periods, computed lazily with a constant amount of memory per stream
+
+    :param sorted_iters: Iterables of TimePeriod or (begin, end) tuples, each one sorted by beginning
+    :return: An iterator of sorted and disjoint TimePeriod
+    """
+    return _coalesced(heapq.merge(*[_checked(items) for items in sorted_iters], key=_period_begin))
+
+
+def iter_intersection(first, second):
+    """ Intersection of two sorted streams of periods, computed lazily with a constant amount of memory
+
+    :param first: An iterable of TimePeriod or (begin, end) tuples, sorted by beginning
+    :param second: Another iterable of TimePeriod or (begin, end) tuples, sorted by beginning
+    :return: An iterator of sorted and disjoint TimePeriod, contained both in first and second
+    """
+    first, second = _coalesced(_checked(first)), _coalesced(_checked(second))
+    period, other_period = next(first, None), next(second, None)
+    while period is not None and other_period is not None:
+        begin = max(period._begin_epoch, other_period._begin_epoch)
+        end = min(period._end_epoch, other_period._end_epoch)
+        if begin < end:
+            if (begin, end) == (period._begin_epoch, period._end_epoch):
+                yield period
+            elif (begin, end) == (other_period._begin_epoch, other_period._end_epoch):
+                yield other_period
+            else:
+                yield TimePeriod._from_epoch(begin, end, period._tzinfo)
+        # The period ending first cannot intersect anything else
+        if period._end_epoch <= other_period._end_epoch:
+            period = next(first, None)
+        else:
+            other_period = next(second, None)
+
+
+def iter_difference(first, second):
+    """ Difference of two sorted streams of periods, computed lazily with a constant amount of memory
+
+    :param first: An iterable of TimePeriod or (begin, end) tuples, sorted by beginning
+    :param second: Another iterable of TimePeriod or (begin, end) tuples, sorted by beginning
+    :return: An iterator of sorted and disjoint TimePeriod, contained in first but not in second
+    """
+    second = _coalesced(_checked(second))
+    other_period = next(second, None)
+    for period in _coalesced(_checked(first)):
+        begin, end = period._begin_epoch, period._end_epoch
+        while other_period is not None and other_period._begin_epoch < end:
+            if other_period._end_epoch <= begin:
+                other_period = next(second, None)
+                continue
+            if other_period._begin_epoch > begin:
+                yield TimePeriod._from_epoch(begin, other_period._begin_epoch, period._tzinfo)
+            if other_period._end_epoch >= end:
+                # other_period may also overlap the next periods of first
+                begin = end
+                break
+            begin = other_period._end_epoch
+            other_period = next(second, None)
+        if begin < end:
+            yield period if begin == period._begin_epoch else TimePeriod._from_epoch(begin, end, period._tzinfo)
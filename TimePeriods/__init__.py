@@ -1,2 +1,15 @@
 from .Period import TimePeriod, INFINITY_BEGIN, INFINITY_END
-from .PeriodSet import TimePeriodSet
+from .PeriodSet import TimePeriodSet, TimePeriodSetView, TimePeriodSetCursor
+from .BlockedPeriodSet import BlockedTimePeriodSet
+from .FrozenPeriodSet import FrozenTimePeriodSet, OperationCache
+from .Coverage import CoverageProfile
+from .IntervalIndex import IntervalIndex
+from .Streaming import iter_union, iter_intersection, iter_difference
+from .Recurrence import RecurringPeriod, DAILY, WEEKLY, MONTHLY
+from .Serialization import MappedTimePeriodSet
+
+try:
+    from .ArrayPeriodSet import ArrayTimePeriodSet
+except ImportError:
+    # numpy is an optional dependency, only needed by ArrayTimePeriodSet
+    pass
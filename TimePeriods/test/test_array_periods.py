@@ -0,0 +1,118 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from operator import and_, or_, sub, xor
+
+from .. import TimePeriod, TimePeriodSet, INFINITY_BEGIN, INFINITY_END
+from ..Calendar import DAILY, WEEKLY, MONTHLY
+
+try:
+    from ..ArrayPeriodSet import ArrayTimePeriodSet
+except ImportError:
+    ArrayTimePeriodSet = None
+
+
+@unittest.skipIf(ArrayTimePeriodSet is None, "numpy is not installed")
+class TestArrayPeriodSet(unittest.TestCase):
+    def setUp(self):
+        super(TestArrayPeriodSet, self).setUp()
+
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+        self.other_period_set = TimePeriodSet(
+            TimePeriod(INFINITY_BEGIN, datetime(1994, 1, 2)),
+            TimePeriod(datetime(1994, 1, 29), datetime(1994, 2, 7)),
+            TimePeriod(datetime(1994, 2, 24), datetime(1994, 3, 5)),
+            TimePeriod(datetime(1994, 3, 27), datetime(1994, 3, 29)),
+            TimePeriod(datetime(1994, 7, 1), datetime(1994, 7, 28)),
+            TimePeriod(datetime(1994, 10, 28), INFINITY_END),
+        )
+        self.array_set = ArrayTimePeriodSet.from_period_set(self.period_set)
+        self.other_array_set = ArrayTimePeriodSet.from_period_set(self.other_period_set)
+
+    def test_00_construction_merges_periods(self):
+        periods = [
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 2, 20), datetime(1994, 3, 5)),
+            TimePeriod(datetime(1994, 3, 5), datetime(1994, 3, 10)),
+        ]
+        self.assertEqual(ArrayTimePeriodSet(periods).periods, TimePeriodSet(periods).periods)
+        self.assertEqual(
+            ArrayTimePeriodSet.from_arrays([p.begin for p in periods], [p.end for p in periods]).to_period_set(),
+            TimePeriodSet(periods),
+        )
+        self.assertEqual(len(ArrayTimePeriodSet()), 0)
+
+    def test_01_round_trip(self):
+        self.assertEqual(self.other_array_set.to_period_set(), self.other_period_set)
+        self.assertEqual(self.other_array_set[0], TimePeriod(INFINITY_BEGIN, datetime(1994, 1, 2)))
+
+    def test_02_operators_match_period_set(self):
+        for operator in ('__or__', '__and__', '__sub__', '__xor__'):
+            self.assertEqual(
+                getattr(self.array_set, operator)(self.other_array_set).periods,
+                getattr(self.period_set, operator)(self.other_period_set).periods,
+            )
+        self.assertEqual(self.array_set.complement().periods, self.period_set.complement().periods)
+        self.assertEqual(self.array_set, ArrayTimePeriodSet.from_period_set(self.period_set))
+
+    def test_03_operators_accept_periods_and_period_sets(self):
+        period = TimePeriod(datetime(1994, 2, 15), datetime(1994, 3, 25))
+        self.assertEqual((self.array_set & period).periods, (self.period_set & period).periods)
+        self.assertEqual(
+            (self.array_set | self.other_period_set).periods,
+            (self.period_set | self.other_period_set).periods,
+        )
+        self.array_set -= period
+        self.assertEqual(self.array_set.periods, (self.period_set - period).periods)
+
+    def test_04_membership(self):
+        dates = [datetime(1994, 2, 1), datetime(1994, 3, 1), datetime(1994, 11, 30), datetime(1995, 1, 1)]
+        self.assertEqual(list(self.array_set.contains_many(dates)), self.period_set.contains_many(dates))
+        self.assertIn(datetime(1994, 3, 25), self.array_set)
+        self.assertNotIn(datetime(1994, 3, 1), self.array_set)
+        self.assertIn(TimePeriod(datetime(1994, 4, 1), datetime(1994, 5, 1)), self.array_set)
+
+    def test_05_total_duration(self):
+        self.assertEqual(self.array_set.total_duration, timedelta(days=27 + 10 + 29))
+        self.assertEqual(ArrayTimePeriodSet().total_duration, timedelta(0))
+
+    def test_06_coverage_histogram(self):
+        for step in (timedelta(hours=7), timedelta(days=3), DAILY, WEEKLY, MONTHLY):
+            for ratio in (False, True):
+                expected = self.other_period_set.coverage_histogram(datetime(1994, 1, 1), datetime(1994, 12, 1, 6),
+                                                                    step, ratio=ratio)
+                histogram = ArrayTimePeriodSet.from_period_set(self.other_period_set).coverage_histogram(
+                    datetime(1994, 1, 1), datetime(1994, 12, 1, 6), step, ratio=ratio)
+                self.assertEqual(histogram.tolist(), expected)
+
+    def test_07_operators_with_a_period_set_on_the_left(self):
+        for operator in (or_, and_, sub, xor):
+            result = operator(self.period_set, self.other_array_set)
+            self.assertIsInstance(result, ArrayTimePeriodSet)
+            self.assertEqual(result.periods, operator(self.period_set, self.other_period_set).periods)
+        expected = (self.period_set & self.other_period_set).periods
+        self.period_set &= self.other_array_set
+        self.assertEqual(self.period_set.periods, expected)
+
+    def test_08_aware_periods(self):
+        paris = timezone(timedelta(hours=1))
+        period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1, tzinfo=paris), datetime(1994, 2, 28, tzinfo=paris)),
+            TimePeriod(datetime(1994, 3, 22, tzinfo=paris), datetime(1994, 4, 1, tzinfo=paris)),
+        )
+        array_set = ArrayTimePeriodSet.from_period_set(period_set)
+        self.assertEqual(array_set[0].begin, datetime(1994, 2, 1, tzinfo=paris))
+        self.assertEqual([period.end.tzinfo for period in array_set], [paris, paris])
+        self.assertEqual(array_set.to_period_set()[1].begin.tzinfo, paris)
+        self.assertEqual(ArrayTimePeriodSet(period_set.periods)[0].begin.tzinfo, paris)
+        for result in (self.array_set & period_set, period_set & self.array_set, array_set - self.period_set,
+                       self.period_set - array_set, array_set.complement(), array_set[:1]):
+            self.assertEqual([period.begin.tzinfo for period in result], [paris] * len(result))
+
+
+if __name__ == '__main__':
+    unittest.main()
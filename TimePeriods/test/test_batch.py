@@ -0,0 +1,71 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from .. import TimePeriod, TimePeriodSet
+from ..Batch import intersect_pairs, union_pairs
+
+
+def _random_set(rng):
+    base = datetime(1994, 1, 1)
+    periods = []
+    for _ in range(20):
+        begin = base + timedelta(hours=rng.randint(0, 1000))
+        periods.append(TimePeriod(begin, begin + timedelta(hours=rng.randint(1, 30), minutes=rng.randint(1, 59))))
+    return TimePeriodSet(periods)
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        super(TestBatch, self).setUp()
+        rng = random.Random(42)
+        self.pairs = [(_random_set(rng), _random_set(rng)) for _ in range(30)]
+
+    def test_00_intersect_pairs(self):
+        expected = [TimePeriodSet.intersection_all(first, second) for first, second in self.pairs]
+        self.assertEqual(list(intersect_pairs(self.pairs, workers=1)), expected)
+        self.assertEqual(list(intersect_pairs(iter(self.pairs), workers=2, chunksize=4)), expected)
+
+    def test_01_union_pairs(self):
+        expected = [first | second for first, second in self.pairs]
+        self.assertEqual(list(union_pairs(self.pairs, workers=0)), expected)
+        self.assertEqual(list(union_pairs(iter(self.pairs), workers=2, chunksize=4)), expected)
+
+    def test_02_results_are_streamed(self):
+        results = union_pairs(self.pairs, workers=2, chunksize=1)
+        self.assertEqual(next(results), self.pairs[0][0] | self.pairs[0][1])
+        results.close()
+
+    def test_03_pairs_are_read_as_needed(self):
+        pulled = []
+
+        def pairs():
+            for pair in self.pairs:
+                pulled.append(pair)
+                yield pair
+
+        results = union_pairs(pairs(), workers=2, chunksize=2)
+        next(results)
+        # At most two chunks per worker are in flight
+        self.assertLessEqual(len(pulled), 2 * 2 * 2)
+        self.assertEqual(len(list(results)), len(self.pairs) - 1)
+
+    def test_04_pairs_of_periods(self):
+        first = TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28))
+        pairs = [
+            (first, TimePeriod(datetime(1994, 2, 15), datetime(1994, 3, 15))),
+            (first, TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 15))),
+        ]
+        for workers in (1, 2):
+            self.assertEqual(list(intersect_pairs(pairs, workers=workers)), [
+                TimePeriodSet(TimePeriod(datetime(1994, 2, 15), datetime(1994, 2, 28))),
+                TimePeriodSet(),
+            ])
+            self.assertEqual(list(union_pairs(pairs, workers=workers)), [
+                TimePeriodSet(TimePeriod(datetime(1994, 2, 1), datetime(1994, 3, 15))),
+                TimePeriodSet(first, TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 15))),
+            ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from .. import TimePeriod, TimePeriodSet, BlockedTimePeriodSet
+from ..BlockedPeriodSet import BlockedList
+
+
+class SmallBlockedList(BlockedList):
+    load = 4
+
+
+class SmallBlockedTimePeriodSet(BlockedTimePeriodSet):
+    _storage = SmallBlockedList
+
+
+class TestBlockedList(unittest.TestCase):
+    def test_00_sequence(self):
+        items = SmallBlockedList(range(20))
+        self.assertEqual(len(items), 20)
+        self.assertEqual(list(items), list(range(20)))
+        self.assertEqual(items[5], 5)
+        self.assertEqual(items[-1], 19)
+        self.assertEqual(items[3:11], list(range(3, 11)))
+        self.assertEqual(items[::5], [0, 5, 10, 15])
+        with self.assertRaises(IndexError):
+            items[20]
+
+    def test_01_slice_assignment(self):
+        expected = list(range(20))
+        items = SmallBlockedList(expected)
+        rand = random.Random(1994)
+        for _ in range(500):
+            start = rand.randint(0, len(expected))
+            stop = rand.randint(start, min(len(expected), start + 12))
+            values = [rand.randint(0, 100) for _ in range(rand.randint(0, 12))]
+            items[start:stop] = values
+            expected[start:stop] = values
+            self.assertEqual(list(items), expected)
+            self.assertEqual(len(items), len(expected))
+            if expected:
+                idx = rand.randrange(len(expected))
+                self.assertEqual(items[idx], expected[idx])
+        del items[:]
+        self.assertEqual(list(items), [])
+        items[0:0] = [1, 2]
+        self.assertEqual(list(items), [1, 2])
+
+    def test_02_bisect(self):
+        items = SmallBlockedList(range(0, 100, 2))
+        self.assertEqual(items.bisect_left(10), 5)
+        self.assertEqual(items.bisect_right(10), 6)
+        self.assertEqual(items.bisect_left(11), 6)
+        self.assertEqual(items.bisect_left(-1), 0)
+        self.assertEqual(items.bisect_left(200), 50)
+        self.assertEqual(items.bisect_left(10, 8), 8)
+        self.assertEqual(items.bisect_right(80, 0, 20), 20)
+        self.assertEqual(SmallBlockedList().bisect_left(1), 0)
+
+
+class TestBlockedTimePeriodSet(unittest.TestCase):
+    def test_00_same_as_period_set(self):
+        rand = random.Random(1994)
+        origin = datetime(1994, 2, 1)
+        blocked, period_set = SmallBlockedTimePeriodSet(), TimePeriodSet()
+        for _ in range(1000):
+            begin = origin + timedelta(hours=rand.randint(0, 2000))
+            period = TimePeriod(begin, begin + timedelta(hours=rand.randint(1, 30)))
+            if rand.random() < 0.6:
+                blocked.add(period)
+                period_set.add(period)
+            else:
+                blocked.discard(period)
+                period_set -= period
+            self.assertEqual(len(blocked), len(period_set))
+        self.assertEqual(list(blocked), list(period_set))
+        self.assertEqual(blocked.total_duration, period_set.total_duration)
+        self.assertEqual(blocked.gaps(), period_set.gaps())
+        for _ in range(200):
+            date = origin + timedelta(hours=rand.randint(-10, 2050))
+            self.assertEqual(date in blocked, date in period_set)
+            self.assertEqual(blocked.next_period(date), period_set.next_period(date))
+
+    def test_01_operators(self):
+        blocked = SmallBlockedTimePeriodSet(
+            TimePeriod(datetime(1994, 2, day), datetime(1994, 2, day, 12)) for day in range(1, 28)
+        )
+        other = TimePeriodSet(TimePeriod(datetime(1994, 2, 3, 6), datetime(1994, 2, 10, 6)))
+        self.assertIsInstance(blocked | other, BlockedTimePeriodSet)
+        self.assertEqual(list(blocked | other), list(TimePeriodSet(*blocked) | other))
+        self.assertEqual(list(blocked - other), list(TimePeriodSet(*blocked) - other))
+        self.assertEqual(list(blocked & other), list(TimePeriodSet.intersection_all(TimePeriodSet(*blocked), other)))
+        self.assertEqual(blocked[3], TimePeriod(datetime(1994, 2, 4), datetime(1994, 2, 4, 12)))
+        self.assertEqual(len(blocked.window(datetime(1994, 2, 5, 6), datetime(1994, 2, 8, 6))), 4)
+
+    def test_02_copy(self):
+        blocked = SmallBlockedTimePeriodSet(
+            TimePeriod(datetime(1994, 2, day), datetime(1994, 2, day, 12)) for day in range(1, 28)
+        )
+        copy = blocked.copy()
+        blocked.discard(TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 10)))
+        self.assertEqual(len(blocked), 18)
+        self.assertEqual(len(copy), 27)
+
+
+if __name__ == '__main__':
+    unittest.main()
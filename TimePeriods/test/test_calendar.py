@@ -0,0 +1,48 @@
+import unittest
+from datetime import datetime, timedelta
+
+from .. import INFINITY_END
+from ..Calendar import DAILY, WEEKLY, MONTHLY, floor_date, iter_boundaries, bin_edges
+from ..Period import from_epoch
+
+
+class TestCalendar(unittest.TestCase):
+    def test_00_floor_date(self):
+        date = datetime(1994, 2, 10, 13, 30)
+        self.assertEqual(floor_date(date, DAILY), datetime(1994, 2, 10))
+        self.assertEqual(floor_date(date, WEEKLY), datetime(1994, 2, 7))
+        self.assertEqual(floor_date(date, MONTHLY), datetime(1994, 2, 1))
+        with self.assertRaises(ValueError):
+            floor_date(date, 'yearly')
+
+    def test_01_fixed_boundaries(self):
+        boundaries = iter_boundaries(datetime(1994, 2, 1, 10, 20), datetime(1994, 2, 1, 13), timedelta(hours=1))
+        self.assertEqual([from_epoch(boundary) for boundary in boundaries],
+                         [datetime(1994, 2, 1, 11), datetime(1994, 2, 1, 12)])
+        boundaries = iter_boundaries(datetime(1994, 2, 1, 10, 20), datetime(1994, 2, 1, 13), timedelta(hours=1),
+                                     origin=datetime(1994, 2, 1, 10, 20))
+        self.assertEqual([from_epoch(boundary) for boundary in boundaries],
+                         [datetime(1994, 2, 1, 11, 20), datetime(1994, 2, 1, 12, 20)])
+        with self.assertRaises(ValueError):
+            list(iter_boundaries(datetime(1994, 2, 1), datetime(1994, 2, 2), timedelta(0)))
+
+    def test_02_calendar_boundaries(self):
+        boundaries = iter_boundaries(datetime(1994, 1, 31, 12), datetime(1994, 4, 1), MONTHLY)
+        self.assertEqual([from_epoch(boundary) for boundary in boundaries],
+                         [datetime(1994, 2, 1), datetime(1994, 3, 1)])
+        boundaries = iter_boundaries(datetime(1994, 2, 7), datetime(1994, 2, 22), WEEKLY)
+        self.assertEqual([from_epoch(boundary) for boundary in boundaries],
+                         [datetime(1994, 2, 14), datetime(1994, 2, 21)])
+        boundaries = iter_boundaries(datetime(9999, 12, 30, 12), INFINITY_END, DAILY)
+        self.assertEqual([from_epoch(boundary) for boundary in boundaries], [datetime(9999, 12, 31)])
+
+    def test_03_bin_edges(self):
+        edges = bin_edges(datetime(1994, 2, 1, 10, 20), datetime(1994, 2, 1, 12, 30), timedelta(hours=1))
+        self.assertEqual([from_epoch(edge) for edge in edges], [
+            datetime(1994, 2, 1, 10, 20), datetime(1994, 2, 1, 11, 20), datetime(1994, 2, 1, 12, 20),
+            datetime(1994, 2, 1, 12, 30),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
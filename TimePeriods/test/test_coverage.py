@@ -0,0 +1,56 @@
+import unittest
+from datetime import datetime
+
+from .. import TimePeriod, TimePeriodSet, CoverageProfile, INFINITY_BEGIN, INFINITY_END
+
+
+class TestCoverageProfile(unittest.TestCase):
+    def setUp(self):
+        super(TestCoverageProfile, self).setUp()
+        self.shifts = [
+            TimePeriodSet(TimePeriod(datetime(1994, 2, 1, 8), datetime(1994, 2, 1, 16))),
+            TimePeriodSet(TimePeriod(datetime(1994, 2, 1, 10), datetime(1994, 2, 1, 18))),
+            TimePeriodSet(
+                TimePeriod(datetime(1994, 2, 1, 6), datetime(1994, 2, 1, 11)),
+                TimePeriod(datetime(1994, 2, 1, 14), datetime(1994, 2, 1, 20)),
+            ),
+        ]
+        self.profile = CoverageProfile(*self.shifts)
+
+    def test_00_depth_at(self):
+        self.assertEqual(self.profile.depth_at(datetime(1994, 2, 1, 5)), 0)
+        self.assertEqual(self.profile.depth_at(datetime(1994, 2, 1, 6)), 1)
+        self.assertEqual(self.profile.depth_at(datetime(1994, 2, 1, 10, 30)), 3)
+        self.assertEqual(self.profile.depth_at(datetime(1994, 2, 1, 12)), 2)
+        self.assertEqual(self.profile.depth_at(datetime(1994, 2, 1, 20)), 0)
+
+    def test_01_max_depth(self):
+        self.assertEqual(self.profile.max_depth(), 3)
+        self.assertEqual(CoverageProfile().max_depth(), 0)
+
+    def test_02_at_least(self):
+        self.assertEqual(self.profile.at_least(1), TimePeriodSet.union_all(*self.shifts))
+        self.assertEqual(self.profile.at_least(3), TimePeriodSet.intersection_all(*self.shifts))
+        self.assertEqual(self.profile.at_least(2), TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1, 8), datetime(1994, 2, 1, 18)),
+        ))
+        self.assertEqual(self.profile.at_least(4), TimePeriodSet())
+        self.assertRaises(ValueError, self.profile.at_least, 0)
+
+    def test_03_raw_overlapping_periods(self):
+        profile = CoverageProfile([
+            TimePeriod(INFINITY_BEGIN, datetime(1994, 2, 10)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 10)),
+            TimePeriod(datetime(1994, 2, 1), INFINITY_END),
+        ], TimePeriod(datetime(1994, 2, 10), datetime(1994, 2, 11)))
+        self.assertEqual(list(profile.steps()), [
+            (TimePeriod(INFINITY_BEGIN, datetime(1994, 2, 1)), 1),
+            (TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 10)), 3),
+            (TimePeriod(datetime(1994, 2, 10), datetime(1994, 2, 11)), 2),
+            (TimePeriod(datetime(1994, 2, 11), INFINITY_END), 1),
+        ])
+        self.assertEqual(profile.at_least(1), TimePeriodSet(TimePeriod(INFINITY_BEGIN, INFINITY_END)))
+
+
+if __name__ == '__main__':
+    unittest.main()
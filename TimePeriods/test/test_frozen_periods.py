@@ -0,0 +1,99 @@
+import pickle
+import unittest
+from datetime import datetime
+
+from .. import TimePeriod, TimePeriodSet, FrozenTimePeriodSet, OperationCache
+
+
+class TestFrozenTimePeriodSet(unittest.TestCase):
+    def setUp(self):
+        super(TestFrozenTimePeriodSet, self).setUp()
+        self.periods = [
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        ]
+        self.frozen = FrozenTimePeriodSet(*self.periods)
+        self.other = FrozenTimePeriodSet(TimePeriod(datetime(1994, 2, 20), datetime(1994, 3, 25)))
+
+    def tearDown(self):
+        FrozenTimePeriodSet.disable_cache()
+        super(TestFrozenTimePeriodSet, self).tearDown()
+
+    def test_00_period_hash(self):
+        self.assertEqual(hash(self.periods[0]), hash(TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28))))
+        self.assertEqual(len({self.periods[0], TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28))}), 1)
+
+    def test_01_hash_and_fingerprint(self):
+        same = FrozenTimePeriodSet(*reversed(self.periods))
+        self.assertEqual(self.frozen, same)
+        self.assertEqual(hash(self.frozen), hash(same))
+        self.assertEqual(self.frozen.fingerprint, same.fingerprint)
+        self.assertNotEqual(self.frozen.fingerprint, self.other.fingerprint)
+        self.assertNotEqual(self.frozen, self.other)
+        self.assertEqual(self.frozen, TimePeriodSet(*self.periods))
+        self.assertEqual({self.frozen: 1}[same], 1)
+        self.assertEqual(pickle.loads(pickle.dumps(self.frozen)).fingerprint, self.frozen.fingerprint)
+
+    def test_02_immutable(self):
+        frozen = self.frozen
+        frozen |= TimePeriod(datetime(1994, 12, 1), datetime(1994, 12, 2))
+        self.assertEqual(len(frozen), 4)
+        self.assertEqual(len(self.frozen), 3)
+        frozen -= self.other
+        self.assertIsInstance(frozen, FrozenTimePeriodSet)
+        self.assertEqual(len(self.frozen), 3)
+        with self.assertRaises(TypeError):
+            self.frozen.add(TimePeriod(datetime(1994, 12, 1), datetime(1994, 12, 2)))
+        with self.assertRaises(TypeError):
+            self.frozen.discard(self.periods[0])
+        self.assertIs(self.frozen.copy(), self.frozen)
+
+    def test_03_operators(self):
+        period_set = TimePeriodSet(*self.periods)
+        self.assertEqual(self.frozen | self.other, period_set | self.other)
+        self.assertEqual(self.frozen & self.other, period_set & self.other)
+        self.assertEqual(self.frozen - self.other, period_set - self.other)
+        self.assertEqual(self.frozen ^ self.other, period_set ^ self.other)
+        self.assertIsInstance(self.frozen | self.other, FrozenTimePeriodSet)
+        self.assertIsInstance(self.frozen & period_set, FrozenTimePeriodSet)
+        self.assertEqual(self.frozen | self.periods[0], self.frozen)
+
+    def test_04_cache(self):
+        self.assertIsNone(FrozenTimePeriodSet.cache)
+        cache = FrozenTimePeriodSet.enable_cache(maxsize=2)
+        result = self.frozen & self.other
+        self.assertIs(self.frozen & self.other, result)
+        self.assertIs(FrozenTimePeriodSet(*self.periods) & self.other, result)
+        self.assertEqual(cache.cache_info(), (2, 1, 0, 2, 1))
+        self.frozen | self.other
+        self.frozen - self.other
+        self.assertEqual(cache.cache_info(), (2, 3, 1, 2, 2))
+        self.assertIsNot(self.frozen & self.other, result)
+        self.assertEqual(cache.cache_info().evictions, 2)
+        # Operations with sets which are not frozen are not memoized
+        self.frozen & TimePeriodSet(*self.other)
+        self.assertEqual(cache.cache_info().misses, 4)
+        cache.clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 0, 2, 0))
+
+    def test_05_cache_size(self):
+        with self.assertRaises(ValueError):
+            OperationCache(0)
+
+    def test_06_cached_results_cannot_be_modified(self):
+        FrozenTimePeriodSet.enable_cache()
+        result = self.frozen & self.other
+        self.assertIsInstance(result.periods, tuple)
+        self.assertEqual(result.periods, (
+            TimePeriod(datetime(1994, 2, 20), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 3, 25)),
+        ))
+        with self.assertRaises(AttributeError):
+            result.periods.clear()
+        self.assertIs(self.frozen & self.other, result)
+        self.assertEqual(len(self.frozen & self.other), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
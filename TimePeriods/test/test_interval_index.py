@@ -0,0 +1,71 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from .. import TimePeriod, IntervalIndex, INFINITY_BEGIN, INFINITY_END
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def setUp(self):
+        super(TestIntervalIndex, self).setUp()
+        self.bookings = [
+            (TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)), u"room 1"),
+            (TimePeriod(datetime(1994, 2, 10), datetime(1994, 2, 12)), u"room 2"),
+            (TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)), u"room 3"),
+            (TimePeriod(datetime(1994, 3, 22), INFINITY_END), u"room 4"),
+            (TimePeriod(INFINITY_BEGIN, datetime(1994, 1, 1)), u"room 5"),
+        ]
+        self.index = IntervalIndex(self.bookings)
+
+    def test_00_overlapping_datetime(self):
+        self.assertEqual([payload for _, payload in self.index.overlapping(datetime(1994, 2, 11))],
+                         [u"room 1", u"room 3", u"room 2"])
+        self.assertEqual(self.index.overlapping(datetime(1994, 3, 1)), [])
+        self.assertEqual([payload for _, payload in self.index.overlapping(datetime(2042, 1, 1))], [u"room 4"])
+
+    def test_01_overlapping_period(self):
+        period = TimePeriod(datetime(1993, 12, 31), datetime(1994, 2, 1))
+        self.assertEqual([payload for _, payload in self.index.overlapping(period)],
+                         [u"room 5", u"room 1", u"room 3"])
+
+    def test_02_insert_and_remove(self):
+        self.index.insert(TimePeriod(datetime(1994, 2, 27), datetime(1994, 3, 2)), u"room 6")
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual([payload for _, payload in self.index.overlapping(datetime(1994, 3, 1))], [u"room 6"])
+        self.index.remove(TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)), u"room 3")
+        self.assertEqual([payload for _, payload in self.index.overlapping(datetime(1994, 2, 2))], [u"room 1"])
+        self.index.remove(TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)))
+        self.assertEqual(self.index.overlapping(datetime(1994, 2, 2)), [])
+        self.assertEqual(len(self.index), 4)
+        self.assertRaises(KeyError, self.index.remove, TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)))
+        self.assertRaises(KeyError, self.index.remove, self.bookings[1][0], u"room 1")
+
+    def test_03_matches_linear_scan(self):
+        rng = random.Random(42)
+        base = datetime(1994, 1, 1)
+        items = []
+        index = IntervalIndex()
+        for idx in range(500):
+            begin = base + timedelta(hours=rng.randint(0, 2000))
+            item = (TimePeriod(begin, begin + timedelta(hours=rng.randint(1, 100))), idx)
+            items.append(item)
+            index.insert(*item)
+        for item in items[::3]:
+            index.remove(*item)
+        items = [item for idx, item in enumerate(items) if idx % 3]
+        self.assertEqual(len(index), len(items))
+        for _ in range(100):
+            begin = base + timedelta(hours=rng.randint(0, 2100))
+            query = TimePeriod(begin, begin + timedelta(hours=rng.randint(1, 10)))
+            self.assertEqual(
+                sorted(payload for _, payload in index.overlapping(query)),
+                sorted(payload for period, payload in items if query in period),
+            )
+        self.assertEqual(
+            [payload for _, payload in IntervalIndex(items)],
+            [payload for _, payload in sorted(items, key=lambda item: (item[0].begin, item[0].end, item[1]))],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
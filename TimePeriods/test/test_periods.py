@@ -1,7 +1,10 @@
+import pickle
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from .. import TimePeriod, TimePeriodSet, INFINITY_BEGIN, INFINITY_END
+from ..Calendar import DAILY, MONTHLY
+from ..Period import InvalidPeriodException, SeparatePeriodsExceptions, to_epoch
 
 
 class TestPeriodSet(unittest.TestCase):
@@ -407,5 +410,883 @@ class TestPeriodSet(unittest.TestCase):
         self.assertEqual(self.period_set & infinite_period, expected_intersection)
 
 
+class TestPeriod(unittest.TestCase):
+    def test_00_bounds_are_exposed_as_datetimes(self):
+        period = TimePeriod(datetime(1994, 2, 1, 8, 30, 0, 12), datetime(1994, 2, 28))
+        self.assertEqual(period.begin, datetime(1994, 2, 1, 8, 30, 0, 12))
+        self.assertEqual(period.end, datetime(1994, 2, 28))
+        self.assertEqual(period.duration, datetime(1994, 2, 28) - datetime(1994, 2, 1, 8, 30, 0, 12))
+
+    def test_01_lazy_bounds_from_epoch(self):
+        period = TimePeriod(INFINITY_BEGIN, INFINITY_END).copy()
+        self.assertEqual(period.begin, INFINITY_BEGIN)
+        self.assertEqual(period.end, INFINITY_END)
+        union = TimePeriod(None, datetime(1994, 2, 1)) | TimePeriod(datetime(1994, 1, 1), None)
+        self.assertEqual((union.begin, union.end), (INFINITY_BEGIN, INFINITY_END))
+
+    def test_02_period_has_no_instance_dict(self):
+        self.assertFalse(hasattr(TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)), '__dict__'))
+
+    def test_03_comparisons(self):
+        first = TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28))
+        second = TimePeriod(datetime(1994, 2, 2), datetime(1994, 2, 3))
+        self.assertLess(first, second)
+        self.assertIn(datetime(1994, 2, 28), first)
+        self.assertIn(second, first)
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(first, None)
+        self.assertEqual(first & second, second)
+
+    def test_04_intersection_of_periods(self):
+        first = TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28))
+        second = TimePeriod(datetime(1994, 2, 15), datetime(1994, 3, 15))
+        self.assertEqual(first & second, TimePeriod(datetime(1994, 2, 15), datetime(1994, 2, 28)))
+        self.assertEqual(second & first, TimePeriod(datetime(1994, 2, 15), datetime(1994, 2, 28)))
+        with self.assertRaises(InvalidPeriodException):
+            first & TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 15))
+        with self.assertRaises(SeparatePeriodsExceptions):
+            first & TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 15))
+
+    def test_05_aware_bounds(self):
+        paris = timezone(timedelta(hours=1))
+        period = TimePeriod(datetime(1994, 2, 1, tzinfo=timezone.utc), datetime(1994, 2, 28, tzinfo=timezone.utc))
+        self.assertEqual(period.begin, datetime(1994, 2, 1, tzinfo=timezone.utc))
+        self.assertIs(period.end.tzinfo, timezone.utc)
+        self.assertEqual(period, TimePeriod(
+            datetime(1994, 2, 1, 1, tzinfo=paris), datetime(1994, 2, 28, 1, tzinfo=paris),
+        ))
+        self.assertNotIn(datetime(1994, 2, 1, 0, 30, tzinfo=paris), period)
+        self.assertIn(datetime(1994, 2, 28, 0, 30, tzinfo=paris), period)
+
+        other = TimePeriod(datetime(1994, 2, 15, tzinfo=paris), datetime(1994, 3, 15, tzinfo=paris))
+        self.assertEqual((period & other).begin.tzinfo, paris)
+        self.assertEqual((period | other).end, datetime(1994, 3, 14, 23, tzinfo=timezone.utc))
+        self.assertEqual([chunk.begin for chunk in other.split(MONTHLY)], [
+            datetime(1994, 2, 15, tzinfo=paris), datetime(1994, 3, 1, tzinfo=paris),
+        ])
+        self.assertEqual(pickle.loads(pickle.dumps(other)).begin, datetime(1994, 2, 15, tzinfo=paris))
+        self.assertEqual(pickle.loads(pickle.dumps(other)).begin.tzinfo, paris)
+        with self.assertRaises(TypeError):
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28, tzinfo=paris))
+
+
+class TestPeriodSetConstruction(unittest.TestCase):
+    def test_00_from_periods_merges_unsorted_periods(self):
+        period_set = TimePeriodSet.from_periods([
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 2, 20), datetime(1994, 3, 5)),
+            TimePeriod(datetime(1994, 3, 5), datetime(1994, 3, 10)),
+        ])
+        self.assertEqual(period_set.periods, [
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 3, 10)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+        ])
+
+    def test_01_from_periods_assume_sorted(self):
+        periods = [
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 2, 3), datetime(1994, 2, 5)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+        ]
+        period_set = TimePeriodSet.from_periods(iter(periods), assume_sorted=True)
+        self.assertEqual(period_set.periods, [periods[0], periods[2]])
+        self.assertIs(period_set[0], periods[0])
+
+    def test_02_init_matches_from_periods(self):
+        periods = [
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+        ]
+        self.assertEqual(
+            TimePeriodSet(periods, TimePeriod(datetime(1994, 2, 27), datetime(1994, 3, 2))),
+            TimePeriodSet.from_periods(periods + [TimePeriod(datetime(1994, 2, 27), datetime(1994, 3, 2))]),
+        )
+        self.assertEqual(len(TimePeriodSet()), 0)
+
+
+class TestPeriodSetInsertion(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetInsertion, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+
+    def _assert_index_consistent(self, period_set):
+        self.assertEqual(period_set._begins, [to_epoch(period.begin) for period in period_set])
+        self.assertEqual(period_set._ends, [to_epoch(period.end) for period in period_set])
+
+    def test_00_insert_between_periods(self):
+        period = TimePeriod(datetime(1994, 6, 1), datetime(1994, 6, 30))
+        self.period_set |= period
+        self.assertEqual(len(self.period_set), 4)
+        self.assertIs(self.period_set[2], period)
+        self._assert_index_consistent(self.period_set)
+
+    def test_01_insert_merging_several_periods(self):
+        self.period_set |= TimePeriod(datetime(1994, 2, 28), datetime(1994, 11, 1))
+        self.assertEqual(self.period_set.periods, [TimePeriod(datetime(1994, 2, 1), datetime(1994, 11, 30))])
+        self._assert_index_consistent(self.period_set)
+
+    def test_02_insert_contained_period_is_noop(self):
+        original = self.period_set[1]
+        self.period_set |= TimePeriod(datetime(1994, 3, 23), datetime(1994, 3, 25))
+        self.assertIs(self.period_set[1], original)
+        self.assertEqual(len(self.period_set), 3)
+
+    def test_03_insert_many_matches_bulk_constructor(self):
+        periods = [
+            TimePeriod(datetime(1994, 1, (day * 7) % 28 + 1), datetime(1994, 1, (day * 7) % 28 + 2))
+            for day in range(28)
+        ] + [TimePeriod(datetime(1993, 12, 1), datetime(1993, 12, 2))]
+        period_set = TimePeriodSet()
+        for period in periods:
+            period_set |= period
+        self.assertEqual(period_set, TimePeriodSet.from_periods(periods))
+        self._assert_index_consistent(period_set)
+
+    def test_04_union_of_sets_keeps_unchanged_periods(self):
+        other = TimePeriodSet(
+            TimePeriod(datetime(1994, 1, 1), datetime(1994, 1, 10)),
+            TimePeriod(datetime(1994, 3, 30), datetime(1994, 5, 1)),
+        )
+        union = self.period_set | other
+        self.assertEqual(union.periods, [
+            TimePeriod(datetime(1994, 1, 1), datetime(1994, 1, 10)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 5, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        ])
+        self.assertIs(union[0], other[0])
+        self._assert_index_consistent(union)
+        self.period_set |= TimePeriodSet()
+        self.assertEqual(len(self.period_set), 3)
+
+
+class TestPeriodSetMembership(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetMembership, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), INFINITY_END),
+        )
+
+    def test_00_datetime_membership(self):
+        self.assertIn(datetime(1994, 2, 1), self.period_set)
+        self.assertIn(datetime(1994, 4, 1), self.period_set)
+        self.assertIn(datetime(2042, 1, 1), self.period_set)
+        self.assertNotIn(datetime(1994, 1, 31), self.period_set)
+        self.assertNotIn(datetime(1994, 3, 1), self.period_set)
+        self.assertNotIn(datetime(1994, 3, 1), TimePeriodSet())
+
+    def test_01_period_membership(self):
+        self.assertIn(TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 1)), self.period_set)
+        self.assertIn(TimePeriod(INFINITY_BEGIN, datetime(1994, 2, 2)), self.period_set)
+        self.assertNotIn(TimePeriod(datetime(1994, 4, 2), datetime(1994, 10, 31)), self.period_set)
+
+    def test_02_contains_many(self):
+        dates = [
+            datetime(1994, 11, 15),
+            datetime(1994, 1, 1),
+            datetime(1994, 3, 25),
+            datetime(1994, 3, 1),
+            datetime(1994, 2, 1),
+            datetime(1994, 3, 25),
+        ]
+        self.assertEqual(self.period_set.contains_many(dates), [date in self.period_set for date in dates])
+        self.assertEqual(self.period_set.contains_many([]), [])
+        self.assertEqual(TimePeriodSet().contains_many(dates), [False] * len(dates))
+
+
+class TestPeriodSetDifference(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetDifference, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+        self.other_period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 1, 29), datetime(1994, 2, 7)),
+            TimePeriod(datetime(1994, 2, 24), datetime(1994, 3, 5)),
+            TimePeriod(datetime(1994, 3, 27), datetime(1994, 3, 29)),
+            TimePeriod(datetime(1994, 10, 28), datetime(1994, 12, 8)),
+        )
+
+    def test_00_difference_of_sets(self):
+        self.assertEqual(self.period_set - self.other_period_set, TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 7), datetime(1994, 2, 24)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 3, 27)),
+            TimePeriod(datetime(1994, 3, 29), datetime(1994, 4, 1)),
+        ))
+        self.assertEqual(len(self.period_set), 3)
+
+    def test_01_difference_with_period(self):
+        self.period_set -= TimePeriod(datetime(1994, 2, 28), datetime(1994, 11, 15))
+        self.assertEqual(self.period_set, TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 11, 15), datetime(1994, 11, 30)),
+        ))
+
+    def test_02_difference_keeps_untouched_periods(self):
+        difference = self.period_set - TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 15))
+        self.assertIs(difference[0], self.period_set[0])
+        self.assertIs(difference[1], self.period_set[1])
+
+    def test_03_symmetric_difference(self):
+        expected = TimePeriodSet(
+            TimePeriod(datetime(1994, 1, 29), datetime(1994, 2, 1)),
+            TimePeriod(datetime(1994, 2, 7), datetime(1994, 2, 24)),
+            TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 5)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 3, 27)),
+            TimePeriod(datetime(1994, 3, 29), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 10, 28), datetime(1994, 11, 1)),
+            TimePeriod(datetime(1994, 11, 30), datetime(1994, 12, 8)),
+        )
+        self.assertEqual(self.period_set ^ self.other_period_set, expected)
+        self.assertEqual(self.other_period_set ^ self.period_set, expected)
+        self.period_set ^= self.period_set.copy()
+        self.assertEqual(self.period_set, TimePeriodSet())
+
+    def test_04_complement(self):
+        self.assertEqual(self.period_set.complement(), TimePeriodSet(
+            TimePeriod(INFINITY_BEGIN, datetime(1994, 2, 1)),
+            TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 22)),
+            TimePeriod(datetime(1994, 4, 1), datetime(1994, 11, 1)),
+            TimePeriod(datetime(1994, 11, 30), INFINITY_END),
+        ))
+        self.assertEqual(
+            self.period_set.complement(within=TimePeriod(datetime(1994, 2, 15), datetime(1994, 3, 25))),
+            TimePeriodSet(TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 22))),
+        )
+        self.assertEqual(TimePeriodSet().complement(), TimePeriodSet(TimePeriod(INFINITY_BEGIN, INFINITY_END)))
+        self.assertEqual(TimePeriodSet(TimePeriod(INFINITY_BEGIN, INFINITY_END)).complement(), TimePeriodSet())
+
+    def test_05_complement_union_is_everything(self):
+        self.assertEqual(
+            self.period_set | self.period_set.complement(),
+            TimePeriodSet(TimePeriod(INFINITY_BEGIN, INFINITY_END)),
+        )
+
+    def test_06_symmetric_difference_with_unsupported_operand(self):
+        with self.assertRaises(TypeError):
+            self.period_set ^ 3
+
+    def test_07_aware_periods(self):
+        paris = timezone(timedelta(hours=1))
+        period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1, tzinfo=paris), datetime(1994, 2, 28, tzinfo=paris)),
+            TimePeriod(datetime(1994, 3, 22, tzinfo=paris), datetime(1994, 4, 1, tzinfo=paris)),
+        )
+        difference = period_set - TimePeriod(datetime(1994, 2, 7, tzinfo=paris), datetime(1994, 3, 27, tzinfo=paris))
+        self.assertEqual([(period.begin, period.end) for period in difference], [
+            (datetime(1994, 2, 1, tzinfo=paris), datetime(1994, 2, 7, tzinfo=paris)),
+            (datetime(1994, 3, 27, tzinfo=paris), datetime(1994, 4, 1, tzinfo=paris)),
+        ])
+        self.assertEqual(difference[1].begin.tzinfo, paris)
+        self.assertEqual(period_set.span.end.tzinfo, paris)
+        self.assertEqual(period_set.gaps()[0].begin, datetime(1994, 2, 28, tzinfo=paris))
+        # Aware and naive dates are compared as UTC
+        self.assertIn(datetime(1994, 1, 31, 23, 30), period_set)
+
+
+class TestPeriodSetCopy(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetCopy, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+        )
+
+    def test_00_copy_shares_periods(self):
+        copy = self.period_set.copy()
+        self.assertEqual(copy, self.period_set)
+        self.assertIs(copy[0], self.period_set[0])
+
+    def test_01_modifying_copy_leaves_original_unaltered(self):
+        copy = self.period_set.copy()
+        copy |= TimePeriod(datetime(1994, 6, 1), datetime(1994, 6, 30))
+        self.assertEqual(len(copy), 3)
+        self.assertEqual(len(self.period_set), 2)
+        self.assertEqual(self.period_set._begins, [to_epoch(datetime(1994, 2, 1)), to_epoch(datetime(1994, 3, 22))])
+
+    def test_02_modifying_original_leaves_copy_unaltered(self):
+        copy = self.period_set.copy()
+        self.period_set |= TimePeriod(datetime(1994, 1, 1), datetime(1994, 1, 30))
+        self.period_set -= TimePeriod(datetime(1994, 3, 22), datetime(1994, 3, 25))
+        self.assertEqual(copy, TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+        ))
+
+    def test_03_chained_operators_share_unchanged_periods(self):
+        other = TimePeriodSet(TimePeriod(datetime(1994, 1, 1), datetime(1994, 5, 1)))
+        result = self.period_set & other | TimePeriod(datetime(1994, 6, 1), datetime(1994, 6, 30))
+        self.assertIs(result[0], self.period_set[0])
+        self.assertIs(result[1], self.period_set[1])
+        self.assertEqual(len(self.period_set), 2)
+
+    def test_04_modifying_periods_list_leaves_sets_unaltered(self):
+        copy = self.period_set.copy()
+        copy.periods.append(TimePeriod(datetime(1994, 6, 1), datetime(1994, 6, 30)))
+        self.period_set.periods.clear()
+        self.assertEqual(len(copy), 2)
+        self.assertEqual(len(self.period_set), 2)
+
+
+class TestPeriodSetAggregation(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetAggregation, self).setUp()
+        self.sets = [
+            TimePeriodSet(
+                TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+                TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+                TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+            ),
+            TimePeriodSet(
+                TimePeriod(datetime(1994, 1, 29), datetime(1994, 2, 7)),
+                TimePeriod(datetime(1994, 2, 24), datetime(1994, 3, 5)),
+                TimePeriod(datetime(1994, 3, 27), datetime(1994, 3, 29)),
+                TimePeriod(datetime(1994, 10, 28), datetime(1994, 12, 8)),
+            ),
+            TimePeriodSet(
+                TimePeriod(INFINITY_BEGIN, datetime(1994, 2, 5)),
+                TimePeriod(datetime(1994, 2, 26), INFINITY_END),
+            ),
+        ]
+
+    def test_00_union_all(self):
+        self.assertEqual(TimePeriodSet.union_all(*self.sets), self.sets[0] | self.sets[1] | self.sets[2])
+        self.assertEqual(TimePeriodSet.union_all(*self.sets[:2]), self.sets[0] | self.sets[1])
+        self.assertEqual(TimePeriodSet.union_all(), TimePeriodSet())
+
+    def test_01_intersection_all(self):
+        self.assertEqual(TimePeriodSet.intersection_all(*self.sets), TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 5)),
+            TimePeriod(datetime(1994, 2, 26), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 27), datetime(1994, 3, 29)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        ))
+        self.assertEqual(TimePeriodSet.intersection_all(*self.sets[:2]), self.sets[0] & self.sets[1])
+        self.assertEqual(TimePeriodSet.intersection_all(self.sets[0]), self.sets[0])
+
+    def test_02_intersection_all_of_touching_periods_is_empty(self):
+        self.assertEqual(TimePeriodSet.intersection_all(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 5)),
+            TimePeriod(datetime(1994, 2, 5), datetime(1994, 2, 7)),
+        ), TimePeriodSet())
+        self.assertEqual(TimePeriodSet.intersection_all(self.sets[0], TimePeriodSet()), TimePeriodSet())
+        self.assertEqual(TimePeriodSet.intersection_all(), TimePeriodSet())
+
+
+class TestPickling(unittest.TestCase):
+    def setUp(self):
+        super(TestPickling, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(INFINITY_BEGIN, datetime(1994, 1, 1)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28, 12, 30, 0, 5)),
+            TimePeriod(datetime(1994, 11, 1), INFINITY_END),
+        )
+
+    def test_00_pickle_period(self):
+        period = self.period_set[1]
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(period, protocol))
+            self.assertEqual(unpickled, period)
+            self.assertEqual(unpickled.end, datetime(1994, 2, 28, 12, 30, 0, 5))
+
+    def test_01_pickle_period_set(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(self.period_set, protocol))
+            self.assertEqual(unpickled, self.period_set)
+            self.assertEqual(unpickled._begins, self.period_set._begins)
+            self.assertEqual(unpickled._ends, self.period_set._ends)
+        self.assertEqual(pickle.loads(pickle.dumps(TimePeriodSet())), TimePeriodSet())
+
+    def test_02_unpickled_set_can_be_modified(self):
+        unpickled = pickle.loads(pickle.dumps(self.period_set))
+        unpickled |= TimePeriod(datetime(1994, 1, 1), datetime(1994, 2, 1))
+        self.assertEqual(unpickled, TimePeriodSet(
+            TimePeriod(INFINITY_BEGIN, datetime(1994, 2, 28, 12, 30, 0, 5)),
+            TimePeriod(datetime(1994, 11, 1), INFINITY_END),
+        ))
+
+    def test_03_pickle_aware_period_set(self):
+        paris = timezone(timedelta(hours=1))
+        period_set = TimePeriodSet(TimePeriod(datetime(1994, 2, 1, tzinfo=paris), datetime(1994, 2, 28, tzinfo=paris)))
+        unpickled = pickle.loads(pickle.dumps(period_set))
+        self.assertEqual(unpickled, period_set)
+        self.assertEqual(unpickled[0].begin, datetime(1994, 2, 1, tzinfo=paris))
+        self.assertEqual(unpickled[0].begin.tzinfo, paris)
+
+
+class TestPeriodSetMetrics(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetMetrics, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+
+    def test_00_total_duration(self):
+        self.assertEqual(self.period_set.total_duration, timedelta(days=27 + 10 + 29))
+        self.assertEqual(TimePeriodSet().total_duration, timedelta(0))
+
+    def test_01_total_duration_is_maintained(self):
+        self.assertEqual(self.period_set.total_duration, timedelta(days=66))
+        self.period_set |= TimePeriod(datetime(1994, 2, 20), datetime(1994, 3, 23))
+        self.assertEqual(self.period_set.total_duration, timedelta(days=59 + 29))
+        self.period_set -= TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 2))
+        self.assertEqual(self.period_set.total_duration, timedelta(days=59 + 28))
+        self.period_set &= TimePeriod(datetime(1994, 1, 1), datetime(1994, 2, 2))
+        self.assertEqual(self.period_set.total_duration, timedelta(days=1))
+
+    def test_02_span(self):
+        self.assertEqual(self.period_set.span, TimePeriod(datetime(1994, 2, 1), datetime(1994, 11, 30)))
+        self.assertIsNone(TimePeriodSet().span)
+
+    def test_03_gaps(self):
+        self.assertEqual(self.period_set.gaps(), TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 22)),
+            TimePeriod(datetime(1994, 4, 1), datetime(1994, 11, 1)),
+        ))
+        self.assertEqual(self.period_set.gaps(), self.period_set.complement(self.period_set.span))
+        self.assertEqual(self.period_set.largest_gap, TimePeriod(datetime(1994, 4, 1), datetime(1994, 11, 1)))
+        self.assertEqual(TimePeriodSet(self.period_set[0]).gaps(), TimePeriodSet())
+        self.assertIsNone(TimePeriodSet(self.period_set[0]).largest_gap)
+
+    def test_04_gaps_are_updated_on_change(self):
+        gaps = self.period_set.gaps()
+        gaps |= TimePeriod(datetime(1994, 1, 1), datetime(1994, 1, 2))
+        self.assertEqual(len(self.period_set.gaps()), 2)
+        self.period_set |= TimePeriod(datetime(1994, 4, 15), datetime(1994, 10, 25))
+        self.assertEqual(self.period_set.largest_gap, TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 22)))
+        copy = self.period_set.copy()
+        copy |= TimePeriod(datetime(1994, 2, 27), datetime(1994, 3, 30))
+        self.assertEqual(copy.largest_gap, TimePeriod(datetime(1994, 4, 1), datetime(1994, 4, 15)))
+        self.assertEqual(self.period_set.largest_gap, TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 22)))
+
+
+class TestPeriodSetFreeSlots(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetFreeSlots, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+
+    def test_00_find_free_slot(self):
+        find = self.period_set.find_free_slot
+        self.assertEqual(find(datetime(1994, 1, 1), timedelta(days=10)),
+                         TimePeriod(datetime(1994, 1, 1), datetime(1994, 1, 11)))
+        self.assertEqual(find(datetime(1994, 1, 1), timedelta(days=31)),
+                         TimePeriod(datetime(1994, 1, 1), datetime(1994, 2, 1)))
+        self.assertEqual(find(datetime(1994, 1, 1), timedelta(days=32)),
+                         TimePeriod(datetime(1994, 4, 1), datetime(1994, 5, 3)))
+        self.assertEqual(find(datetime(1994, 2, 10), timedelta(days=20)),
+                         TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 20)))
+        self.assertEqual(find(datetime(1994, 2, 10), timedelta(days=30)),
+                         TimePeriod(datetime(1994, 4, 1), datetime(1994, 5, 1)))
+        self.assertEqual(find(datetime(1994, 3, 10), timedelta(days=20)),
+                         TimePeriod(datetime(1994, 4, 1), datetime(1994, 4, 21)))
+        self.assertEqual(find(datetime(1994, 1, 1), timedelta(days=365)),
+                         TimePeriod(datetime(1994, 11, 30), datetime(1995, 11, 30)))
+        self.assertEqual(find(datetime(1995, 1, 1), timedelta(days=1)),
+                         TimePeriod(datetime(1995, 1, 1), datetime(1995, 1, 2)))
+        self.assertEqual(TimePeriodSet().find_free_slot(datetime(1994, 1, 1), timedelta(days=1)),
+                         TimePeriod(datetime(1994, 1, 1), datetime(1994, 1, 2)))
+
+    def test_01_find_free_slot_before(self):
+        find = self.period_set.find_free_slot
+        self.assertEqual(find(datetime(1994, 2, 10), timedelta(days=30), before=datetime(1994, 5, 1)),
+                         TimePeriod(datetime(1994, 4, 1), datetime(1994, 5, 1)))
+        self.assertIsNone(find(datetime(1994, 2, 10), timedelta(days=30), before=datetime(1994, 4, 30)))
+        self.assertIsNone(find(datetime(1994, 1, 1), timedelta(days=365), before=datetime(1995, 1, 1)))
+        self.assertIsNone(find(datetime(1994, 1, 1), timedelta(days=1), before=INFINITY_BEGIN))
+        with self.assertRaises(ValueError):
+            find(datetime(1994, 1, 1), timedelta(0))
+
+    def test_02_find_free_slots(self):
+        slots = self.period_set.find_free_slots(datetime(1994, 2, 10), timedelta(days=10), before=datetime(1994, 4, 25))
+        self.assertEqual(slots, [
+            TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 10)),
+            TimePeriod(datetime(1994, 3, 10), datetime(1994, 3, 20)),
+            TimePeriod(datetime(1994, 4, 1), datetime(1994, 4, 11)),
+            TimePeriod(datetime(1994, 4, 11), datetime(1994, 4, 21)),
+        ])
+        slots = self.period_set.find_free_slots(datetime(1994, 10, 1), timedelta(days=20), limit=3)
+        self.assertEqual(slots, [
+            TimePeriod(datetime(1994, 10, 1), datetime(1994, 10, 21)),
+            TimePeriod(datetime(1994, 11, 30), datetime(1994, 12, 20)),
+            TimePeriod(datetime(1994, 12, 20), datetime(1995, 1, 9)),
+        ])
+        with self.assertRaises(ValueError):
+            self.period_set.find_free_slots(datetime(1994, 1, 1), timedelta(days=1))
+
+    def test_03_free_slots_follow_changes(self):
+        self.assertEqual(self.period_set.find_free_slot(datetime(1994, 2, 10), timedelta(days=20)),
+                         TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 20)))
+        copy = self.period_set.copy()
+        self.period_set |= TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 2))
+        self.assertEqual(self.period_set.find_free_slot(datetime(1994, 2, 10), timedelta(days=20)),
+                         TimePeriod(datetime(1994, 3, 2), datetime(1994, 3, 22)))
+        self.assertEqual(copy.find_free_slot(datetime(1994, 2, 10), timedelta(days=20)),
+                         TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 20)))
+        self.period_set -= TimePeriod(datetime(1994, 2, 1), datetime(1994, 4, 1))
+        self.assertEqual(self.period_set.find_free_slot(datetime(1994, 1, 1), timedelta(days=200)),
+                         TimePeriod(datetime(1994, 1, 1), datetime(1994, 7, 20)))
+
+    def test_04_free_slots_follow_changes_of_many_periods(self):
+        # Enough periods for the gaps to be indexed in several blocks
+        start = datetime(2000, 1, 1)
+        period_set = TimePeriodSet.from_periods(
+            (TimePeriod(start + timedelta(days=2 * idx), start + timedelta(days=2 * idx + 1)) for idx in range(3000)),
+            assume_sorted=True,
+        )
+        self.assertEqual(period_set.find_free_slot(start, timedelta(days=2)),
+                         TimePeriod(start + timedelta(days=5999), start + timedelta(days=6001)))
+        copy = period_set.copy()
+        period_set -= TimePeriod(start + timedelta(days=2000), start + timedelta(days=2004))
+        self.assertEqual(period_set.find_free_slot(start, timedelta(days=2)),
+                         TimePeriod(start + timedelta(days=1999), start + timedelta(days=2001)))
+        period_set.discard(TimePeriod(start + timedelta(days=10), start + timedelta(days=11)))
+        self.assertEqual(period_set.find_free_slot(start, timedelta(days=2)),
+                         TimePeriod(start + timedelta(days=9), start + timedelta(days=11)))
+        period_set.add(TimePeriod(start + timedelta(days=9), start + timedelta(days=12)))
+        period_set |= TimePeriod(start + timedelta(days=1999), start + timedelta(days=2005))
+        self.assertEqual(period_set.find_free_slot(start, timedelta(days=2)),
+                         TimePeriod(start + timedelta(days=5999), start + timedelta(days=6001)))
+        self.assertEqual(period_set.find_free_slot(start, timedelta(days=1)),
+                         TimePeriod(start + timedelta(days=1), start + timedelta(days=2)))
+        self.assertEqual(copy.find_free_slot(start + timedelta(days=1000), timedelta(days=2)),
+                         TimePeriod(start + timedelta(days=5999), start + timedelta(days=6001)))
+
+
+class TestPeriodSetWindow(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetWindow, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 4, 10), datetime(1994, 4, 20)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+
+    def test_00_window(self):
+        view = self.period_set.window(datetime(1994, 2, 15), datetime(1994, 4, 15))
+        self.assertEqual(len(view), 3)
+        self.assertEqual(list(view), [
+            TimePeriod(datetime(1994, 2, 15), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 4, 10), datetime(1994, 4, 15)),
+        ])
+        self.assertIs(view[1], self.period_set[1])
+        self.assertEqual(view[-1], TimePeriod(datetime(1994, 4, 10), datetime(1994, 4, 15)))
+        self.assertEqual(view[:2], list(view)[:2])
+        with self.assertRaises(IndexError):
+            view[3]
+        self.assertEqual(view, self.period_set & TimePeriod(datetime(1994, 2, 15), datetime(1994, 4, 15)))
+
+    def test_01_window_without_clip(self):
+        view = self.period_set.window(datetime(1994, 2, 15), datetime(1994, 4, 15), clip=False)
+        self.assertEqual(list(view), self.period_set[:3])
+        self.assertIn(datetime(1994, 2, 2), view)
+        self.assertNotIn(datetime(1994, 11, 2), view)
+
+    def test_02_window_edges(self):
+        self.assertEqual(len(self.period_set.window(datetime(1994, 2, 28), datetime(1994, 3, 22))), 0)
+        self.assertEqual(len(self.period_set.window(datetime(1995, 1, 1), datetime(1995, 2, 1))), 0)
+        self.assertEqual(list(self.period_set.window(datetime(1994, 2, 2), datetime(1994, 2, 3))),
+                         [TimePeriod(datetime(1994, 2, 2), datetime(1994, 2, 3))])
+        self.assertEqual(list(self.period_set.window(INFINITY_BEGIN, INFINITY_END)), self.period_set.periods)
+
+    def test_03_window_contains(self):
+        view = self.period_set.window(datetime(1994, 2, 15), datetime(1994, 4, 15))
+        self.assertIn(datetime(1994, 2, 20), view)
+        self.assertNotIn(datetime(1994, 2, 2), view)
+        self.assertNotIn(datetime(1994, 3, 1), view)
+        self.assertIn(TimePeriod(datetime(1994, 3, 23), datetime(1994, 3, 24)), view)
+        self.assertNotIn(TimePeriod(datetime(1994, 4, 11), datetime(1994, 4, 16)), view)
+
+    def test_04_window_operators(self):
+        view = self.period_set.window(datetime(1994, 2, 15), datetime(1994, 4, 15))
+        other = TimePeriodSet(TimePeriod(datetime(1994, 2, 27), datetime(1994, 3, 23)))
+        self.assertEqual(view | other, TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 15), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 4, 10), datetime(1994, 4, 15)),
+        ))
+        self.assertEqual(other | view, view | other)
+        self.assertEqual(view - other, TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 15), datetime(1994, 2, 27)),
+            TimePeriod(datetime(1994, 3, 23), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 4, 10), datetime(1994, 4, 15)),
+        ))
+        self.assertEqual(other - view, TimePeriodSet(TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 22))))
+        self.assertEqual(view ^ other, (view | other) - TimePeriodSet.intersection_all(view.to_period_set(), other))
+        period_set = TimePeriodSet()
+        period_set |= view
+        self.assertEqual(period_set, view)
+
+    def test_05_window_is_not_affected_by_changes(self):
+        view = self.period_set.window(datetime(1994, 2, 15), datetime(1994, 4, 15))
+        periods = list(view)
+        self.period_set |= TimePeriod(datetime(1994, 2, 1), datetime(1994, 4, 30))
+        self.period_set -= TimePeriod(datetime(1994, 11, 2), datetime(1994, 11, 3))
+        self.assertEqual(list(view), periods)
+        self.assertEqual(len(self.period_set), 3)
+
+
+class TestPeriodSetNavigation(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetNavigation, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+
+    def test_00_period_at(self):
+        self.assertIs(self.period_set.period_at(datetime(1994, 2, 10)), self.period_set[0])
+        self.assertIs(self.period_set.period_at(datetime(1994, 4, 1)), self.period_set[1])
+        self.assertIs(self.period_set.period_at(datetime(1994, 11, 1)), self.period_set[2])
+        self.assertIsNone(self.period_set.period_at(datetime(1994, 3, 1)))
+        self.assertIsNone(self.period_set.period_at(datetime(1995, 1, 1)))
+        self.assertIsNone(TimePeriodSet().period_at(datetime(1994, 1, 1)))
+
+    def test_01_next_and_previous_period(self):
+        self.assertIs(self.period_set.next_period(datetime(1994, 1, 1)), self.period_set[0])
+        self.assertIs(self.period_set.next_period(datetime(1994, 2, 28)), self.period_set[0])
+        self.assertIs(self.period_set.next_period(datetime(1994, 3, 1)), self.period_set[1])
+        self.assertIsNone(self.period_set.next_period(datetime(1994, 12, 1)))
+        self.assertIsNone(self.period_set.previous_period(datetime(1994, 2, 28)))
+        self.assertIs(self.period_set.previous_period(datetime(1994, 3, 1)), self.period_set[0])
+        self.assertIs(self.period_set.previous_period(datetime(1994, 3, 25)), self.period_set[0])
+        self.assertIs(self.period_set.previous_period(datetime(1994, 12, 1)), self.period_set[2])
+
+    def test_02_cursor(self):
+        cursor = self.period_set.cursor(datetime(1994, 3, 1))
+        self.assertIs(cursor.period, self.period_set[1])
+        self.assertIs(cursor.forward(), self.period_set[2])
+        self.assertIsNone(cursor.forward())
+        self.assertIsNone(cursor.forward())
+        self.assertIs(cursor.backward(), self.period_set[2])
+        self.assertIs(cursor.backward(), self.period_set[1])
+        self.assertIs(cursor.backward(), self.period_set[0])
+        self.assertIsNone(cursor.backward())
+        self.assertIs(cursor.forward(), self.period_set[0])
+        self.assertIsNone(cursor.seek(datetime(1995, 1, 1)))
+        self.assertIs(cursor.backward(), self.period_set[2])
+
+    def test_03_cursor_is_not_affected_by_changes(self):
+        periods = list(self.period_set)
+        cursor = self.period_set.cursor(datetime(1994, 1, 1))
+        self.period_set -= TimePeriod(datetime(1994, 1, 1), datetime(1994, 4, 5))
+        self.assertIs(cursor.period, periods[0])
+        self.assertIs(cursor.forward(), periods[1])
+        self.assertEqual(len(self.period_set), 1)
+
+
+class TestPeriodSetInPlaceChanges(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetInPlaceChanges, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+
+    def test_00_add_and_update(self):
+        self.period_set.add(TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 1)))
+        self.assertEqual(self.period_set[0], TimePeriod(datetime(1994, 2, 1), datetime(1994, 3, 1)))
+        self.period_set.update(
+            TimePeriod(datetime(1994, 12, 1), datetime(1994, 12, 2)),
+            TimePeriodSet(TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 22))),
+        )
+        self.assertEqual(self.period_set, TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+            TimePeriod(datetime(1994, 12, 1), datetime(1994, 12, 2)),
+        ))
+
+    def test_01_discard(self):
+        expected = self.period_set - TimePeriod(datetime(1994, 2, 10), datetime(1994, 3, 25))
+        self.period_set.discard(TimePeriod(datetime(1994, 2, 10), datetime(1994, 3, 25)))
+        self.assertEqual(self.period_set, expected)
+        self.period_set.discard(TimePeriod(datetime(1994, 11, 10), datetime(1994, 11, 11)))
+        self.assertEqual(self.period_set[-2:], [
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 10)),
+            TimePeriod(datetime(1994, 11, 11), datetime(1994, 11, 30)),
+        ])
+        self.period_set.discard(TimePeriod(datetime(1994, 11, 30), datetime(1994, 12, 30)))
+        self.assertEqual(len(self.period_set), 4)
+        self.period_set.discard(TimePeriod(datetime(1994, 1, 1), datetime(1994, 12, 1)))
+        self.assertEqual(len(self.period_set), 0)
+        self.assertEqual(self.period_set.total_duration, timedelta(0))
+
+
+class TestPeriodSetCoverageHistogram(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetCoverageHistogram, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1, 8), datetime(1994, 2, 1, 10, 30)),
+            TimePeriod(datetime(1994, 2, 1, 11, 45), datetime(1994, 2, 1, 12, 15)),
+            TimePeriod(datetime(1994, 2, 3, 22), datetime(1994, 2, 4, 2)),
+        )
+
+    def test_00_fixed_bins(self):
+        histogram = self.period_set.coverage_histogram(datetime(1994, 2, 1, 9), datetime(1994, 2, 1, 12, 30),
+                                                       timedelta(hours=1))
+        self.assertEqual(histogram, [timedelta(hours=1), timedelta(minutes=30), timedelta(minutes=15),
+                                     timedelta(minutes=15)])
+        ratios = self.period_set.coverage_histogram(datetime(1994, 2, 1, 9), datetime(1994, 2, 1, 12, 30),
+                                                    timedelta(hours=1), ratio=True)
+        self.assertEqual(ratios, [1.0, 0.5, 0.25, 0.5])
+
+    def test_01_calendar_bins(self):
+        histogram = self.period_set.coverage_histogram(datetime(1994, 1, 31, 12), datetime(1994, 2, 5), DAILY)
+        self.assertEqual(histogram, [timedelta(0), timedelta(hours=3), timedelta(0), timedelta(hours=2),
+                                     timedelta(hours=2)])
+        ratios = self.period_set.coverage_histogram(datetime(1994, 1, 31, 12), datetime(1994, 2, 5), DAILY, True)
+        self.assertEqual(ratios[1], 0.125)
+        histogram = self.period_set.coverage_histogram(datetime(1994, 1, 1), datetime(1994, 3, 1), MONTHLY)
+        self.assertEqual(histogram, [timedelta(0), timedelta(hours=7)])
+
+    def test_02_histogram_matches_intersections(self):
+        begin = datetime(1994, 1, 31)
+        histogram = self.period_set.coverage_histogram(begin, datetime(1994, 2, 6), timedelta(hours=5))
+        for idx, covered in enumerate(histogram):
+            bin_period = TimePeriod(begin + idx * timedelta(hours=5), begin + (idx + 1) * timedelta(hours=5))
+            self.assertEqual(covered, TimePeriodSet.intersection_all(self.period_set, bin_period).total_duration)
+
+
+class TestSplit(unittest.TestCase):
+    def test_00_split_period(self):
+        period = TimePeriod(datetime(1994, 2, 1, 20), datetime(1994, 2, 3, 6))
+        self.assertEqual(list(period.split(DAILY)), [
+            TimePeriod(datetime(1994, 2, 1, 20), datetime(1994, 2, 2)),
+            TimePeriod(datetime(1994, 2, 2), datetime(1994, 2, 3)),
+            TimePeriod(datetime(1994, 2, 3), datetime(1994, 2, 3, 6)),
+        ])
+        self.assertEqual(list(period.split(timedelta(hours=12))), [
+            TimePeriod(datetime(1994, 2, 1, 20), datetime(1994, 2, 2)),
+            TimePeriod(datetime(1994, 2, 2), datetime(1994, 2, 2, 12)),
+            TimePeriod(datetime(1994, 2, 2, 12), datetime(1994, 2, 3)),
+            TimePeriod(datetime(1994, 2, 3), datetime(1994, 2, 3, 6)),
+        ])
+        self.assertEqual(list(period.split(MONTHLY)), [period])
+        self.assertEqual(list(TimePeriod(datetime(1994, 1, 15), datetime(1994, 3, 1)).split(MONTHLY)), [
+            TimePeriod(datetime(1994, 1, 15), datetime(1994, 2, 1)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 3, 1)),
+        ])
+        with self.assertRaises(ValueError):
+            period.split(timedelta(0))
+        with self.assertRaises(ValueError):
+            period.split('yearly')
+
+    def test_01_split_infinite_period(self):
+        period = TimePeriod(datetime(1994, 2, 1, 20), INFINITY_END)
+        with self.assertRaises(ValueError):
+            period.split(DAILY)
+        chunks = period.split(DAILY, within=TimePeriod(INFINITY_BEGIN, datetime(1994, 2, 3)))
+        self.assertEqual(list(chunks), [
+            TimePeriod(datetime(1994, 2, 1, 20), datetime(1994, 2, 2)),
+            TimePeriod(datetime(1994, 2, 2), datetime(1994, 2, 3)),
+        ])
+        self.assertEqual(list(period.split(DAILY, within=TimePeriod(datetime(1994, 1, 1), datetime(1994, 2, 1)))), [])
+        # Chunks are generated lazily, even when there are millions of them
+        chunks = TimePeriod(INFINITY_BEGIN, INFINITY_END).split(
+            timedelta(seconds=1), within=TimePeriod(datetime(1994, 2, 1), datetime(2094, 2, 1)))
+        self.assertEqual(next(chunks), TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 1, 0, 0, 1)))
+
+    def test_02_split_period_set(self):
+        period_set = TimePeriodSet(
+            TimePeriod(INFINITY_BEGIN, datetime(1994, 1, 2, 12)),
+            TimePeriod(datetime(1994, 2, 1, 20), datetime(1994, 2, 2, 6)),
+            TimePeriod(datetime(1994, 3, 1), INFINITY_END),
+        )
+        with self.assertRaises(ValueError):
+            list(period_set.split(DAILY))
+        chunks = period_set.split(DAILY, within=TimePeriod(datetime(1994, 1, 1), datetime(1994, 3, 2, 12)))
+        self.assertEqual(list(chunks), [
+            TimePeriod(datetime(1994, 1, 1), datetime(1994, 1, 2)),
+            TimePeriod(datetime(1994, 1, 2), datetime(1994, 1, 2, 12)),
+            TimePeriod(datetime(1994, 2, 1, 20), datetime(1994, 2, 2)),
+            TimePeriod(datetime(1994, 2, 2), datetime(1994, 2, 2, 6)),
+            TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 2)),
+            TimePeriod(datetime(1994, 3, 2), datetime(1994, 3, 2, 12)),
+        ])
+
+
+class TestPeriodSetPredicates(unittest.TestCase):
+    def setUp(self):
+        super(TestPeriodSetPredicates, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+
+    def test_00_overlaps(self):
+        self.assertTrue(self.period_set.overlaps(TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 23))))
+        self.assertFalse(self.period_set.overlaps(TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 22))))
+        self.assertFalse(self.period_set.overlaps(TimePeriod(datetime(1994, 12, 1), INFINITY_END)))
+        self.assertTrue(self.period_set.overlaps(TimePeriod(INFINITY_BEGIN, INFINITY_END)))
+        other = TimePeriodSet(
+            TimePeriod(datetime(1994, 1, 1), datetime(1994, 2, 1)),
+            TimePeriod(datetime(1994, 4, 1), datetime(1994, 11, 1)),
+        )
+        self.assertFalse(self.period_set.overlaps(other))
+        self.assertTrue(self.period_set.isdisjoint(other))
+        other |= TimePeriod(datetime(1994, 11, 29), datetime(1994, 12, 1))
+        self.assertTrue(self.period_set.overlaps(other))
+        self.assertTrue(other.overlaps(self.period_set))
+        self.assertFalse(self.period_set.overlaps(TimePeriodSet()))
+        self.assertFalse(TimePeriodSet().overlaps(self.period_set))
+
+    def test_01_predicates_match_operators(self):
+        others = [
+            TimePeriod(datetime(1994, 2, 28), datetime(1994, 3, 22)),
+            TimePeriod(datetime(1994, 2, 27), datetime(1994, 3, 22)),
+            TimePeriodSet(TimePeriod(datetime(1994, 1, 1), datetime(1994, 2, 1)),
+                          TimePeriod(datetime(1994, 11, 30), datetime(1994, 12, 1))),
+            TimePeriodSet(TimePeriod(datetime(1994, 1, 1), datetime(1994, 2, 2))),
+        ]
+        for other in others:
+            self.assertEqual(self.period_set.overlaps(other), bool(self.period_set & other))
+            self.assertEqual(self.period_set.isdisjoint(other), not self.period_set & other)
+
+    def test_02_covers(self):
+        self.assertTrue(self.period_set.covers(TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28))))
+        self.assertTrue(self.period_set.covers(TimePeriod(datetime(1994, 3, 25), datetime(1994, 3, 26))))
+        self.assertFalse(self.period_set.covers(TimePeriod(datetime(1994, 2, 1), datetime(1994, 3, 23))))
+        self.assertFalse(self.period_set.covers(TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 2))))
+        self.assertFalse(self.period_set.covers(TimePeriod(datetime(1994, 11, 29), datetime(1994, 12, 1))))
+        self.assertFalse(TimePeriodSet().covers(TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 2))))
+
+    def test_03_subset_and_superset(self):
+        subset = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 3), datetime(1994, 2, 5)),
+            TimePeriod(datetime(1994, 2, 7), datetime(1994, 2, 28)),
+            TimePeriod(datetime(1994, 11, 1), datetime(1994, 11, 30)),
+        )
+        self.assertTrue(subset.issubset(self.period_set))
+        self.assertTrue(self.period_set.issuperset(subset))
+        self.assertFalse(self.period_set.issubset(subset))
+        self.assertFalse(subset.issuperset(self.period_set))
+        self.assertTrue(self.period_set.issubset(self.period_set))
+        self.assertTrue(self.period_set.issubset(TimePeriod(datetime(1994, 1, 1), datetime(1994, 12, 1))))
+        self.assertFalse(self.period_set.issubset(TimePeriod(datetime(1994, 2, 2), datetime(1994, 12, 1))))
+        self.assertTrue(self.period_set.issuperset(TimePeriod(datetime(1994, 3, 25), datetime(1994, 3, 26))))
+        self.assertTrue(TimePeriodSet().issubset(self.period_set))
+        self.assertTrue(self.period_set.issuperset(TimePeriodSet()))
+        subset |= TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 2))
+        self.assertFalse(subset.issubset(self.period_set))
+
+
 if __name__ == '__main__':
     unittest.main()
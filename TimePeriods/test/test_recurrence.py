@@ -0,0 +1,125 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from .. import TimePeriod, TimePeriodSet, RecurringPeriod, DAILY, WEEKLY, MONTHLY, INFINITY_END
+
+
+class TestRecurringPeriod(unittest.TestCase):
+    def setUp(self):
+        super(TestRecurringPeriod, self).setUp()
+        # 1994-02-07 is a Monday
+        self.opening_hours = RecurringPeriod(
+            TimePeriod(datetime(1994, 2, 7, 8), datetime(1994, 2, 7, 18)),
+            frequency=DAILY,
+            weekdays=range(5),
+            exceptions=TimePeriod(datetime(1994, 2, 9), datetime(1994, 2, 10)),
+        )
+
+    def test_00_iter_periods_within_window(self):
+        self.assertEqual(list(self.opening_hours.iter_periods(
+            TimePeriod(datetime(1994, 2, 7, 12), datetime(1994, 2, 14, 10))
+        )), [
+            TimePeriod(datetime(1994, 2, 7, 12), datetime(1994, 2, 7, 18)),
+            TimePeriod(datetime(1994, 2, 8, 8), datetime(1994, 2, 8, 18)),
+            TimePeriod(datetime(1994, 2, 10, 8), datetime(1994, 2, 10, 18)),
+            TimePeriod(datetime(1994, 2, 11, 8), datetime(1994, 2, 11, 18)),
+            TimePeriod(datetime(1994, 2, 14, 8), datetime(1994, 2, 14, 10)),
+        ])
+
+    def test_01_far_window_is_reached_directly(self):
+        # 2994-02-06 is a Thursday
+        periods = list(self.opening_hours.iter_periods(TimePeriod(datetime(2994, 2, 6), datetime(2994, 2, 10))))
+        self.assertEqual(periods, [
+            TimePeriod(datetime(2994, 2, 6, 8), datetime(2994, 2, 6, 18)),
+            TimePeriod(datetime(2994, 2, 7, 8), datetime(2994, 2, 7, 18)),
+        ])
+
+    def test_02_endless_generation(self):
+        periods = self.opening_hours.iter_periods(TimePeriod(datetime(1994, 2, 12), INFINITY_END))
+        self.assertEqual(next(periods), TimePeriod(datetime(1994, 2, 14, 8), datetime(1994, 2, 14, 18)))
+        self.assertEqual(list(RecurringPeriod(
+            TimePeriod(datetime(9999, 12, 20), datetime(9999, 12, 20, 12)),
+        ).iter_periods())[-1], TimePeriod(datetime(9999, 12, 31), datetime(9999, 12, 31, 12)))
+        self.assertEqual(list(RecurringPeriod(
+            TimePeriod(datetime(9999, 12, 20), datetime(9999, 12, 21)),
+        ).iter_periods()), [TimePeriod(datetime(9999, 12, 20), INFINITY_END)])
+
+    def test_03_intersection_with_set(self):
+        period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 5), datetime(1994, 2, 8, 9)),
+            TimePeriod(datetime(2010, 1, 1, 17), datetime(2010, 1, 2, 9)),
+        )
+        expected = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 7, 8), datetime(1994, 2, 7, 18)),
+            TimePeriod(datetime(1994, 2, 8, 8), datetime(1994, 2, 8, 9)),
+            TimePeriod(datetime(2010, 1, 1, 17), datetime(2010, 1, 1, 18)),
+        )
+        self.assertEqual(self.opening_hours & period_set, expected)
+        self.assertEqual(period_set & self.opening_hours, expected)
+
+    def test_04_union_and_difference_with_set(self):
+        period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 7, 17), datetime(1994, 2, 7, 20)),
+            TimePeriod(datetime(1994, 2, 10, 7), datetime(1994, 2, 10, 9)),
+        )
+        # Occurrences are only generated within the span of period_set
+        self.assertEqual(period_set | self.opening_hours, TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 7, 17), datetime(1994, 2, 7, 20)),
+            TimePeriod(datetime(1994, 2, 8, 8), datetime(1994, 2, 8, 18)),
+            TimePeriod(datetime(1994, 2, 10, 7), datetime(1994, 2, 10, 9)),
+        ))
+        self.assertEqual(period_set - self.opening_hours, TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 7, 18), datetime(1994, 2, 7, 20)),
+            TimePeriod(datetime(1994, 2, 10, 7), datetime(1994, 2, 10, 8)),
+        ))
+
+    def test_05_weekly_and_monthly(self):
+        weekly = RecurringPeriod(TimePeriod(datetime(1994, 2, 7), datetime(1994, 2, 8)), WEEKLY, interval=2,
+                                 until=datetime(1994, 3, 7))
+        self.assertEqual([period.begin for period in weekly.iter_periods()], [
+            datetime(1994, 2, 7), datetime(1994, 2, 21), datetime(1994, 3, 7),
+        ])
+        monthly = RecurringPeriod(TimePeriod(datetime(1994, 1, 31), datetime(1994, 2, 1)), MONTHLY)
+        self.assertEqual([period.begin for period in monthly.iter_periods(
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 5, 1))
+        )], [datetime(1994, 2, 28), datetime(1994, 3, 31), datetime(1994, 4, 30)])
+
+    def test_06_overlapping_occurrences_are_merged(self):
+        recurring = RecurringPeriod(TimePeriod(datetime(1994, 2, 7), datetime(1994, 2, 9)), DAILY)
+        self.assertEqual(list(recurring.iter_periods(TimePeriod(datetime(1994, 2, 7), datetime(1994, 2, 20)))), [
+            TimePeriod(datetime(1994, 2, 7), datetime(1994, 2, 20)),
+        ])
+
+    def test_07_aware_occurrences(self):
+        paris = timezone(timedelta(hours=1))
+        opening_hours = RecurringPeriod(
+            TimePeriod(datetime(1994, 2, 7, 8, tzinfo=paris), datetime(1994, 2, 7, 18, tzinfo=paris)),
+            frequency=DAILY,
+            weekdays=range(5),
+            until=datetime(1994, 2, 10, tzinfo=paris),
+        )
+        periods = list(opening_hours.iter_periods(
+            TimePeriod(datetime(1994, 2, 7, 12, tzinfo=timezone.utc), datetime(1994, 2, 14, tzinfo=timezone.utc))
+        ))
+        self.assertEqual([(period.begin, period.end) for period in periods], [
+            (datetime(1994, 2, 7, 13, tzinfo=paris), datetime(1994, 2, 7, 18, tzinfo=paris)),
+            (datetime(1994, 2, 8, 8, tzinfo=paris), datetime(1994, 2, 8, 18, tzinfo=paris)),
+            (datetime(1994, 2, 9, 8, tzinfo=paris), datetime(1994, 2, 9, 18, tzinfo=paris)),
+        ])
+        self.assertEqual([period.begin.tzinfo for period in periods], [paris] * 3)
+        self.assertEqual(len(list(opening_hours.iter_periods())), 3)
+        monthly = RecurringPeriod(
+            TimePeriod(datetime(1994, 1, 31, tzinfo=paris), datetime(1994, 2, 1, tzinfo=paris)), MONTHLY,
+        )
+        self.assertEqual([period.begin for period in monthly.iter_periods(
+            TimePeriod(datetime(1994, 3, 1, tzinfo=paris), datetime(1994, 5, 1, tzinfo=paris))
+        )], [datetime(1994, 3, 31, tzinfo=paris), datetime(1994, 4, 30, tzinfo=paris)])
+        period_set = TimePeriodSet(
+            TimePeriod(datetime(1994, 2, 8, 17, tzinfo=paris), datetime(1994, 2, 8, 20, tzinfo=paris)),
+        )
+        self.assertEqual(period_set | opening_hours, period_set)
+        self.assertEqual((period_set - opening_hours)[0].begin, datetime(1994, 2, 8, 18, tzinfo=paris))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from .. import TimePeriod, TimePeriodSet, MappedTimePeriodSet, INFINITY_BEGIN, INFINITY_END
+from ..Serialization import dump, dumps, load, loads, HEADER
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        super(TestSerialization, self).setUp()
+        self.period_set = TimePeriodSet(
+            TimePeriod(INFINITY_BEGIN, datetime(1994, 1, 1)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 28, 12, 30, 0, 5)),
+            TimePeriod(datetime(1994, 3, 22), datetime(1994, 4, 1)),
+            TimePeriod(datetime(1994, 11, 1), INFINITY_END),
+        )
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'periods.tps')
+        with open(self.path, 'wb') as fp:
+            dump(self.period_set, fp)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super(TestSerialization, self).tearDown()
+
+    def test_00_round_trip(self):
+        data = dumps(self.period_set)
+        self.assertEqual(len(data), HEADER.size + 16 * len(self.period_set))
+        self.assertEqual(loads(data), self.period_set)
+        self.assertEqual(loads(dumps(TimePeriodSet())), TimePeriodSet())
+        with open(self.path, 'rb') as fp:
+            self.assertEqual(load(fp), self.period_set)
+
+    def test_01_infinite_bounds_are_sentinels(self):
+        data = dumps(self.period_set)
+        self.assertEqual(data[HEADER.size:HEADER.size + 8], b'\x00' * 7 + b'\x80')
+        self.assertEqual(loads(data)[0].begin, INFINITY_BEGIN)
+        self.assertEqual(loads(data)[-1].end, INFINITY_END)
+
+    def test_02_invalid_data(self):
+        self.assertRaises(ValueError, loads, b'nope')
+        self.assertRaises(ValueError, loads, b'XXXX' + dumps(self.period_set)[4:])
+        self.assertRaises(ValueError, loads, dumps(self.period_set)[:-1])
+        self.assertRaises(ValueError, load, io.BytesIO(b''))
+
+    def test_03_mapped_membership(self):
+        with MappedTimePeriodSet(self.path) as mapped:
+            self.assertEqual(len(mapped), 4)
+            for date in (datetime(1, 1, 1), datetime(1994, 1, 15), datetime(1994, 2, 1), datetime(1994, 3, 1),
+                         datetime(1994, 3, 25), datetime(9999, 12, 31)):
+                self.assertEqual(date in mapped, date in self.period_set)
+            self.assertIn(TimePeriod(datetime(1994, 4, 1), datetime(1994, 5, 1)), mapped)
+            self.assertNotIn(TimePeriod(datetime(1994, 4, 2), datetime(1994, 5, 1)), mapped)
+
+    def test_04_mapped_overlapping(self):
+        with MappedTimePeriodSet(self.path) as mapped:
+            period = TimePeriod(datetime(1993, 6, 1), datetime(1994, 3, 22))
+            self.assertEqual(mapped.count_overlapping(period), 3)
+            self.assertEqual(mapped.overlapping(period), TimePeriodSet(self.period_set[:3]))
+            self.assertEqual(mapped.count_overlapping(TimePeriod(datetime(1994, 5, 1), datetime(1994, 6, 1))), 0)
+            self.assertEqual(mapped.to_period_set(), self.period_set)
+            self.assertEqual(mapped[-1], self.period_set[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from .. import TimePeriod, TimePeriodSet, iter_union, iter_intersection, iter_difference
+from ..Period import UnsortedPeriodsException
+
+
+def _random_periods(rng, count):
+    base = datetime(1994, 1, 1)
+    periods = []
+    for _ in range(count):
+        begin = base + timedelta(hours=rng.randint(0, 1000))
+        periods.append(TimePeriod(begin, begin + timedelta(hours=rng.randint(1, 30))))
+    return sorted(periods)
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        super(TestStreaming, self).setUp()
+        rng = random.Random(42)
+        self.streams = [_random_periods(rng, 60) for _ in range(3)]
+        self.sets = [TimePeriodSet(periods) for periods in self.streams]
+
+    def test_00_union(self):
+        self.assertEqual(list(iter_union(*[iter(periods) for periods in self.streams])),
+                         TimePeriodSet.union_all(*self.sets).periods)
+        self.assertEqual(list(iter_union()), [])
+
+    def test_01_intersection(self):
+        self.assertEqual(list(iter_intersection(iter(self.streams[0]), iter(self.streams[1]))),
+                         TimePeriodSet.intersection_all(self.sets[0], self.sets[1]).periods)
+        self.assertEqual(list(iter_intersection(self.streams[0], [])), [])
+
+    def test_02_difference(self):
+        self.assertEqual(list(iter_difference(iter(self.streams[0]), iter(self.streams[1]))),
+                         (self.sets[0] - self.sets[1]).periods)
+        self.assertEqual(list(iter_difference(self.streams[0], [])), self.sets[0].periods)
+
+    def test_03_tuples_are_accepted(self):
+        self.assertEqual(list(iter_union(
+            [(datetime(1994, 2, 1), datetime(1994, 2, 28)), (datetime(1994, 2, 3), datetime(1994, 3, 2))],
+            [TimePeriod(datetime(1994, 3, 2), datetime(1994, 3, 5))],
+        )), [TimePeriod(datetime(1994, 2, 1), datetime(1994, 3, 5))])
+
+    def test_04_unsorted_streams_are_rejected(self):
+        unsorted = [
+            TimePeriod(datetime(1994, 3, 1), datetime(1994, 3, 2)),
+            TimePeriod(datetime(1994, 2, 1), datetime(1994, 2, 2)),
+        ]
+        self.assertRaises(UnsortedPeriodsException, list, iter_union(unsorted))
+        self.assertRaises(UnsortedPeriodsException, list, iter_intersection(self.streams[0], unsorted))
+        self.assertRaises(UnsortedPeriodsException, list, iter_difference(unsorted, self.streams[0]))
+
+    def test_05_streams_are_consumed_lazily(self):
+        def endless():
+            begin = datetime(1994, 1, 1)
+            while True:
+                yield TimePeriod(begin, begin + timedelta(hours=1))
+                begin += timedelta(days=1)
+
+        union = iter_union(endless(), endless())
+        self.assertEqual(next(union), TimePeriod(datetime(1994, 1, 1), datetime(1994, 1, 1, 1)))
+        difference = iter_difference(endless(), [(datetime(1994, 1, 1), datetime(1994, 1, 2, 0, 30))])
+        self.assertEqual(next(difference), TimePeriod(datetime(1994, 1, 2, 0, 30), datetime(1994, 1, 2, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()